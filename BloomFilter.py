@@ -0,0 +1,857 @@
+from typing import Callable, Final, Generic, Hashable, Iterable, List, Optional, Tuple, TypeVar, override
+from array import array
+from math import ceil, log
+from random import randrange
+from struct import Struct
+
+from utils import Iterator, Viewable, KeysView, ValuesView, ItemsView, stable_hash, local_hash
+
+
+
+T = TypeVar(name="T", bound=Hashable) # 声明一个类型参数，不宜对其进行 type hints
+K = TypeVar(name="K", bound=Hashable)
+V = TypeVar(
+            name="V",
+            # covariant=True
+        )
+
+def optimal_parameters(capacity: int, error_rate: float) -> Tuple[int, int]:
+    """根据预计的元素数量和可以接受的误判率计算布隆过滤器的参数
+
+    Args:
+        capacity (int): 预计的元素数量
+        error_rate (float): 可以接受的误判率，在 (0, 1) 之间
+
+    Raises:
+        ValueError: 参数超出范围
+
+    Returns:
+        Tuple[int, int]: 位数 m = -n * ln(p) / (ln2)^2 和哈希函数的个数 k = m / n * ln2
+    """
+    if capacity <= 0:
+        raise ValueError("预计的元素数量必须是正数")
+    if not 0 < error_rate < 1:
+        raise ValueError("误判率必须在 (0, 1) 之间")
+    num_bits: int = ceil(-capacity * log(error_rate) / (log(2) ** 2))
+    num_hashes: int = max(1, round(num_bits / capacity * log(2)))
+    return num_bits, num_hashes
+
+class BloomFilter(Generic[T]):
+    """
+    布隆过滤器，用于在访问代价较高的映射之前快速排除不存在的键；
+    m 位的位图存放在 bytearray 中，每个元素对应 k 个位，判断存在时只会误判（假阳性）而不会漏判；
+    k 个位置由两个独立的哈希值组合得到：g_i(x) = h1(x) + i * h2(x) mod m（Kirsch–Mitzenmacher 双重哈希），每个元素只需计算一次哈希；
+    默认使用与进程无关的哈希（只支持 bytes、str、数字、None 和元组），序列化后可以在其他进程中还原；
+    stable 为 False 时改用内置的 hash，支持任意可哈希对象，但只能在当前进程中使用，不能序列化；
+    参数和哈希方式都相同的过滤器之间可以求并集和交集
+    """
+    _HEADER: Final[Struct] = Struct(">4sQI") # 序列化的头部：魔数、位数、哈希函数个数（不可变）
+    _MAGIC: Final[bytes] = b"BLM1" # 魔数（不可变）
+
+    def __init__(self, num_bits: int, num_hashes: int, stable: bool = True) -> None:
+        """构造方法
+
+        Args:
+            num_bits (int): 位数 m
+            num_hashes (int): 哈希函数的个数 k
+            stable (bool, optional): 是否使用与进程无关的哈希. Defaults to True.
+
+        Raises:
+            ValueError: 参数不是正数
+        """
+        if (num_bits <= 0) or (num_hashes <= 0):
+            raise ValueError("位数和哈希函数的个数必须是正数")
+        self._num_bits: int = num_bits
+        self._num_hashes: int = num_hashes
+        self._stable: bool = stable
+        self._bits: bytearray = bytearray((num_bits + 7) >> 3) # 位图，第 i 位存放在第 i >> 3 个字节的第 i & 7 位
+
+    @classmethod # 类方法
+    def with_capacity(cls, capacity: int, error_rate: float = 0.01, stable: bool = True) -> "BloomFilter[T]":
+        """根据预计的元素数量和可以接受的误判率创建过滤器
+
+        Args:
+            capacity (int): 预计的元素数量
+            error_rate (float, optional): 可以接受的误判率. Defaults to 0.01.
+            stable (bool, optional): 是否使用与进程无关的哈希. Defaults to True.
+
+        Returns:
+            BloomFilter[T]: 过滤器
+        """
+        num_bits: int
+        num_hashes: int
+        num_bits, num_hashes = optimal_parameters(capacity=capacity, error_rate=error_rate)
+        return cls(num_bits=num_bits, num_hashes=num_hashes, stable=stable)
+
+    def _positions(self, item: T) -> List[int]:
+        """计算元素对应的 k 个位置
+
+        Args:
+            item (T): 元素
+
+        Returns:
+            List[int]: k 个位置
+        """
+        h1: int
+        h2: int
+        h1, h2 = stable_hash(obj=item) if self._stable else local_hash(obj=item)
+        h2 |= 1 # 步长为奇数，避免 h2 为 0 时 k 个位置全部相同
+        return [(h1 + i * h2) % self._num_bits for i in range(self._num_hashes)]
+
+    def add(self, item: T) -> None:
+        """加入元素
+
+        Args:
+            item (T): 元素
+        """
+        pos: int
+        for pos in self._positions(item=item):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def add_many(self, items: Iterable[T]) -> None:
+        """批量加入元素
+
+        Args:
+            items (Iterable[T]): 元素序列
+        """
+        bits: bytearray = self._bits # 减少属性查找
+        m: int = self._num_bits
+        k: int = self._num_hashes
+        hash_func: Callable[..., Tuple[int, int]] = stable_hash if self._stable else local_hash
+        item: T
+        for item in items:
+            h1: int
+            h2: int
+            h1, h2 = hash_func(obj=item)
+            h2 |= 1
+            for i in range(k):
+                pos: int = (h1 + i * h2) % m
+                bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item: T) -> bool:
+        """元素是否可能存在（返回 False 时一定不存在）
+
+        Args:
+            item (T): 元素
+
+        Returns:
+            bool: 元素是否可能存在
+        """
+        pos: int
+        for pos in self._positions(item=item):
+            if not self._bits[pos >> 3] & (1 << (pos & 7)):
+                return False
+        return True
+
+    def bit_count(self) -> int:
+        """查看被置为 1 的位数
+
+        Returns:
+            int: 被置为 1 的位数
+        """
+        return int.from_bytes(self._bits, byteorder="little").bit_count()
+
+    def false_positive_rate(self) -> float:
+        """根据当前被置为 1 的位的比例估计误判率
+
+        Returns:
+            float: 估计的误判率
+        """
+        return (self.bit_count() / self._num_bits) ** self._num_hashes
+
+    def approx_len(self) -> float:
+        """根据当前被置为 1 的位数估计加入过的不同元素的数量
+
+        Returns:
+            float: 估计的元素数量，位图全满时为无穷大
+        """
+        ones: int = self.bit_count()
+        if ones == self._num_bits:
+            return float("inf")
+        return -self._num_bits / self._num_hashes * log(1 - ones / self._num_bits)
+
+    def _check_compatible(self, other: "BloomFilter[T]") -> None:
+        """检查两个过滤器能否合并
+
+        Args:
+            other (BloomFilter[T]): 另一个过滤器
+
+        Raises:
+            ValueError: 类型、参数或哈希方式不同
+        """
+        if (type(self) is not type(other)) or (self._num_bits != other._num_bits) or (self._num_hashes != other._num_hashes) or (self._stable != other._stable):
+            raise ValueError("只有类型、位数、哈希函数个数和哈希方式都相同的过滤器才能合并")
+
+    def union(self, other: "BloomFilter[T]") -> "BloomFilter[T]":
+        """并集：结果与把两者的元素加入同一个过滤器完全相同
+
+        Args:
+            other (BloomFilter[T]): 另一个过滤器
+
+        Returns:
+            BloomFilter[T]: 新的过滤器
+        """
+        self._check_compatible(other=other)
+        result: BloomFilter[T] = type(self)(num_bits=self._num_bits, num_hashes=self._num_hashes, stable=self._stable)
+        result._bits = bytearray((int.from_bytes(self._bits, byteorder="little") | int.from_bytes(other._bits, byteorder="little")).to_bytes(length=len(self._bits), byteorder="little")) # 整个位图作为一个大整数按位运算
+        return result
+
+    def intersection(self, other: "BloomFilter[T]") -> "BloomFilter[T]":
+        """交集：不会漏掉两者共有的元素，但误判率高于直接由共有元素构建的过滤器
+
+        Args:
+            other (BloomFilter[T]): 另一个过滤器
+
+        Returns:
+            BloomFilter[T]: 新的过滤器
+        """
+        self._check_compatible(other=other)
+        result: BloomFilter[T] = type(self)(num_bits=self._num_bits, num_hashes=self._num_hashes, stable=self._stable)
+        result._bits = bytearray((int.from_bytes(self._bits, byteorder="little") & int.from_bytes(other._bits, byteorder="little")).to_bytes(length=len(self._bits), byteorder="little"))
+        return result
+
+    def _check_stable(self) -> None:
+        """检查过滤器能否序列化
+
+        Raises:
+            ValueError: 过滤器使用的是进程内的哈希，在其他进程中无法还原
+        """
+        if not self._stable:
+            raise ValueError("使用进程内哈希（stable=False）的过滤器不能序列化")
+
+    def to_bytes(self) -> bytes:
+        """序列化
+
+        Raises:
+            ValueError: 过滤器使用的是进程内的哈希
+
+        Returns:
+            bytes: 头部和位图
+        """
+        self._check_stable()
+        return BloomFilter._HEADER.pack(BloomFilter._MAGIC, self._num_bits, self._num_hashes) + bytes(self._bits)
+
+    @classmethod # 类方法
+    def from_bytes(cls, data: bytes) -> "BloomFilter[T]":
+        """反序列化
+
+        Args:
+            data (bytes): to_bytes 的结果
+
+        Raises:
+            ValueError: 数据格式不正确
+
+        Returns:
+            BloomFilter[T]: 过滤器
+        """
+        magic: bytes
+        num_bits: int
+        num_hashes: int
+        if len(data) < BloomFilter._HEADER.size:
+            raise ValueError("不是布隆过滤器的序列化数据")
+        magic, num_bits, num_hashes = BloomFilter._HEADER.unpack_from(data)
+        if (magic != BloomFilter._MAGIC) or (len(data) != BloomFilter._HEADER.size + ((num_bits + 7) >> 3)):
+            raise ValueError("不是布隆过滤器的序列化数据")
+        result: BloomFilter[T] = cls(num_bits=num_bits, num_hashes=num_hashes)
+        result._bits = bytearray(data[BloomFilter._HEADER.size:])
+        return result
+
+class CountingBloomFilter(BloomFilter[T]):
+    """
+    计数布隆过滤器，支持删除；
+    每个位置是一个 8 位计数器而不是一个位，加入时计数器加 1，删除时减 1；
+    计数器达到 255 后不再变化（既不增加也不减少），以免溢出后产生漏判
+    """
+    _MAGIC: Final[bytes] = b"CBF1" # 魔数（不可变）
+    _MAX: Final[int] = 255 # 计数器的上限（不可变）
+
+    @override
+    def __init__(self, num_bits: int, num_hashes: int, stable: bool = True) -> None:
+        """构造方法
+
+        Args:
+            num_bits (int): 计数器的个数 m
+            num_hashes (int): 哈希函数的个数 k
+            stable (bool, optional): 是否使用与进程无关的哈希. Defaults to True.
+
+        Raises:
+            ValueError: 参数不是正数
+        """
+        if (num_bits <= 0) or (num_hashes <= 0):
+            raise ValueError("计数器个数和哈希函数的个数必须是正数")
+        self._num_bits: int = num_bits
+        self._num_hashes: int = num_hashes
+        self._stable: bool = stable
+        self._counters: bytearray = bytearray(num_bits) # 计数器
+
+    @override
+    def add(self, item: T) -> None:
+        """加入元素
+
+        Args:
+            item (T): 元素
+        """
+        pos: int
+        for pos in self._positions(item=item):
+            if self._counters[pos] < CountingBloomFilter._MAX:
+                self._counters[pos] += 1
+
+    @override
+    def add_many(self, items: Iterable[T]) -> None:
+        """批量加入元素
+
+        Args:
+            items (Iterable[T]): 元素序列
+        """
+        item: T
+        for item in items:
+            self.add(item=item)
+
+    def remove(self, item: T) -> None:
+        """删除元素（只能删除加入过的元素，否则会使其他元素被漏判）
+
+        Args:
+            item (T): 元素
+
+        Raises:
+            KeyError: 元素一定不在过滤器中
+        """
+        positions: List[int] = self._positions(item=item)
+        pos: int
+        if any(self._counters[pos] == 0 for pos in positions):
+            raise KeyError(f"{item}不在过滤器中")
+        for pos in positions:
+            if self._counters[pos] < CountingBloomFilter._MAX: # 已经饱和的计数器不知道真实的值，不再减少
+                self._counters[pos] -= 1
+
+    @override
+    def __contains__(self, item: T) -> bool:
+        """元素是否可能存在（返回 False 时一定不存在）
+
+        Args:
+            item (T): 元素
+
+        Returns:
+            bool: 元素是否可能存在
+        """
+        pos: int
+        for pos in self._positions(item=item):
+            if self._counters[pos] == 0:
+                return False
+        return True
+
+    @override
+    def bit_count(self) -> int:
+        """查看非零的计数器个数
+
+        Returns:
+            int: 非零的计数器个数
+        """
+        return self._num_bits - self._counters.count(0)
+
+    @override
+    def union(self, other: "BloomFilter[T]") -> "CountingBloomFilter[T]":
+        """并集：对应的计数器相加（达到上限时饱和）
+
+        Args:
+            other (BloomFilter[T]): 另一个计数布隆过滤器
+
+        Returns:
+            CountingBloomFilter[T]: 新的过滤器
+        """
+        self._check_compatible(other=other)
+        result: CountingBloomFilter[T] = CountingBloomFilter[T](num_bits=self._num_bits, num_hashes=self._num_hashes, stable=self._stable)
+        result._counters = bytearray(min(a + b, CountingBloomFilter._MAX) for a, b in zip(self._counters, other._counters)) # type: ignore
+        return result
+
+    @override
+    def intersection(self, other: "BloomFilter[T]") -> "CountingBloomFilter[T]":
+        """交集：对应的计数器取较小值
+
+        Args:
+            other (BloomFilter[T]): 另一个计数布隆过滤器
+
+        Returns:
+            CountingBloomFilter[T]: 新的过滤器
+        """
+        self._check_compatible(other=other)
+        result: CountingBloomFilter[T] = CountingBloomFilter[T](num_bits=self._num_bits, num_hashes=self._num_hashes, stable=self._stable)
+        result._counters = bytearray(min(a, b) for a, b in zip(self._counters, other._counters)) # type: ignore
+        return result
+
+    @override
+    def to_bytes(self) -> bytes:
+        """序列化
+
+        Raises:
+            ValueError: 过滤器使用的是进程内的哈希
+
+        Returns:
+            bytes: 头部和计数器
+        """
+        self._check_stable()
+        return BloomFilter._HEADER.pack(CountingBloomFilter._MAGIC, self._num_bits, self._num_hashes) + bytes(self._counters)
+
+    @classmethod # 类方法
+    @override
+    def from_bytes(cls, data: bytes) -> "CountingBloomFilter[T]":
+        """反序列化
+
+        Args:
+            data (bytes): to_bytes 的结果
+
+        Raises:
+            ValueError: 数据格式不正确
+
+        Returns:
+            CountingBloomFilter[T]: 过滤器
+        """
+        magic: bytes
+        num_bits: int
+        num_hashes: int
+        if len(data) < BloomFilter._HEADER.size:
+            raise ValueError("不是计数布隆过滤器的序列化数据")
+        magic, num_bits, num_hashes = BloomFilter._HEADER.unpack_from(data)
+        if (magic != CountingBloomFilter._MAGIC) or (len(data) != BloomFilter._HEADER.size + num_bits):
+            raise ValueError("不是计数布隆过滤器的序列化数据")
+        result: CountingBloomFilter[T] = cls(num_bits=num_bits, num_hashes=num_hashes)
+        result._counters = bytearray(data[BloomFilter._HEADER.size:])
+        return result
+
+
+
+class CuckooFilter(Generic[T]):
+    """
+    布谷鸟过滤器，与计数布隆过滤器一样支持删除，但空间更省、查询只需检查两个桶；
+    每个元素只存放一个指纹，数组桶的每个桶有 4 个槽位，所有槽位连续存放在 array("H") 中，指纹为 0 表示空槽；
+    元素的两个候选桶满足 i2 = i1 ^ hash(指纹)（部分键布谷鸟哈希），因此只凭指纹就能算出另一个候选桶，踢出时无需原始元素；
+    适合代替开放寻址哈希表做大规模的近似去重（例如遍历中的 visited 集合），内存只有其一小部分，代价是少量误判
+    """
+    bucket_size: Final[int] = 4 # 每个桶的槽位数（不可变）
+    max_load: Final[float] = 0.95 # 按预计容量分配桶时假定能达到的负载因子（不可变）
+    max_kicks: Final[int] = 500 # 单次插入最多踢出的次数（不可变）
+    _FP_MULTIPLIER: Final[int] = 0x5BD1E995 # 计算指纹哈希的乘数（不可变）
+
+    def __init__(self, capacity: int, fingerprint_bits: int = 16, stable: bool = True) -> None:
+        """构造方法
+
+        Args:
+            capacity (int): 预计的元素数量
+            fingerprint_bits (int, optional): 指纹的位数，最多 16 位，误判率约为 8 / 2^fingerprint_bits. Defaults to 16.
+            stable (bool, optional): 是否使用与进程无关的哈希，为 False 时改用内置的 hash，支持任意可哈希对象. Defaults to True.
+
+        Raises:
+            ValueError: 参数超出范围
+        """
+        if capacity <= 0:
+            raise ValueError("预计的元素数量必须是正数")
+        if not 1 <= fingerprint_bits <= 16:
+            raise ValueError("指纹的位数必须在 [1, 16] 之间")
+        buckets: int = ceil(capacity / (CuckooFilter.bucket_size * CuckooFilter.max_load))
+        self._num_buckets: int = 1 << (buckets - 1).bit_length() # 桶的数量取 2 的幂，保证异或得到的另一个候选桶仍然有效
+        self._fp_mask: int = (1 << fingerprint_bits) - 1
+        self._table: array = array("H", [0]) * (self._num_buckets * CuckooFilter.bucket_size) # 第 i 个桶的槽位为 [4i, 4i + 4)
+        self._size: int = 0 # 存放的指纹数量（包括溢出的指纹）
+        self._stable: bool = stable
+        self._victim: Optional[Tuple[int, int]] = None # 踢出次数用尽时无处安放的（桶，指纹），过滤器此时视为已满
+
+    def _locate(self, item: T) -> Tuple[int, int, int]:
+        """计算元素的指纹和两个候选桶
+
+        Args:
+            item (T): 元素
+
+        Returns:
+            Tuple[int, int, int]: 指纹（非零）、第一个候选桶、第二个候选桶
+        """
+        h1: int
+        h2: int
+        h1, h2 = stable_hash(obj=item) if self._stable else local_hash(obj=item)
+        fingerprint: int = h2 % self._fp_mask + 1 # 落在 [1, 2^f - 1] 中，0 留给空槽
+        i1: int = h1 & (self._num_buckets - 1)
+        return fingerprint, i1, self._alt_index(idx=i1, fingerprint=fingerprint)
+
+    def _alt_index(self, idx: int, fingerprint: int) -> int:
+        """由一个候选桶和指纹计算另一个候选桶（对两个候选桶互为逆运算）
+
+        Args:
+            idx (int): 一个候选桶
+            fingerprint (int): 指纹
+
+        Returns:
+            int: 另一个候选桶
+        """
+        return (idx ^ ((fingerprint * CuckooFilter._FP_MULTIPLIER) >> 8)) & (self._num_buckets - 1)
+
+    def _insert_into(self, idx: int, fingerprint: int) -> bool:
+        """将指纹放入桶中的空槽
+
+        Args:
+            idx (int): 桶
+            fingerprint (int): 指纹
+
+        Returns:
+            bool: 桶中是否有空槽
+        """
+        start: int = idx * CuckooFilter.bucket_size
+        slot: int
+        for slot in range(start, start + CuckooFilter.bucket_size):
+            if self._table[slot] == 0:
+                self._table[slot] = fingerprint
+                return True
+        return False
+
+    def _remove_from(self, idx: int, fingerprint: int) -> bool:
+        """从桶中删除一个指纹
+
+        Args:
+            idx (int): 桶
+            fingerprint (int): 指纹
+
+        Returns:
+            bool: 桶中是否有该指纹
+        """
+        start: int = idx * CuckooFilter.bucket_size
+        slot: int
+        for slot in range(start, start + CuckooFilter.bucket_size):
+            if self._table[slot] == fingerprint:
+                self._table[slot] = 0
+                return True
+        return False
+
+    def _contains_in(self, idx: int, fingerprint: int) -> bool:
+        """桶中是否有指纹
+
+        Args:
+            idx (int): 桶
+            fingerprint (int): 指纹
+
+        Returns:
+            bool: 桶中是否有该指纹
+        """
+        start: int = idx * CuckooFilter.bucket_size
+        return fingerprint in self._table[start:start + CuckooFilter.bucket_size]
+
+    def _place(self, idx: int, fingerprint: int) -> None:
+        """安放一个指纹：两个候选桶都满时随机踢出其中的一个指纹，再为被踢出的指纹寻找位置，踢出次数用尽时暂存最后被踢出的指纹
+
+        Args:
+            idx (int): 指纹的一个候选桶
+            fingerprint (int): 指纹
+        """
+        self._size += 1
+        alt: int = self._alt_index(idx=idx, fingerprint=fingerprint)
+        if self._insert_into(idx=idx, fingerprint=fingerprint) or self._insert_into(idx=alt, fingerprint=fingerprint):
+            return
+        if randrange(2) == 1:
+            idx = alt
+        for _ in range(CuckooFilter.max_kicks):
+            slot: int = idx * CuckooFilter.bucket_size + randrange(CuckooFilter.bucket_size)
+            fingerprint, self._table[slot] = self._table[slot], fingerprint
+            idx = self._alt_index(idx=idx, fingerprint=fingerprint)
+            if self._insert_into(idx=idx, fingerprint=fingerprint):
+                return
+        self._victim = (idx, fingerprint) # 已经放入的元素不会产生漏判
+
+    def add(self, item: T) -> bool:
+        """加入元素（同一个元素加入多次会占据多个槽位，需要删除同样多次）
+
+        Args:
+            item (T): 元素
+
+        Returns:
+            bool: 是否加入成功，过滤器已满时为 False
+        """
+        if self._victim is not None: # 已满
+            return False
+        fingerprint: int
+        i1: int
+        fingerprint, i1, _ = self._locate(item=item)
+        self._place(idx=i1, fingerprint=fingerprint)
+        return True
+
+    def contains(self, item: T) -> bool:
+        """元素是否可能存在（返回 False 时一定不存在）
+
+        Args:
+            item (T): 元素
+
+        Returns:
+            bool: 元素是否可能存在
+        """
+        fingerprint: int
+        i1: int
+        i2: int
+        fingerprint, i1, i2 = self._locate(item=item)
+        if self._contains_in(idx=i1, fingerprint=fingerprint) or self._contains_in(idx=i2, fingerprint=fingerprint):
+            return True
+        return (self._victim is not None) and (self._victim[1] == fingerprint) and (self._victim[0] in (i1, i2))
+
+    def delete(self, item: T) -> None:
+        """删除元素（只能删除加入过的元素，否则可能误删指纹相同的其他元素）
+
+        Args:
+            item (T): 元素
+
+        Raises:
+            KeyError: 元素一定不在过滤器中
+        """
+        fingerprint: int
+        i1: int
+        i2: int
+        fingerprint, i1, i2 = self._locate(item=item)
+        if self._remove_from(idx=i1, fingerprint=fingerprint) or self._remove_from(idx=i2, fingerprint=fingerprint):
+            self._size -= 1
+            if self._victim is not None: # 腾出了空间，尝试重新安放暂存的指纹
+                victim_idx: int
+                victim_fingerprint: int
+                victim_idx, victim_fingerprint = self._victim
+                self._victim = None
+                self._size -= 1
+                self._place(idx=victim_idx, fingerprint=victim_fingerprint)
+            return
+        if (self._victim is not None) and (self._victim[1] == fingerprint) and (self._victim[0] in (i1, i2)):
+            self._victim = None
+            self._size -= 1
+            return
+        raise KeyError(f"{item}不在过滤器中")
+
+    def load_factor(self) -> float:
+        """查看负载因子
+
+        Returns:
+            float: 被占据的槽位的比例
+        """
+        return self._size / len(self._table)
+
+    def is_full(self) -> bool:
+        """是否已满（已满时不能再加入元素，删除元素后可能恢复）
+
+        Returns:
+            bool: 是否已满
+        """
+        return self._victim is not None
+
+    def memory_bytes(self) -> int:
+        """查看存放指纹的数组占用的字节数
+
+        Returns:
+            int: 字节数
+        """
+        return len(self._table) * self._table.itemsize
+
+    def __contains__(self, item: T) -> bool:
+        """元素是否可能存在（返回 False 时一定不存在）
+
+        Args:
+            item (T): 元素
+
+        Returns:
+            bool: 元素是否可能存在
+        """
+        return self.contains(item=item)
+
+    def __len__(self) -> int:
+        """查看存放的指纹数量
+
+        Returns:
+            int: 存放的指纹数量
+        """
+        return self._size
+
+
+
+class FilteredMap(Generic[K, V]):
+    """
+    在已有的映射（本仓库中的各种哈希表、跳表等）之前加一层布隆过滤器；
+    过滤器判断键一定不存在时直接返回，不再访问映射，适用于查询代价较高且大多数查询的键都不存在的场景；
+    使用计数布隆过滤器时删除的键会同步从过滤器中删除，使用普通布隆过滤器时删除的键只会让过滤器多放行一些查询，不影响正确性；
+    键的数量超过过滤器的预计容量后误判率会上升
+    """
+    def __init__(self, mapping: Viewable, bloom: Optional[BloomFilter[K]] = None, error_rate: float = 0.01) -> None:
+        """构造方法，已有的键会被批量加入过滤器
+
+        Args:
+            mapping (Viewable): 被包装的映射，还需要有 put、remove 和 keys 等方法
+            bloom (Optional[BloomFilter[K]], optional): 过滤器，为 None 时按映射当前大小的两倍创建使用进程内哈希的计数布隆过滤器（支持任意可哈希的键）. Defaults to None.
+            error_rate (float, optional): 自动创建过滤器时可以接受的误判率. Defaults to 0.01.
+        """
+        self._mapping: Viewable = mapping # 被包装的映射
+        self._bloom: BloomFilter[K] = bloom if bloom is not None else CountingBloomFilter[K].with_capacity(capacity=max(2 * len(mapping), 64), error_rate=error_rate, stable=False)
+        self._bloom.add_many(items=mapping.keys()) # type: ignore
+        self._skipped: int = 0 # 被过滤器直接排除的查询次数
+
+    def put(self, key: K, val: V) -> None:
+        """新增或更新键值对
+
+        Args:
+            key (K): 键
+            val (V): 值
+        """
+        if (not isinstance(self._bloom, CountingBloomFilter)) or (key not in self._mapping): # 计数布隆过滤器中每个键只能计入一次，否则删除后仍会残留
+            self._bloom.add(item=key)
+        self._mapping.put(key=key, val=val) # type: ignore
+
+    def get(self, key: K) -> V:
+        """查询键值对，过滤器判断键一定不存在时不访问映射
+
+        Args:
+            key (K): 键
+
+        Raises:
+            KeyError: 键不存在
+
+        Returns:
+            V: 值
+        """
+        if key not in self._bloom:
+            self._skipped += 1
+            raise KeyError(f"{key}不在映射中")
+        return self._mapping.get(key=key) # type: ignore
+
+    def peek(self, key: K) -> V:
+        """查询键值对，不计入被排除的次数；被包装的映射提供 peek 时同样使用 peek
+
+        Args:
+            key (K): 键
+
+        Raises:
+            KeyError: 键不存在
+
+        Returns:
+            V: 值
+        """
+        if key not in self._bloom:
+            raise KeyError(f"{key}不在映射中")
+        return getattr(self._mapping, "peek", self._mapping.get)(key=key) # type: ignore
+
+    def remove(self, key: K) -> None:
+        """删除键值对
+
+        Args:
+            key (K): 待删除的键
+
+        Raises:
+            KeyError: 键不存在
+        """
+        self._mapping.remove(key=key) # type: ignore
+        if isinstance(self._bloom, CountingBloomFilter):
+            self._bloom.remove(item=key)
+
+    def skipped(self) -> int:
+        """查看被过滤器直接排除的查询次数
+
+        Returns:
+            int: 被过滤器直接排除的查询次数
+        """
+        return self._skipped
+
+    def keys(self) -> KeysView[K]:
+        """查看所有键
+
+        Returns:
+            KeysView[K]: 惰性遍历的键视图
+        """
+        return KeysView[K](mapping=self._mapping)
+
+    def values(self) -> ValuesView[V]:
+        """查看所有值
+
+        Returns:
+            ValuesView[V]: 惰性遍历的值视图
+        """
+        return ValuesView[V](mapping=self._mapping)
+
+    def items(self) -> ItemsView[Tuple[K, V]]:
+        """查看所有键值对
+
+        Returns:
+            ItemsView[Tuple[K, V]]: 惰性遍历的键值对视图
+        """
+        return ItemsView[Tuple[K, V]](mapping=self._mapping)
+
+    def __getitem__(self, key: K) -> V:
+        """查询键值对
+
+        Args:
+            key (K): 键
+
+        Returns:
+            V: 值
+        """
+        return self.get(key=key)
+
+    def __setitem__(self, key: K, val: V) -> None:
+        """新增或更新键值对
+
+        Args:
+            key (K): 键
+            val (V): 值
+        """
+        self.put(key=key, val=val)
+
+    def __delitem__(self, key: K) -> None:
+        """删除键值对
+
+        Args:
+            key (K): 待删除的键
+        """
+        self.remove(key=key)
+
+    def __len__(self) -> int:
+        """查看键值对数量
+
+        Returns:
+            int: 键值对数量
+        """
+        return len(self._mapping)
+
+    def __contains__(self, key: K) -> bool:
+        """映射中是否存在指定键，过滤器判断键一定不存在时不访问映射
+
+        Args:
+            key (K): 键
+
+        Returns:
+            bool: 键是否存在
+        """
+        if key not in self._bloom:
+            self._skipped += 1
+            return False
+        return key in self._mapping
+
+    def __iter__(self) -> Iterator:
+        """使自身可迭代
+
+        Returns:
+            Iterator: 被包装映射的迭代器
+        """
+        return iter(self._mapping) # type: ignore
+
+
+
+if __name__ == "__main__":
+    b: BloomFilter[str] = BloomFilter[str].with_capacity(capacity=1000, error_rate=0.01)
+    b.add_many(items=(f"user{i}" for i in range(1000)))
+    print("user1" in b, sum(f"guest{i}" in b for i in range(10000)) / 10000, b.false_positive_rate(), round(b.approx_len()))
+    restored: BloomFilter[str] = BloomFilter[str].from_bytes(data=b.to_bytes())
+    print(all(f"user{i}" in restored for i in range(1000)))
+    c: CountingBloomFilter[int] = CountingBloomFilter[int].with_capacity(capacity=100)
+    c.add_many(items=range(10))
+    c.remove(item=3)
+    print(3 in c, 4 in c)
+    cf: CuckooFilter[int] = CuckooFilter[int](capacity=10000, fingerprint_bits=12)
+    for i in range(9000):
+        cf.add(item=i)
+    for i in range(0, 9000, 2):
+        cf.delete(item=i)
+    print(1 in cf, 2 in cf, sum(i in cf for i in range(100000, 110000)) / 10000, round(cf.load_factor(), 3), cf.memory_bytes())
+
+    from HashMap import HashMapChaining
+    m: HashMapChaining[int, str] = HashMapChaining[int, str]()
+    for i in range(100):
+        m[i] = str(object=i)
+    f: FilteredMap[int, str] = FilteredMap[int, str](mapping=m)
+    del f[5]
+    f[200] = "200"
+    print(5 in f, 200 in f, f[7], sum(i in f for i in range(1000, 2000)), f.skipped())
\ No newline at end of file
@@ -0,0 +1,1140 @@
+from typing import Callable, Final, Generic, Generator, Hashable, List, Optional, Tuple, TypeVar
+from functools import wraps
+from math import ceil, floor, inf
+from time import monotonic
+
+from HashMap import HashMapChaining, HashMapOpenAddressing
+from Deque import LinkedListDeque, Node as DequeNode
+from Sketch import CountMinSketch
+from utils import Iterator, KeysView, ValuesView, ItemsView
+
+
+
+K = TypeVar(name="K", bound=Hashable) # 声明一个类型参数，不宜对其进行 type hints
+V = TypeVar(
+            name="V",
+            # covariant=True
+        )
+
+class CacheNode(Generic[K, V]):
+    """缓存条目，同时也是侵入式双向链表的节点（前后指针直接存放在条目中，不再额外分配链表节点）"""
+    def __init__(self, key: K, val: V, weight: int) -> None:
+        """构造方法
+
+        Args:
+            key (K): 键
+            val (V): 值
+            weight (int): 权重
+        """
+        self._key: K = key
+        self._val: V = val
+        self._weight: int = weight
+        self.prev: Optional[CacheNode[K, V]] = None # 前一个（更近使用的）条目
+        self.next: Optional[CacheNode[K, V]] = None # 后一个（更久未使用的）条目
+
+class CacheStats:
+    """缓存的命中统计"""
+    def __init__(self, hits: int, misses: int, evictions: int, hit_ratio: float) -> None:
+        """构造方法
+
+        Args:
+            hits (int): 命中次数
+            misses (int): 未命中次数
+            evictions (int): 淘汰的条目数量
+            hit_ratio (float): 命中率
+        """
+        self.hits: int = hits
+        self.misses: int = misses
+        self.evictions: int = evictions
+        self.hit_ratio: float = hit_ratio
+
+class LRUCache(Generic[K, V]):
+    """
+    最近最少使用（LRU）缓存；
+    由链式地址哈希表 O(1) 定位条目，所有条目串成一条带哨兵的双向循环链表，哨兵之后是最近使用的条目，哨兵之前是最久未使用的条目；
+    命中时将条目移到链表头部，超出限制时从链表尾部淘汰，增删查都是 O(1)；
+    可以限制条目数量，也可以通过 weigher 为每个条目计算权重并限制总权重（两者同时指定时都需要满足）；
+    get 会调整条目的顺序，属于结构性修改，遍历视图的过程中应使用不改变顺序的 peek
+    """
+    def __init__(self, max_entries: Optional[int] = None, max_weight: Optional[int] = None, weigher: Optional[Callable[[K, V], int]] = None) -> None:
+        """构造方法
+
+        Args:
+            max_entries (Optional[int], optional): 最大条目数量. Defaults to None.
+            max_weight (Optional[int], optional): 最大总权重. Defaults to None.
+            weigher (Optional[Callable[[K, V], int]], optional): 计算条目权重的函数，为 None 时每个条目的权重都为 1. Defaults to None.
+
+        Raises:
+            ValueError: 没有指定任何限制，或者限制不是正数
+        """
+        if (max_entries is None) and (max_weight is None):
+            raise ValueError("至少需要指定最大条目数量和最大总权重中的一个")
+        if ((max_entries is not None) and (max_entries <= 0)) or ((max_weight is not None) and (max_weight <= 0)):
+            raise ValueError("最大条目数量和最大总权重必须是正数")
+        self._max_entries: Optional[int] = max_entries
+        self._max_weight: Optional[int] = max_weight
+        self._weigher: Optional[Callable[[K, V], int]] = weigher
+        self._map: HashMapChaining[K, CacheNode[K, V]] = HashMapChaining[K, CacheNode[K, V]]() # {键：条目}
+        self._head: CacheNode[K, V] = CacheNode(key=None, val=None, weight=0) # type: ignore # 哨兵，不存储数据
+        self._head.prev = self._head.next = self._head
+        self._weight: int = 0 # 当前的总权重
+        self._modcount: int = 0 # 结构性修改的次数，用于在视图迭代过程中检测修改
+        self._hits: int = 0 # 命中次数
+        self._misses: int = 0 # 未命中次数
+        self._evictions: int = 0 # 淘汰的条目数量
+
+    def _unlink(self, node: CacheNode[K, V]) -> None:
+        """将条目从链表中摘除
+
+        Args:
+            node (CacheNode[K, V]): 条目
+        """
+        node.prev.next = node.next # type: ignore
+        node.next.prev = node.prev # type: ignore
+        node.prev = node.next = None
+
+    def _push_front(self, node: CacheNode[K, V]) -> None:
+        """将条目放到链表头部（最近使用）
+
+        Args:
+            node (CacheNode[K, V]): 条目
+        """
+        node.prev = self._head
+        node.next = self._head.next
+        self._head.next.prev = node # type: ignore
+        self._head.next = node
+
+    def _evict(self) -> None:
+        """从链表尾部淘汰最久未使用的条目，直到满足所有限制"""
+        while ((self._max_entries is not None) and (len(self._map) > self._max_entries)) or ((self._max_weight is not None) and (self._weight > self._max_weight)):
+            node: CacheNode[K, V] = self._head.prev # type: ignore
+            self._unlink(node=node)
+            self._map.remove(key=node._key)
+            self._weight -= node._weight
+            self._evictions += 1
+            self._modcount += 1
+
+    def get(self, key: K) -> V:
+        """查询条目，命中时将其标记为最近使用
+
+        Args:
+            key (K): 键
+
+        Raises:
+            KeyError: 键不在缓存中
+
+        Returns:
+            V: 值
+        """
+        try:
+            node: CacheNode[K, V] = self._map.get(key=key)
+        except KeyError:
+            self._misses += 1
+            raise
+        self._hits += 1
+        if self._head.next is not node:
+            self._unlink(node=node)
+            self._push_front(node=node)
+            self._modcount += 1
+        return node._val
+
+    def get_or_put(self, key: K, compute: Callable[[], V]) -> V:
+        """查询条目，未命中时调用 compute 计算值并放入缓存
+
+        Args:
+            key (K): 键
+            compute (Callable[[], V]): 未命中时计算值的函数
+
+        Returns:
+            V: 值
+        """
+        try:
+            return self.get(key=key)
+        except KeyError:
+            pass
+        val: V = compute()
+        self.put(key=key, val=val)
+        return val
+
+    def peek(self, key: K) -> V:
+        """查询条目，不改变使用顺序，也不计入命中统计
+
+        Args:
+            key (K): 键
+
+        Raises:
+            KeyError: 键不在缓存中
+
+        Returns:
+            V: 值
+        """
+        return self._map.get(key=key)._val
+
+    def put(self, key: K, val: V) -> None:
+        """新增或更新条目并将其标记为最近使用，超出限制时淘汰最久未使用的条目；
+        权重超过最大总权重的条目无法放入缓存，会被直接淘汰（键已存在时旧的条目也会被删除）
+
+        Args:
+            key (K): 键
+            val (V): 值
+        """
+        weight: int = self._weigher(key, val) if self._weigher is not None else 1
+        node: Optional[CacheNode[K, V]]
+        try:
+            node = self._map.get(key=key)
+        except KeyError:
+            node = None
+        if (self._max_weight is not None) and (weight > self._max_weight): # 放入后只能把其他条目都淘汰后再淘汰自身，不如直接淘汰
+            if node is not None:
+                self.remove(key=key)
+            self._evictions += 1
+            return
+        if node is not None: # 键存在，更新条目
+            node._val = val
+            self._weight += weight - node._weight
+            node._weight = weight
+            if self._head.next is not node:
+                self._unlink(node=node)
+                self._push_front(node=node)
+                self._modcount += 1
+        else:
+            node = CacheNode(key=key, val=val, weight=weight)
+            self._map.put(key=key, val=node)
+            self._push_front(node=node)
+            self._weight += weight
+            self._modcount += 1
+        self._evict()
+
+    def remove(self, key: K) -> None:
+        """删除条目
+
+        Args:
+            key (K): 待删除的键
+
+        Raises:
+            KeyError: 键不在缓存中
+        """
+        node: CacheNode[K, V] = self._map.get(key=key)
+        self._map.remove(key=key)
+        self._unlink(node=node)
+        self._weight -= node._weight
+        self._modcount += 1
+
+    def clear(self) -> None:
+        """清空缓存（不清空命中统计）"""
+        self._map = HashMapChaining[K, CacheNode[K, V]]()
+        self._head.prev = self._head.next = self._head
+        self._weight = 0
+        self._modcount += 1
+
+    def weight(self) -> int:
+        """查看当前的总权重
+
+        Returns:
+            int: 所有条目的权重之和
+        """
+        return self._weight
+
+    def stats(self) -> CacheStats:
+        """查看命中统计
+
+        Returns:
+            CacheStats: 命中统计
+        """
+        total: int = self._hits + self._misses
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            hit_ratio=self._hits / total if total else 0.0
+        )
+
+    def reset_stats(self) -> None:
+        """清空命中统计"""
+        self._hits = self._misses = self._evictions = 0
+
+    def _entries(self) -> Generator[Tuple[K, V], None, None]:
+        """从最近使用到最久未使用依次遍历所有条目
+
+        Yields:
+            Generator[Tuple[K, V], None, None]: (键, 值)
+        """
+        cur: CacheNode[K, V] = self._head.next # type: ignore
+        while cur is not self._head:
+            yield (cur._key, cur._val)
+            cur = cur.next # type: ignore
+
+    def keys(self) -> KeysView[K]:
+        """查看所有键
+
+        Returns:
+            KeysView[K]: 惰性遍历的键视图
+        """
+        return KeysView[K](mapping=self)
+
+    def values(self) -> ValuesView[V]:
+        """查看所有值
+
+        Returns:
+            ValuesView[V]: 惰性遍历的值视图
+        """
+        return ValuesView[V](mapping=self)
+
+    def items(self) -> ItemsView[Tuple[K, V]]:
+        """查看所有条目
+
+        Returns:
+            ItemsView[Tuple[K, V]]: 惰性遍历的键值对视图
+        """
+        return ItemsView[Tuple[K, V]](mapping=self)
+
+    def __getitem__(self, key: K) -> V:
+        """查询条目
+
+        Args:
+            key (K): 键
+
+        Returns:
+            V: 值
+        """
+        return self.get(key=key)
+
+    def __setitem__(self, key: K, val: V) -> None:
+        """新增或更新条目
+
+        Args:
+            key (K): 键
+            val (V): 值
+        """
+        self.put(key=key, val=val)
+
+    def __delitem__(self, key: K) -> None:
+        """删除条目
+
+        Args:
+            key (K): 待删除的键
+        """
+        self.remove(key=key)
+
+    def __len__(self) -> int:
+        """查看条目数量
+
+        Returns:
+            int: 条目数量
+        """
+        return len(self._map)
+
+    def __contains__(self, key: K) -> bool:
+        """缓存中是否存在指定键（不改变使用顺序，也不计入命中统计）
+
+        Args:
+            key (K): 键
+
+        Returns:
+            bool: 键在缓存中是否存在
+        """
+        return key in self._map
+
+    def __iter__(self) -> Iterator:
+        """使自身可迭代，从最近使用到最久未使用遍历键
+
+        Returns:
+            Iterator: 键视图的迭代器
+        """
+        return iter(self.keys())
+
+
+
+class TinyLFUEntry(Generic[K, V]):
+    """W-TinyLFU 缓存的条目"""
+    def __init__(self, key: K, val: V, region: int) -> None:
+        """构造方法
+
+        Args:
+            key (K): 键
+            val (V): 值
+            region (int): 所在的区域
+        """
+        self._key: K = key
+        self._val: V = val
+        self._region: int = region
+
+class WTinyLFUCache(Generic[K, V]):
+    """
+    W-TinyLFU 缓存，能够抵御扫描式的访问；
+    条目分为三个区域，每个区域是一个 LRU 链表（队首是最近使用的条目，队尾是最久未使用的条目）：
+    新条目先进入很小的窗口区，从窗口区淘汰的条目作为候选者，与主区试用段队尾的受害者比较频率，频率更高者留在主区；
+    主区采用分段 LRU，试用段中的条目再次被访问时晋升到受保护段，受保护段超出容量时队尾的条目降级回试用段；
+    频率由会周期性老化的 Count-Min 草图估计，只被访问一次的扫描数据频率很低，几乎不会挤掉主区中的热点数据；
+    哈希表只负责由键定位链表节点，增删查都是 O(1)；get 会调整条目的顺序，属于结构性修改
+    """
+    WINDOW: Final[int] = 0 # 窗口区（不可变）
+    PROBATION: Final[int] = 1 # 主区的试用段（不可变）
+    PROTECTED: Final[int] = 2 # 主区的受保护段（不可变）
+    window_ratio: Final[float] = 0.01 # 窗口区占总容量的比例（不可变）
+    protected_ratio: Final[float] = 0.8 # 受保护段占主区容量的比例（不可变）
+    sample_factor: Final[int] = 10 # 草图每计入 总容量 * 该值 次访问老化一次（不可变）
+
+    def __init__(self, max_entries: int, seed: Optional[int] = None) -> None:
+        """构造方法
+
+        Args:
+            max_entries (int): 最大条目数量
+            seed (Optional[int], optional): 频率草图的随机种子，指定时淘汰结果可以复现（键需要被 stable_hash 支持）. Defaults to None.
+
+        Raises:
+            ValueError: 最大条目数量不是正数
+        """
+        if max_entries <= 0:
+            raise ValueError("最大条目数量必须是正数")
+        self._max_entries: int = max_entries
+        self._window_capacity: int = max(1, int(max_entries * WTinyLFUCache.window_ratio)) # 窗口区容量
+        self._main_capacity: int = max_entries - self._window_capacity # 主区容量
+        self._protected_capacity: int = int(self._main_capacity * WTinyLFUCache.protected_ratio) # 受保护段容量
+        self._index: HashMapOpenAddressing[K, DequeNode[TinyLFUEntry[K, V]]] = HashMapOpenAddressing[K, DequeNode[TinyLFUEntry[K, V]]]() # {键：链表节点}
+        self._index.reserve(n=max_entries)
+        self._segments: List[LinkedListDeque[TinyLFUEntry[K, V]]] = [LinkedListDeque[TinyLFUEntry[K, V]]() for _ in range(3)] # 按区域编号存放的 LRU 链表
+        self._sketch: CountMinSketch[K] = CountMinSketch[K](width=max_entries, sample_size=max_entries * WTinyLFUCache.sample_factor, seed=seed) # 频率草图
+        self._modcount: int = 0 # 结构性修改的次数，用于在视图迭代过程中检测修改
+        self._hits: int = 0 # 命中次数
+        self._misses: int = 0 # 未命中次数
+        self._evictions: int = 0 # 淘汰的条目数量
+
+    def _on_hit(self, node: DequeNode[TinyLFUEntry[K, V]]) -> None:
+        """条目被访问后调整其位置
+
+        Args:
+            node (DequeNode[TinyLFUEntry[K, V]]): 条目所在的节点
+        """
+        entry: TinyLFUEntry[K, V] = node._val
+        if entry._region != WTinyLFUCache.PROBATION: # 在窗口区或受保护段中，移到队首即可
+            self._segments[entry._region].move_to_front(node=node)
+            self._modcount += 1
+            return
+        # 试用段中的条目再次被访问，晋升到受保护段
+        self._segments[WTinyLFUCache.PROBATION].remove_node(node=node)
+        entry._region = WTinyLFUCache.PROTECTED
+        self._index.put(key=entry._key, val=self._segments[WTinyLFUCache.PROTECTED].add_front(item=entry))
+        if len(self._segments[WTinyLFUCache.PROTECTED]) > self._protected_capacity: # 受保护段超出容量，队尾的条目降级回试用段
+            demoted: TinyLFUEntry[K, V] = self._segments[WTinyLFUCache.PROTECTED].remove_rear()
+            demoted._region = WTinyLFUCache.PROBATION
+            self._index.put(key=demoted._key, val=self._segments[WTinyLFUCache.PROBATION].add_front(item=demoted))
+        self._modcount += 1
+
+    def _evict(self) -> None:
+        """窗口区超出容量时淘汰其队尾的条目，由频率决定候选者能否进入主区"""
+        candidate: TinyLFUEntry[K, V] = self._segments[WTinyLFUCache.WINDOW].remove_rear()
+        main_size: int = len(self._segments[WTinyLFUCache.PROBATION]) + len(self._segments[WTinyLFUCache.PROTECTED])
+        if main_size < self._main_capacity: # 主区未满，直接进入试用段
+            candidate._region = WTinyLFUCache.PROBATION
+            self._index.put(key=candidate._key, val=self._segments[WTinyLFUCache.PROBATION].add_front(item=candidate))
+            return
+        self._evictions += 1
+        if self._main_capacity == 0: # 没有主区，只能淘汰候选者
+            self._index.remove(key=candidate._key)
+            return
+        victims: LinkedListDeque[TinyLFUEntry[K, V]] = self._segments[WTinyLFUCache.PROBATION]
+        if victims.is_empty(): # 主区已满且试用段为空，受害者取自受保护段
+            victims = self._segments[WTinyLFUCache.PROTECTED]
+        victim: TinyLFUEntry[K, V] = victims.peek_rear()
+        if self._sketch.estimate(item=candidate._key) > self._sketch.estimate(item=victim._key): # 频率更高的候选者取代受害者
+            victims.remove_rear()
+            self._index.remove(key=victim._key)
+            candidate._region = WTinyLFUCache.PROBATION
+            self._index.put(key=candidate._key, val=self._segments[WTinyLFUCache.PROBATION].add_front(item=candidate))
+        else:
+            self._index.remove(key=candidate._key)
+
+    def get(self, key: K) -> V:
+        """查询条目，命中与否都会计入频率
+
+        Args:
+            key (K): 键
+
+        Raises:
+            KeyError: 键不在缓存中
+
+        Returns:
+            V: 值
+        """
+        self._sketch.add(item=key)
+        try:
+            node: DequeNode[TinyLFUEntry[K, V]] = self._index.get(key=key)
+        except KeyError:
+            self._misses += 1
+            raise
+        self._hits += 1
+        self._on_hit(node=node)
+        return node._val._val
+
+    def peek(self, key: K) -> V:
+        """查询条目，不改变条目的位置，也不计入频率和命中统计
+
+        Args:
+            key (K): 键
+
+        Raises:
+            KeyError: 键不在缓存中
+
+        Returns:
+            V: 值
+        """
+        return self._index.get(key=key)._val._val
+
+    def get_or_put(self, key: K, compute: Callable[[], V]) -> V:
+        """查询条目，未命中时调用 compute 计算值并放入缓存；整个过程只算一次访问，只计入一次频率
+
+        Args:
+            key (K): 键
+            compute (Callable[[], V]): 未命中时计算值的函数
+
+        Returns:
+            V: 值
+        """
+        self._sketch.add(item=key)
+        if key in self._index:
+            node: DequeNode[TinyLFUEntry[K, V]] = self._index.get(key=key)
+            self._hits += 1
+            self._on_hit(node=node)
+            return node._val._val
+        self._misses += 1
+        val: V = compute()
+        self._put(key=key, val=val) # compute 中可能已经放入了该键（例如递归的函数），_put 会将其视为更新
+        return val
+
+    def put(self, key: K, val: V) -> None:
+        """新增或更新条目，新条目进入窗口区，窗口区超出容量时触发淘汰
+
+        Args:
+            key (K): 键
+            val (V): 值
+        """
+        self._sketch.add(item=key)
+        self._put(key=key, val=val)
+
+    def _put(self, key: K, val: V) -> None:
+        """新增或更新条目，不计入频率
+
+        Args:
+            key (K): 键
+            val (V): 值
+        """
+        if key in self._index: # 键存在，更新值并视为一次访问
+            node: DequeNode[TinyLFUEntry[K, V]] = self._index.get(key=key)
+            node._val._val = val
+            self._on_hit(node=node)
+            return
+        entry: TinyLFUEntry[K, V] = TinyLFUEntry(key=key, val=val, region=WTinyLFUCache.WINDOW)
+        self._index.put(key=key, val=self._segments[WTinyLFUCache.WINDOW].add_front(item=entry))
+        self._modcount += 1
+        if len(self._segments[WTinyLFUCache.WINDOW]) > self._window_capacity:
+            self._evict()
+
+    def remove(self, key: K) -> None:
+        """删除条目
+
+        Args:
+            key (K): 待删除的键
+
+        Raises:
+            KeyError: 键不在缓存中
+        """
+        node: DequeNode[TinyLFUEntry[K, V]] = self._index.get(key=key)
+        self._index.remove(key=key)
+        self._segments[node._val._region].remove_node(node=node)
+        self._modcount += 1
+
+    def stats(self) -> CacheStats:
+        """查看命中统计
+
+        Returns:
+            CacheStats: 命中统计
+        """
+        total: int = self._hits + self._misses
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            hit_ratio=self._hits / total if total else 0.0
+        )
+
+    def reset_stats(self) -> None:
+        """清空命中统计"""
+        self._hits = self._misses = self._evictions = 0
+
+    def _entries(self) -> Generator[Tuple[K, V], None, None]:
+        """依次遍历窗口区、受保护段和试用段中的条目，每个区域内从最近使用到最久未使用
+
+        Yields:
+            Generator[Tuple[K, V], None, None]: (键, 值)
+        """
+        region: int
+        for region in (WTinyLFUCache.WINDOW, WTinyLFUCache.PROTECTED, WTinyLFUCache.PROBATION):
+            cur: Optional[DequeNode[TinyLFUEntry[K, V]]] = self._segments[region]._head
+            while cur is not None:
+                yield (cur._val._key, cur._val._val)
+                cur = cur._next
+
+    def keys(self) -> KeysView[K]:
+        """查看所有键
+
+        Returns:
+            KeysView[K]: 惰性遍历的键视图
+        """
+        return KeysView[K](mapping=self)
+
+    def values(self) -> ValuesView[V]:
+        """查看所有值
+
+        Returns:
+            ValuesView[V]: 惰性遍历的值视图
+        """
+        return ValuesView[V](mapping=self)
+
+    def items(self) -> ItemsView[Tuple[K, V]]:
+        """查看所有条目
+
+        Returns:
+            ItemsView[Tuple[K, V]]: 惰性遍历的键值对视图
+        """
+        return ItemsView[Tuple[K, V]](mapping=self)
+
+    def __getitem__(self, key: K) -> V:
+        """查询条目
+
+        Args:
+            key (K): 键
+
+        Returns:
+            V: 值
+        """
+        return self.get(key=key)
+
+    def __setitem__(self, key: K, val: V) -> None:
+        """新增或更新条目
+
+        Args:
+            key (K): 键
+            val (V): 值
+        """
+        self.put(key=key, val=val)
+
+    def __delitem__(self, key: K) -> None:
+        """删除条目
+
+        Args:
+            key (K): 待删除的键
+        """
+        self.remove(key=key)
+
+    def __len__(self) -> int:
+        """查看条目数量
+
+        Returns:
+            int: 条目数量
+        """
+        return len(self._index)
+
+    def __contains__(self, key: K) -> bool:
+        """缓存中是否存在指定键（不改变条目的位置，也不计入频率和命中统计）
+
+        Args:
+            key (K): 键
+
+        Returns:
+            bool: 键在缓存中是否存在
+        """
+        return key in self._index
+
+    def __iter__(self) -> Iterator:
+        """使自身可迭代
+
+        Returns:
+            Iterator: 键视图的迭代器
+        """
+        return iter(self.keys())
+
+
+
+class ExpiringEntry(Generic[K, V]):
+    """带过期时间的条目"""
+    def __init__(self, key: K, val: V, expires_at: float, deadline: int) -> None:
+        """构造方法
+
+        Args:
+            key (K): 键
+            val (V): 值
+            expires_at (float): 过期时刻，为无穷大时永不过期
+            deadline (int): 过期时刻所在的时间轮刻度（向上取整，保证不会提前过期）
+        """
+        self._key: K = key
+        self._val: V = val
+        self._expires_at: float = expires_at
+        self._deadline: int = deadline
+        self._slot: Optional[LinkedListDeque[ExpiringEntry[K, V]]] = None # 所在的时间轮槽位，永不过期时为 None
+        self._node: Optional[DequeNode[ExpiringEntry[K, V]]] = None # 在槽位中所在的节点
+
+class ExpiringMap(Generic[K, V]):
+    """
+    键值对会按存活时间（TTL）过期的映射；
+    过期时刻登记在分层时间轮中：第 0 层每个槽位对应一个刻度，第 i 层每个槽位对应第 i - 1 层转一整圈的时长，
+    登记和取消都只是在槽位（双向链表）中 O(1) 地增删节点，刷新存活时间不会像堆那样留下无用的旧记录；
+    tick 推进时间轮，低层转完一圈时将上一层对应槽位中的条目重新分配到更低的层，第 0 层当前槽位中的条目即为到期的条目；
+    访问时也会检查条目是否过期（惰性过期），因此即使很久没有调用 tick 也不会读到过期的值，tick 只负责回收空间；
+    len 中可能包含已经过期但尚未回收的键
+    """
+    def __init__(self, ttl: Optional[float] = None, tick_size: float = 1.0, wheel_bits: int = 6, levels: int = 4, clock: Callable[[], float] = monotonic) -> None:
+        """构造方法
+
+        Args:
+            ttl (Optional[float], optional): 默认的存活时间，为 None 时默认永不过期. Defaults to None.
+            tick_size (float, optional): 每个刻度的时长. Defaults to 1.0.
+            wheel_bits (int, optional): 每层时间轮的槽位数为 2 ** wheel_bits. Defaults to 6.
+            levels (int, optional): 时间轮的层数，超出最高层范围的条目会在最高层中多转几圈. Defaults to 4.
+            clock (Callable[[], float], optional): 时钟，需要单调不减. Defaults to monotonic.
+
+        Raises:
+            ValueError: 参数不是正数
+        """
+        if ((ttl is not None) and (ttl <= 0)) or (tick_size <= 0) or (wheel_bits <= 0) or (levels <= 0):
+            raise ValueError("存活时间、刻度时长、槽位数和层数必须是正数")
+        self._ttl: Optional[float] = ttl
+        self._tick_size: float = tick_size
+        self._bits: int = wheel_bits
+        self._mask: int = (1 << wheel_bits) - 1
+        self._levels: int = levels
+        self._clock: Callable[[], float] = clock
+        self._wheels: List[List[LinkedListDeque[ExpiringEntry[K, V]]]] = [[LinkedListDeque[ExpiringEntry[K, V]]() for _ in range(1 << wheel_bits)] for _ in range(levels)] # 每层时间轮的槽位
+        self._current: int = ceil(self._clock() / tick_size) # 已经处理到的刻度
+        self._pending: Optional[LinkedListDeque[ExpiringEntry[K, V]]] = None # 当前刻度从第 0 层取下的槽位，因批量限制尚未处理完时不为 None
+        self._index: HashMapOpenAddressing[K, ExpiringEntry[K, V]] = HashMapOpenAddressing[K, ExpiringEntry[K, V]]() # {键：条目}
+        self._modcount: int = 0 # 结构性修改的次数，用于在视图迭代过程中检测修改
+        self._expirations: int = 0 # 过期（包括惰性过期）的条目数量
+
+    def _schedule(self, entry: ExpiringEntry[K, V]) -> None:
+        """根据距离当前刻度的远近将条目登记到对应层的槽位中
+
+        Args:
+            entry (ExpiringEntry[K, V]): 条目
+        """
+        deadline: int = max(entry._deadline, self._current + 1) # 已经过了的刻度不会再被处理，放到下一个刻度
+        delta: int = deadline - self._current
+        level: int = 0
+        while (level < self._levels - 1) and (delta >> (self._bits * (level + 1)) > 0): # 找到能够容纳该距离的最低层
+            level += 1
+        entry._slot = self._wheels[level][(deadline >> (self._bits * level)) & self._mask]
+        entry._node = entry._slot.add_rear(item=entry)
+
+    def _cancel(self, entry: ExpiringEntry[K, V]) -> None:
+        """从时间轮中取消条目的登记
+
+        Args:
+            entry (ExpiringEntry[K, V]): 条目
+        """
+        if entry._slot is not None:
+            entry._slot.remove_node(node=entry._node) # type: ignore
+            entry._slot = entry._node = None
+
+    def _cascade(self) -> None:
+        """低层转完一圈时，将上一层当前槽位中的条目重新分配到更低的层"""
+        level: int = 1
+        while (level < self._levels) and ((self._current >> (self._bits * (level - 1))) & self._mask == 0):
+            idx: int = (self._current >> (self._bits * level)) & self._mask
+            slot: LinkedListDeque[ExpiringEntry[K, V]] = self._wheels[level][idx]
+            self._wheels[level][idx] = LinkedListDeque[ExpiringEntry[K, V]]() # 先换上空的槽位，超出最高层范围的条目可能被重新分配回同一个槽位
+            while not slot.is_empty():
+                entry: ExpiringEntry[K, V] = slot.remove_front()
+                if entry._deadline <= self._current: # 恰好在当前刻度到期，直接放入随后就要处理的第 0 层当前槽位（_schedule 会将其推迟到下一个刻度）
+                    entry._slot = self._wheels[0][self._current & self._mask]
+                    entry._node = entry._slot.add_rear(item=entry)
+                else:
+                    self._schedule(entry=entry)
+            level += 1
+
+    def _next_event(self, target: int) -> int:
+        """查找下一个需要处理的刻度：第 0 层非空槽位对应的刻度，或上层非空槽位被重新分配的刻度；
+        每层最多检查一圈槽位，因此跳过一段空闲时间的代价与跳过的刻度数无关
+
+        Args:
+            target (int): 目标刻度
+
+        Returns:
+            int: 下一个需要处理的刻度，不超过目标刻度（且大于当前刻度）
+        """
+        result: int = target
+        level: int
+        for level in range(self._levels):
+            shift: int = self._bits * level
+            block: int = (self._current >> shift) + 1 # 该层下一个被访问的槽位所对应的块，块的起点即访问的刻度
+            step: int
+            for step in range(self._mask + 1):
+                if (block + step) << shift >= result: # 不会早于已经找到的刻度
+                    break
+                if not self._wheels[level][(block + step) & self._mask].is_empty():
+                    result = (block + step) << shift
+                    break
+        return result
+
+    def _expire(self, entry: ExpiringEntry[K, V]) -> None:
+        """删除已经过期的条目
+
+        Args:
+            entry (ExpiringEntry[K, V]): 条目
+        """
+        self._cancel(entry=entry)
+        self._index.remove(key=entry._key)
+        self._expirations += 1
+        self._modcount += 1
+
+    def tick(self, now: Optional[float] = None, limit: Optional[int] = None) -> int:
+        """推进时间轮并回收到期的条目
+
+        Args:
+            now (Optional[float], optional): 当前时刻，为 None 时读取时钟. Defaults to None.
+            limit (Optional[int], optional): 本次最多回收的条目数量，达到后立即返回，剩余的留到下次调用，为 None 时不限制；
+                没有条目的刻度会被整段跳过，因此单次调用的耗时只与需要处理的槽位有关. Defaults to None.
+
+        Returns:
+            int: 本次回收的条目数量
+        """
+        target: int = floor((self._clock() if now is None else now) / self._tick_size)
+        reclaimed: int = 0
+        while True:
+            if self._pending is None:
+                if self._current >= target:
+                    break
+                if len(self._index) == 0: # 没有条目，直接跳到目标刻度
+                    self._current = target
+                    break
+                self._current = self._next_event(target=target) # 跳过中间没有条目需要处理的刻度
+                self._cascade()
+                idx: int = self._current & self._mask
+                if self._wheels[0][idx].is_empty():
+                    continue
+                self._pending = self._wheels[0][idx]
+                self._wheels[0][idx] = LinkedListDeque[ExpiringEntry[K, V]]() # 先换上空的槽位，只有一层时超出范围的条目会被重新登记到同一个槽位
+            while not self._pending.is_empty():
+                if (limit is not None) and (reclaimed >= limit):
+                    return reclaimed
+                entry: ExpiringEntry[K, V] = self._pending.peek_front()
+                if entry._deadline > self._current: # 超出范围的条目还没有到期，需要再转几圈
+                    self._pending.remove_front()
+                    self._schedule(entry=entry)
+                else:
+                    self._expire(entry=entry)
+                    reclaimed += 1
+            self._pending = None
+        return reclaimed
+
+    def put(self, key: K, val: V, ttl: Optional[float] = None) -> None:
+        """新增或更新键值对，更新时存活时间重新计算
+
+        Args:
+            key (K): 键
+            val (V): 值
+            ttl (Optional[float], optional): 存活时间，为 None 时采用默认的存活时间. Defaults to None.
+
+        Raises:
+            ValueError: 存活时间不是正数
+        """
+        if ttl is None:
+            ttl = self._ttl
+        elif ttl <= 0:
+            raise ValueError("存活时间必须是正数")
+        expires_at: float = self._clock() + ttl if ttl is not None else inf
+        deadline: int = ceil(expires_at / self._tick_size) if ttl is not None else -1
+        if key in self._index: # 取消旧的登记
+            entry: ExpiringEntry[K, V] = self._index.get(key=key)
+            self._cancel(entry=entry)
+            entry._val = val
+            entry._expires_at = expires_at
+            entry._deadline = deadline
+        else:
+            entry = ExpiringEntry(key=key, val=val, expires_at=expires_at, deadline=deadline)
+            self._index.put(key=key, val=entry)
+            self._modcount += 1
+        if ttl is not None:
+            self._schedule(entry=entry)
+
+    def _live(self, key: K) -> Optional[ExpiringEntry[K, V]]:
+        """查找未过期的条目，发现已经过期时顺便删除
+
+        Args:
+            key (K): 键
+
+        Returns:
+            Optional[ExpiringEntry[K, V]]: 条目，键不存在或已过期时为 None
+        """
+        if key not in self._index:
+            return None
+        entry: ExpiringEntry[K, V] = self._index.get(key=key)
+        if entry._expires_at <= self._clock(): # 惰性过期
+            self._expire(entry=entry)
+            return None
+        return entry
+
+    def get(self, key: K) -> V:
+        """查询键值对
+
+        Args:
+            key (K): 键
+
+        Raises:
+            KeyError: 键不存在或已过期
+
+        Returns:
+            V: 值
+        """
+        entry: Optional[ExpiringEntry[K, V]] = self._live(key=key)
+        if entry is None:
+            raise KeyError(f"{key}不存在或已过期")
+        return entry._val
+
+    def peek(self, key: K) -> V:
+        """查询键值对，发现已经过期时不回收
+
+        Args:
+            key (K): 键
+
+        Raises:
+            KeyError: 键不存在或已过期
+
+        Returns:
+            V: 值
+        """
+        if key in self._index:
+            entry: ExpiringEntry[K, V] = self._index.get(key=key)
+            if entry._expires_at > self._clock():
+                return entry._val
+        raise KeyError(f"{key}不存在或已过期")
+
+    def ttl(self, key: K) -> float:
+        """查看剩余的存活时间
+
+        Args:
+            key (K): 键
+
+        Raises:
+            KeyError: 键不存在或已过期
+
+        Returns:
+            float: 剩余的存活时间，永不过期时为无穷大
+        """
+        entry: Optional[ExpiringEntry[K, V]] = self._live(key=key)
+        if entry is None:
+            raise KeyError(f"{key}不存在或已过期")
+        return entry._expires_at - self._clock()
+
+    def remove(self, key: K) -> None:
+        """删除键值对
+
+        Args:
+            key (K): 待删除的键
+
+        Raises:
+            KeyError: 键不存在
+        """
+        entry: ExpiringEntry[K, V] = self._index.get(key=key)
+        self._cancel(entry=entry)
+        self._index.remove(key=key)
+        self._modcount += 1
+
+    def expirations(self) -> int:
+        """查看过期的条目数量（包括 tick 回收的和访问时惰性删除的）
+
+        Returns:
+            int: 过期的条目数量
+        """
+        return self._expirations
+
+    def _entries(self) -> Generator[Tuple[K, V], None, None]:
+        """依次遍历所有未过期的键值对（遍历时不删除过期的条目）
+
+        Yields:
+            Generator[Tuple[K, V], None, None]: (键, 值)
+        """
+        now: float = self._clock()
+        key: K
+        entry: ExpiringEntry[K, V]
+        for key, entry in self._index.items():
+            if entry._expires_at > now:
+                yield (key, entry._val)
+
+    def keys(self) -> KeysView[K]:
+        """查看所有键
+
+        Returns:
+            KeysView[K]: 惰性遍历的键视图
+        """
+        return KeysView[K](mapping=self)
+
+    def values(self) -> ValuesView[V]:
+        """查看所有值
+
+        Returns:
+            ValuesView[V]: 惰性遍历的值视图
+        """
+        return ValuesView[V](mapping=self)
+
+    def items(self) -> ItemsView[Tuple[K, V]]:
+        """查看所有键值对
+
+        Returns:
+            ItemsView[Tuple[K, V]]: 惰性遍历的键值对视图
+        """
+        return ItemsView[Tuple[K, V]](mapping=self)
+
+    def __getitem__(self, key: K) -> V:
+        """查询键值对
+
+        Args:
+            key (K): 键
+
+        Returns:
+            V: 值
+        """
+        return self.get(key=key)
+
+    def __setitem__(self, key: K, val: V) -> None:
+        """以默认的存活时间新增或更新键值对
+
+        Args:
+            key (K): 键
+            val (V): 值
+        """
+        self.put(key=key, val=val)
+
+    def __delitem__(self, key: K) -> None:
+        """删除键值对
+
+        Args:
+            key (K): 待删除的键
+        """
+        self.remove(key=key)
+
+    def __len__(self) -> int:
+        """查看键值对数量（可能包含已经过期但尚未回收的键）
+
+        Returns:
+            int: 键值对数量
+        """
+        return len(self._index)
+
+    def __contains__(self, key: K) -> bool:
+        """是否存在未过期的指定键
+
+        Args:
+            key (K): 键
+
+        Returns:
+            bool: 键是否存在且未过期
+        """
+        return self._live(key=key) is not None
+
+    def __iter__(self) -> Iterator:
+        """使自身可迭代
+
+        Returns:
+            Iterator: 键视图的迭代器
+        """
+        return iter(self.keys())
+
+
+
+def memoize(cache: LRUCache | WTinyLFUCache, key: Callable[..., Hashable]) -> Callable[[Callable[..., V]], Callable[..., V]]:
+    """函数结果的缓存装饰器；缓存的是结果本身而不是副本，调用方不应修改返回的结果
+
+    Args:
+        cache (LRUCache | WTinyLFUCache): 存放结果的缓存，多个函数共用一个缓存时 key 需要能够区分函数
+        key (Callable[..., Hashable]): 由函数的参数计算缓存的键，例如图算法可以取 (graph.version, start_vertex)
+
+    Returns:
+        Callable[[Callable[..., V]], Callable[..., V]]: 装饰器
+    """
+    def decorator(func: Callable[..., V]) -> Callable[..., V]:
+        @wraps(func)
+        def wrapper(*args, **kwargs) -> V:
+            return cache.get_or_put(key=key(*args, **kwargs), compute=lambda: func(*args, **kwargs)) # 未命中时调用函数后放入缓存
+        wrapper.cache = cache # type: ignore # 便于查看命中统计
+        return wrapper
+    return decorator
+
+
+
+if __name__ == "__main__":
+    c: LRUCache[int, str] = LRUCache[int, str](max_entries=3)
+    for i in range(4):
+        c[i] = str(object=i)
+    c.get(key=1) # 1 变为最近使用，2 成为最久未使用
+    c[4] = "4"
+    print(list(c.items()), c.stats().evictions) # [(4, '4'), (1, '1'), (3, '3')] 2
+    w: LRUCache[str, str] = LRUCache[str, str](max_weight=10, weigher=lambda key, val: len(val))
+    w["a"] = "aaaa"
+    w["b"] = "bbbb"
+    w["c"] = "ccc" # 总权重超过 10，淘汰 a
+    print(list(w.keys()), w.weight())
+
+    from Graph import Graph, dijkstra, floyd
+    g: Graph[int] = Graph[int]()
+    for i in range(5):
+        g.set_edge(from_vertex=i, to_vertex=(i + 1) % 5, weight=i + 1)
+    cache: LRUCache = LRUCache(max_entries=64)
+    cached_dijkstra = memoize(cache=cache, key=lambda graph, start_vertex: ("dijkstra", graph.version, start_vertex))(dijkstra)
+    cached_floyd = memoize(cache=cache, key=lambda graph: ("floyd", graph.version))(floyd)
+    for _ in range(3):
+        cached_dijkstra(graph=g, start_vertex=0)
+        cached_floyd(graph=g)
+    g.set_edge(from_vertex=0, to_vertex=2, weight=1) # 修改图后版本号改变，不会再命中旧的结果
+    print(cached_dijkstra(graph=g, start_vertex=0)[0][2])
+    stats: CacheStats = cache.stats()
+    print(stats.hits, stats.misses, stats.hit_ratio)
+    print("-------按存活时间过期-------")
+    now: List[float] = [0.0] # 模拟的时钟
+    sessions: ExpiringMap[str, int] = ExpiringMap[str, int](ttl=30, clock=lambda: now[0])
+    sessions["alice"] = 1
+    sessions.put(key="bob", val=2, ttl=5)
+    sessions.put(key="carol", val=3, ttl=3600)
+    now[0] = 10
+    print("bob" in sessions, sessions.ttl(key="alice")) # 访问时惰性过期：False 20.0
+    sessions["alice"] = 1 # 刷新存活时间，旧的登记被直接取消
+    now[0] = 100
+    print(sessions.tick(), list(sessions.keys()), sessions.expirations()) # 1 ['carol'] 2
+
+    from sys import argv
+    if "--bench" in argv: # 基准测试耗时数秒，需要时用 python Cache.py --bench 运行
+        print("-------命中率基准测试-------")
+        from random import Random
+        from itertools import accumulate
+
+        def zipf_trace(length: int, universe: int, s: float, rng: Random) -> List[int]:
+            """生成服从 Zipf 分布的访问序列（第 i 个键被访问的概率正比于 1 / i^s）"""
+            cum_weights: List[float] = list(accumulate(1 / (i + 1) ** s for i in range(universe)))
+            return rng.choices(range(universe), cum_weights=cum_weights, k=length)
+
+        def scan_trace(length: int, universe: int, s: float, scan_every: int, scan_length: int, rng: Random) -> List[int]:
+            """在 Zipf 访问序列中周期性地插入只访问一次的全表扫描"""
+            trace: List[int] = []
+            base: List[int] = zipf_trace(length=length, universe=universe, s=s, rng=rng)
+            next_scan_key: int = universe # 扫描的键与热点键不重叠，且每次扫描的键都不相同
+            for i in range(0, length, scan_every):
+                trace.extend(base[i:i + scan_every])
+                trace.extend(range(next_scan_key, next_scan_key + scan_length))
+                next_scan_key += scan_length
+            return trace
+
+        def replay(cache: LRUCache | WTinyLFUCache, trace: List[int]) -> float:
+            """重放访问序列，未命中时将键放入缓存，返回命中率"""
+            for key in trace:
+                cache.get_or_put(key=key, compute=lambda: key)
+            return cache.stats().hit_ratio
+
+        rng: Random = Random(0)
+        traces = {
+            "zipf": zipf_trace(length=20000, universe=5000, s=0.9, rng=rng),
+            "zipf+scan": scan_trace(length=20000, universe=5000, s=0.9, scan_every=2000, scan_length=500, rng=rng)
+        }
+        for name, trace in traces.items():
+            for capacity in (125, 500):
+                lru: float = replay(cache=LRUCache[int, int](max_entries=capacity), trace=trace)
+                tiny: float = replay(cache=WTinyLFUCache[int, int](max_entries=capacity, seed=0), trace=trace) # 固定草图的种子，结果可以复现
+                print(f"{name:<10}容量{capacity:<6}LRU 命中率 {lru:.3f}    W-TinyLFU 命中率 {tiny:.3f}")
\ No newline at end of file
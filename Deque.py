@@ -163,11 +163,14 @@ class LinkedListDeque(Generic[T]):
         self._tail: Optional[Node[T]] = None # 尾节点
         self._size: int = 0 # 队列长度
 
-    def add_rear(self, item: T) -> None:
+    def add_rear(self, item: T) -> Node[T]:
         """队尾入队
 
         Args:
             item (T): 待入队元素
+
+        Returns:
+            Node[T]: 元素所在的节点，可用于之后 O(1) 地删除或移动该元素
         """
         data: Node[T] = Node[T](val=item)
         if self._head is None: # 队列为空，入队的是第一个元素
@@ -177,12 +180,16 @@ class LinkedListDeque(Generic[T]):
             data._prev = self._tail
             self._tail = data
         self._size += 1
+        return data
 
-    def add_front(self, item: T) -> None:
+    def add_front(self, item: T) -> Node[T]:
         """队首入队
 
         Args:
             item (T): 待入队元素
+
+        Returns:
+            Node[T]: 元素所在的节点，可用于之后 O(1) 地删除或移动该元素
         """
         data: Node[T] = Node[T](val=item)
         if self._head is None: # 队列为空，入队的是第一个元素
@@ -192,6 +199,46 @@ class LinkedListDeque(Generic[T]):
             data._next = self._head
             self._head = data
         self._size += 1
+        return data
+
+    def remove_node(self, node: Node[T]) -> T:
+        """删除队列中的指定节点（节点必须属于当前队列）
+
+        Args:
+            node (Node[T]): 入队时返回的节点
+
+        Returns:
+            T: 节点中的元素
+        """
+        if node._prev is None: # 节点是队首
+            self._head = node._next
+        else:
+            node._prev._next = node._next
+        if node._next is None: # 节点是队尾
+            self._tail = node._prev
+        else:
+            node._next._prev = node._prev
+        node._prev = node._next = None # 便于内存回收
+        self._size -= 1
+        return node._val
+
+    def move_to_front(self, node: Node[T]) -> None:
+        """将队列中的指定节点移到队首（节点必须属于当前队列）
+
+        Args:
+            node (Node[T]): 入队时返回的节点
+        """
+        if node is self._head:
+            return
+        node._prev._next = node._next # type: ignore # 节点不是队首，一定有前一个节点
+        if node._next is None: # 节点是队尾
+            self._tail = node._prev
+        else:
+            node._next._prev = node._prev
+        node._prev = None
+        node._next = self._head
+        self._head._prev = node # type: ignore
+        self._head = node
 
     def remove_front(self) -> T:
         """队首出队
@@ -1,12 +1,16 @@
-from typing import Generic, List, Optional, Tuple, TypeVar, Hashable
-from copy import deepcopy
+from typing import Generic, Iterable, Iterator, List, Optional, Sequence, Tuple, TypeVar, Hashable, Union
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+import os
 
 from HashMap import HashMapOpenAddressing as HashMap
 from Queue import ArrayQueue
 from Array import DynamicArray
 from LinkedList import LinkedList
-from UnionFindSet import UnionFindSet
+from UnionFindSet import UnionFindSet, IntUnionFind
 from Stack import ArrayStack
+from Heap import IndexedMinPriorityQueue, Pair
 
 
 
@@ -62,11 +66,32 @@ class Vertex(Generic[T]):
 
 class Graph(Generic[T]):
     """图"""
+    _clock: int = 0 # 所有图共享的版本时钟
+
     def __init__(self) -> None:
         """构造方法"""
         self.vertexes: HashMap[T, Vertex] = HashMap[T, Vertex]() # {顶点的唯一标识：顶点}
         self.vertexes_num: int = 0 # 顶点数量
         self.edges_num: int = 0 # 边的数量
+        self.version: int = Graph._tick() # 版本号，每次修改都会更新
+
+    @staticmethod # 静态方法
+    def _tick() -> int:
+        """从全局递增的时钟取一个新的版本号，使得不同的图（以及同一个图修改前后）的版本号互不相同，可以直接用作缓存的键
+
+        Returns:
+            int: 新的版本号
+        """
+        Graph._clock += 1
+        return Graph._clock
+
+    def get_version(self) -> int:
+        """查询版本号
+
+        Returns:
+            int: 当前的版本号
+        """
+        return self.version
 
     def add_vertex(self, vertex: T) -> None:
         """添加顶点
@@ -78,6 +103,18 @@ class Graph(Generic[T]):
             return
         self.vertexes[vertex] = Vertex(val=vertex)
         self.vertexes_num += 1
+        self.version = Graph._tick()
+
+    def add_vertexes(self, vertexes: Sequence[T]) -> None:
+        """批量添加顶点，一次性为顶点表预留容量
+
+        Args:
+            vertexes (Sequence[T]): 待添加的顶点（已存在的顶点会被跳过）
+        """
+        self.vertexes.reserve(n=self.vertexes_num + len(vertexes))
+        vertex: T
+        for vertex in vertexes:
+            self.add_vertex(vertex=vertex)
 
     def set_edge(self, from_vertex: T, to_vertex: T, weight: int = 1) -> None:
         """添加或更新边
@@ -100,6 +137,7 @@ class Graph(Generic[T]):
         # 边存在，更新边权
         self.vertexes[from_vertex].to_edges[to_vertex] = weight
         self.vertexes[to_vertex].from_edges[from_vertex] = weight
+        self.version = Graph._tick()
 
     def remove_vertex(self, vertex: T) -> None:
         """删除顶点
@@ -127,6 +165,7 @@ class Graph(Generic[T]):
                     self.vertexes[i].to_degree -= 1
                 del self.vertexes[v]
                 self.vertexes_num -= 1
+                self.version = Graph._tick()
                 return
         raise ValueError(f"顶点{vertex}在图中不存在")
     
@@ -147,6 +186,7 @@ class Graph(Generic[T]):
                 del self.vertexes[to_vertex].from_edges[from_vertex]
                 self.vertexes[to_vertex].from_degree -= 1
                 self.edges_num -= 1
+                self.version = Graph._tick()
                 return
         raise ValueError(f"边{from_vertex} --> {to_vertex}在图中不存在")
     
@@ -219,14 +259,372 @@ class Graph(Generic[T]):
         """
         return vertex in self.vertexes
 
+    # 以下查询接口同样由 CSRGraph 实现，图算法只依赖这些接口，因此可以同时接受两种图
+    def get_vertexes(self) -> Iterator[T]:
+        """遍历所有顶点
+
+        Returns:
+            Iterator[T]: 顶点迭代器
+        """
+        return iter(self.vertexes)
+
+    def get_neighbors(self, vertex: T) -> Iterable[Tuple[T, int]]:
+        """查询顶点的所有出边
+
+        Args:
+            vertex (T): 顶点
+
+        Returns:
+            Iterable[Tuple[T, int]]: (终点, 边权)
+        """
+        return self.vertexes[vertex].to_edges.items()
+
+    def get_predecessors(self, vertex: T) -> Iterable[Tuple[T, int]]:
+        """查询顶点的所有入边
+
+        Args:
+            vertex (T): 顶点
+
+        Returns:
+            Iterable[Tuple[T, int]]: (起点, 边权)
+        """
+        return self.vertexes[vertex].from_edges.items()
+
+    def get_from_degree(self, vertex: T) -> int:
+        """查询顶点的入度
+
+        Args:
+            vertex (T): 顶点
+
+        Returns:
+            int: 入度
+        """
+        return self.vertexes[vertex].from_degree
+
+    def get_to_degree(self, vertex: T) -> int:
+        """查询顶点的出度
+
+        Args:
+            vertex (T): 顶点
+
+        Returns:
+            int: 出度
+        """
+        return self.vertexes[vertex].to_degree
+
+    def get_edges(self) -> Iterator[Tuple[T, T, int]]:
+        """遍历所有边
+
+        Returns:
+            Iterator[Tuple[T, T, int]]: (起点, 终点, 边权)
+        """
+        from_vertex: T
+        for from_vertex in self.vertexes: # type: ignore
+            to_vertex: T
+            weight: int
+            for to_vertex, weight in self.vertexes[from_vertex].to_edges.items():
+                yield (from_vertex, to_vertex, weight)
+
+    def freeze(self) -> "CSRGraph[T]":
+        """转换为只读的压缩稀疏行格式
+
+        Returns:
+            CSRGraph[T]: 只读图
+        """
+        return CSRGraph[T](graph=self)
+
+
+
+class CSRGraph(Generic[T]):
+    """
+    压缩稀疏行（CSR）格式的只读图；
+    顶点被重新编号为 0 ~ n-1 的连续整数，顶点 i 的出边终点和边权分别存放在
+    targets[offsets[i]:offsets[i + 1]] 和 weights[offsets[i]:offsets[i + 1]] 中，
+    入边以同样的方式存放在 in_offsets、in_sources 和 in_weights 中；
+    所有边都存放在连续的数组中，不再需要为每个顶点和每条边分配对象；
+    图算法遇到只读图时直接用 offsets 和 targets 按编号遍历出边，visited、距离等状态存放在按编号索引的 bytearray 和 array 中，只在返回结果时转换回顶点
+    """
+    def __init__(self, graph: Graph[T]) -> None:
+        """构造方法
+
+        Args:
+            graph (Graph[T]): 待转换的图
+        """
+        n: int = len(graph)
+        self.labels: List[T] = list(graph.vertexes) # {编号：顶点}
+        self.ids: HashMap[T, int] = HashMap[T, int].from_items(items=zip(self.labels, range(n)), size_hint=n) # {顶点：编号}
+        self.offsets: array
+        self.targets: array
+        self.weights: array
+        self.offsets, self.targets, self.weights = self._compress(graph=graph, reverse=False)
+        self.in_offsets: array
+        self.in_sources: array
+        self.in_weights: array
+        self.in_offsets, self.in_sources, self.in_weights = self._compress(graph=graph, reverse=True)
+        self.version: int = Graph._tick() # 版本号，只读图不会再改变
+
+    def _compress(self, graph: Graph[T], reverse: bool) -> Tuple[array, array, array]:
+        """按顶点编号顺序压缩出边（或入边）
+
+        Args:
+            graph (Graph[T]): 待转换的图
+            reverse (bool): 是否压缩入边
+
+        Returns:
+            Tuple[array, array, array]: 偏移数组、相邻顶点编号数组、边权数组
+        """
+        offsets: array = array("q", bytes(8 * (len(self.labels) + 1)))
+        adjacent: array = array("q", bytes(8 * graph.size()))
+        weights: List[int] = [0] * graph.size()
+        idx: int = 0
+        i: int
+        for i in range(len(self.labels)):
+            edges: HashMap[T, int] = graph[self.labels[i]].from_edges if reverse else graph[self.labels[i]].to_edges
+            neighbor: T
+            weight: int
+            for neighbor, weight in edges.items():
+                adjacent[idx] = self.ids[neighbor]
+                weights[idx] = weight
+                idx += 1
+            offsets[i + 1] = idx
+        typecode: str = "q" if all(isinstance(weight, int) for weight in weights) else "d" # 边权不全是整数时改用双精度浮点数
+        return (offsets, adjacent, array(typecode, weights))
+
+    def get_vertexes(self) -> Iterator[T]:
+        """遍历所有顶点
+
+        Returns:
+            Iterator[T]: 顶点迭代器
+        """
+        return iter(self.labels)
+
+    def get_neighbors(self, vertex: T) -> Iterator[Tuple[T, int]]:
+        """查询顶点的所有出边
+
+        Args:
+            vertex (T): 顶点
+
+        Returns:
+            Iterator[Tuple[T, int]]: (终点, 边权)
+        """
+        idx: int = self.ids[vertex]
+        i: int
+        for i in range(self.offsets[idx], self.offsets[idx + 1]):
+            yield (self.labels[self.targets[i]], self.weights[i])
+
+    def get_predecessors(self, vertex: T) -> Iterator[Tuple[T, int]]:
+        """查询顶点的所有入边
+
+        Args:
+            vertex (T): 顶点
+
+        Returns:
+            Iterator[Tuple[T, int]]: (起点, 边权)
+        """
+        idx: int = self.ids[vertex]
+        i: int
+        for i in range(self.in_offsets[idx], self.in_offsets[idx + 1]):
+            yield (self.labels[self.in_sources[i]], self.in_weights[i])
+
+    def get_sources(self) -> array:
+        """展开每条出边的起点编号，与 targets、weights 按下标一一对应
+
+        Returns:
+            array: 起点编号数组
+        """
+        sources: array = array("q", bytes(8 * len(self.targets)))
+        idx: int
+        for idx in range(len(self.labels)):
+            i: int
+            for i in range(self.offsets[idx], self.offsets[idx + 1]):
+                sources[i] = idx
+        return sources
+
+    def get_from_degree(self, vertex: T) -> int:
+        """查询顶点的入度
+
+        Args:
+            vertex (T): 顶点
+
+        Returns:
+            int: 入度
+        """
+        idx: int = self.ids[vertex]
+        return self.in_offsets[idx + 1] - self.in_offsets[idx]
+
+    def get_to_degree(self, vertex: T) -> int:
+        """查询顶点的出度
+
+        Args:
+            vertex (T): 顶点
+
+        Returns:
+            int: 出度
+        """
+        idx: int = self.ids[vertex]
+        return self.offsets[idx + 1] - self.offsets[idx]
+
+    def get_edges(self) -> Iterator[Tuple[T, T, int]]:
+        """遍历所有边
+
+        Returns:
+            Iterator[Tuple[T, T, int]]: (起点, 终点, 边权)
+        """
+        from_idx: int
+        for from_idx in range(len(self.labels)):
+            i: int
+            for i in range(self.offsets[from_idx], self.offsets[from_idx + 1]):
+                yield (self.labels[from_idx], self.labels[self.targets[i]], self.weights[i])
+
+    def get_weight(self, from_vertex: T, to_vertex: T) -> int:
+        """查询边的权重
+
+        Args:
+            from_vertex (T): 待查询边的起点
+            to_vertex (T): 待查询边的终点
+
+        Raises:
+            ValueError: 待查询边在图中不存在
+
+        Returns:
+            int: 待查询边的边权
+        """
+        if (from_vertex in self.ids) and (to_vertex in self.ids):
+            from_idx: int = self.ids[from_vertex]
+            to_idx: int = self.ids[to_vertex]
+            i: int
+            for i in range(self.offsets[from_idx], self.offsets[from_idx + 1]):
+                if self.targets[i] == to_idx:
+                    return self.weights[i]
+        raise ValueError(f"边{from_vertex} --> {to_vertex}在图中不存在")
+
+    def thaw(self) -> Graph[T]:
+        """转换回可修改的图
+
+        Returns:
+            Graph[T]: 可修改的图
+        """
+        graph: Graph[T] = Graph[T]()
+        graph.add_vertexes(vertexes=self.labels)
+        i: int
+        for i in range(len(self.labels)): # 出入边的数量已知，预留容量
+            vertex: Vertex = graph.vertexes[self.labels[i]]
+            vertex.to_edges.reserve(n=self.offsets[i + 1] - self.offsets[i])
+            vertex.from_edges.reserve(n=self.in_offsets[i + 1] - self.in_offsets[i])
+        from_vertex: T
+        to_vertex: T
+        weight: int
+        for from_vertex, to_vertex, weight in self.get_edges():
+            graph.set_edge(from_vertex=from_vertex, to_vertex=to_vertex, weight=weight)
+        return graph
+
+    def get_version(self) -> int:
+        """查询版本号
+
+        Returns:
+            int: 版本号
+        """
+        return self.version
+
+    def __len__(self) -> int:
+        """查看顶点的数量
+
+        Returns:
+            int: 顶点的数量
+        """
+        return len(self.labels)
+
+    def size(self) -> int:
+        """查看边的数量
+
+        Returns:
+            int: 边的数量
+        """
+        return len(self.targets)
+
+    def __contains__(self, vertex: T) -> bool:
+        """判断顶点是否在图中
+
+        Args:
+            vertex (T): 待查询的对象
+
+        Returns:
+            bool: 顶点是否在图中
+        """
+        return vertex in self.ids
+
+
+
+GraphLike = Union[Graph[T], CSRGraph[T]] # 图算法可以接受的图
+
 
 
 # 不重不漏地访问图中的所有顶点
-def graph_bfs(graph: Graph[T], start_vertex: T) -> DynamicArray[T]:
+def _csr_bfs(graph: CSRGraph[T], start: int) -> array:
+    """只读图上的广度优先遍历，访问顺序数组本身就是队列
+
+    Args:
+        graph (CSRGraph[T]): 只读图
+        start (int): 起点的编号
+
+    Returns:
+        array: 按访问顺序排列的顶点编号
+    """
+    offsets: array = graph.offsets
+    targets: array = graph.targets
+    visited: bytearray = bytearray(len(graph))
+    visited[start] = 1
+    order: array = array("q", [start])
+    head: int = 0 # 队首在访问顺序数组中的位置
+    while head < len(order):
+        cur: int = order[head]
+        head += 1
+        i: int
+        for i in range(offsets[cur], offsets[cur + 1]):
+            if not visited[targets[i]]:
+                visited[targets[i]] = 1
+                order.append(targets[i])
+    return order
+
+
+def _csr_dfs(graph: CSRGraph[T], start: int) -> array:
+    """只读图上的深度优先遍历，用显式栈代替递归（访问顺序与递归版本相同）
+
+    Args:
+        graph (CSRGraph[T]): 只读图
+        start (int): 起点的编号
+
+    Returns:
+        array: 按访问顺序排列的顶点编号
+    """
+    offsets: array = graph.offsets
+    targets: array = graph.targets
+    visited: bytearray = bytearray(len(graph))
+    visited[start] = 1
+    order: array = array("q", [start])
+    stack: array = array("q", [start]) # 递归路径上的顶点
+    cursors: array = array("q", [offsets[start]]) # 栈中每个顶点下一条待检查的出边
+    while len(stack) > 0:
+        cursor: int = cursors[-1]
+        if cursor == offsets[stack[-1] + 1]: # 出边检查完毕，回溯
+            stack.pop()
+            cursors.pop()
+            continue
+        cursors[-1] = cursor + 1
+        target: int = targets[cursor]
+        if not visited[target]:
+            visited[target] = 1
+            order.append(target)
+            stack.append(target)
+            cursors.append(offsets[target])
+    return order
+
+
+def graph_bfs(graph: GraphLike[T], start_vertex: T) -> DynamicArray[T]:
     """广度优先遍历
 
     Args:
-        graph (Graph[T]): 图
+        graph (GraphLike[T]): 图
         start_vertex (T): 起点
 
     Raises:
@@ -238,26 +636,31 @@ def graph_bfs(graph: Graph[T], start_vertex: T) -> DynamicArray[T]:
     if start_vertex not in graph:
         raise ValueError(f"顶点{start_vertex}在图中不存在")
     result: DynamicArray[T] = DynamicArray[T]()
+    idx: int
+    if isinstance(graph, CSRGraph): # 只读图直接在编号上遍历
+        for idx in _csr_bfs(graph=graph, start=graph.ids[start_vertex]):
+            result.append(item=graph.labels[idx])
+        return result
     visited: HashMap[T, None] = HashMap[T, None]() # 用哈希表来实现集合
-    queue: ArrayQueue[Vertex] = ArrayQueue[Vertex]()
-    queue.enqueue(item=graph[start_vertex])
+    queue: ArrayQueue[T] = ArrayQueue[T]()
+    queue.enqueue(item=start_vertex)
     visited.put(key=start_vertex, val=None) # 需要在入队时添加，如果在出队时添加可能导致顶点重复入队
     while len(queue) > 0:
-        cur: Vertex = queue.dequeue()
-        result.append(item=cur.val)
+        cur: T = queue.dequeue()
+        result.append(item=cur)
         i: T
-        for i in cur.get_to_edges(): # type: ignore
+        for i, _ in graph.get_neighbors(vertex=cur):
             if i not in visited:
-                queue.enqueue(item=graph[i])
+                queue.enqueue(item=i)
                 visited.put(key=i, val=None)
     return result
 
 
-def graph_dfs(graph: Graph[T], start_vertex: T) -> DynamicArray[T]:
+def graph_dfs(graph: GraphLike[T], start_vertex: T) -> DynamicArray[T]:
     """深度优先遍历
 
     Args:
-        graph (Graph[T]): 图
+        graph (GraphLike[T]): 图
         start_vertex (T): 起点
 
     Raises:
@@ -269,12 +672,17 @@ def graph_dfs(graph: Graph[T], start_vertex: T) -> DynamicArray[T]:
     if start_vertex not in graph:
         raise ValueError(f"顶点{start_vertex}在图中不存在")
     result: DynamicArray[T] = DynamicArray[T]()
+    idx: int
+    if isinstance(graph, CSRGraph): # 只读图直接在编号上遍历
+        for idx in _csr_dfs(graph=graph, start=graph.ids[start_vertex]):
+            result.append(item=graph.labels[idx])
+        return result
     visited: HashMap[T, None] = HashMap[T, None]() # 用哈希表来实现集合
     def dfs(vertex: T) -> None:
         result.append(item=vertex)
         visited.put(key=vertex, val=None)
         i: T
-        for i in graph[vertex].get_to_edges(): # type: ignore
+        for i, _ in graph.get_neighbors(vertex=vertex):
             if i not in visited:
                 dfs(vertex=i)
     dfs(vertex=start_vertex)
@@ -283,68 +691,180 @@ def graph_dfs(graph: Graph[T], start_vertex: T) -> DynamicArray[T]:
 
 
 # 最短路径
-def dijkstra(graph: Graph[T], start_vertex: T) -> Tuple[HashMap[T, int], HashMap[T, LinkedList[T]]]:
+def _csr_dijkstra(graph: CSRGraph[T], start: int, target: int) -> Tuple[HashMap[T, int], HashMap[T, Optional[T]]]:
+    """只读图上的迪杰斯特拉算法，距离、前驱顶点和是否已确定最短距离都存放在按编号索引的数组中
+
+    Args:
+        graph (CSRGraph[T]): 只读图
+        start (int): 起点的编号
+        target (int): 终点的编号，为 -1 时不提前结束
+
+    Returns:
+        Tuple[HashMap[T, int], HashMap[T, Optional[T]]]: 与 heap_dijkstra 相同
+    """
+    n: int = len(graph)
+    offsets: array = graph.offsets
+    targets: array = graph.targets
+    weights: array = graph.weights
+    settled: bytearray = bytearray(n) # 是否已确定最短距离
+    distances: array = array(weights.typecode, bytes(8 * n)) # 暂定（或已确定）的距离
+    predecessors: array = array("q", [-1]) * n # 前驱顶点的编号，-1 表示起点或尚未发现
+    order: array = array("q") # 按确定最短距离的先后排列的顶点编号
+    queue: IndexedMinPriorityQueue[int, int] = IndexedMinPriorityQueue[int, int]()
+    queue.enqueue(item=Pair(obj=start, attr=0))
+    while len(queue) > 0:
+        cur: int = queue.dequeue().obj
+        settled[cur] = 1
+        order.append(cur)
+        if cur == target: # 终点的最短距离已确定
+            break
+        i: int
+        for i in range(offsets[cur], offsets[cur + 1]):
+            neighbor: int = targets[i]
+            if settled[neighbor]:
+                continue
+            new_distance: int = distances[cur] + weights[i]
+            if neighbor not in queue:
+                queue.enqueue(item=Pair(obj=neighbor, attr=new_distance))
+            elif new_distance < distances[neighbor]:
+                queue.decrease_key(obj=neighbor, attr=new_distance)
+            else:
+                continue
+            distances[neighbor] = new_distance
+            predecessors[neighbor] = cur
+    # 只在返回时将编号转换回顶点
+    labels: List[T] = graph.labels
+    shortest_distances: HashMap[T, int] = HashMap[T, int].from_items(items=((labels[idx], distances[idx]) for idx in order), size_hint=len(order))
+    discovered: List[int] = [idx for idx in range(n) if predecessors[idx] >= 0]
+    result: HashMap[T, Optional[T]] = HashMap[T, Optional[T]].from_items(items=((labels[idx], labels[predecessors[idx]]) for idx in discovered), size_hint=len(discovered) + 1)
+    result[labels[start]] = None
+    return (shortest_distances, result)
+
+
+def heap_dijkstra(graph: GraphLike[T], start_vertex: T, target_vertex: Optional[T] = None) -> Tuple[HashMap[T, int], HashMap[T, Optional[T]]]:
+    """基于带索引的小顶堆的迪杰斯特拉算法：
+    1. 每次从堆中取出暂定距离最小的顶点，其距离即为最短距离；
+    2. 找到更短路径时直接减小邻居在堆中的暂定距离，因此每个顶点在堆中至多只有一个条目；
+    3. 每个顶点只记录其最短路径上的前一个顶点，需要时再用 build_path 回溯出完整路径。
+
+    Args:
+        graph (GraphLike[T]): 图
+        start_vertex (T): 起点
+        target_vertex (Optional[T], optional): 终点，确定其最短距离后提前结束搜索. Defaults to None.
+
+    Raises:
+        ValueError: 起点对象在图中不存在
+
+    Returns:
+        Tuple[HashMap[T, int], HashMap[T, Optional[T]]]: 已确定的最短距离和前驱顶点（起点的前驱顶点为 None）；
+        提前结束时只有已确定最短距离的顶点的前驱顶点是可靠的
+    """
+    if start_vertex not in graph:
+        raise ValueError(f"顶点{start_vertex}在图中不存在")
+    if isinstance(graph, CSRGraph): # 只读图直接在编号上搜索
+        target: int = graph.ids[target_vertex] if (target_vertex is not None) and (target_vertex in graph) else -1
+        return _csr_dijkstra(graph=graph, start=graph.ids[start_vertex], target=target)
+    shortest_distances: HashMap[T, int] = HashMap[T, int]() # 已确定的最短距离
+    predecessors: HashMap[T, Optional[T]] = HashMap[T, Optional[T]]() # 最短路径中每个顶点的前一个顶点
+    predecessors[start_vertex] = None
+    queue: IndexedMinPriorityQueue[T, int] = IndexedMinPriorityQueue[T, int]() # 暂定距离
+    queue.enqueue(item=Pair(obj=start_vertex, attr=0))
+    while len(queue) > 0:
+        item: Pair[T, int] = queue.dequeue()
+        current_vertex: T = item.obj
+        current_distance: int = item.attr
+        shortest_distances[current_vertex] = current_distance
+        if current_vertex == target_vertex: # 终点的最短距离已确定
+            break
+        neighbor: T
+        weight: int
+        for neighbor, weight in graph.get_neighbors(vertex=current_vertex):
+            if neighbor in shortest_distances: # 已确定最短距离的顶点跳过
+                continue
+            new_distance: int = current_distance + weight
+            if neighbor not in queue: # 首次发现该顶点
+                queue.enqueue(item=Pair(obj=neighbor, attr=new_distance))
+            elif new_distance < queue.get_attr(obj=neighbor): # 如果找到更短路径，更新
+                queue.decrease_key(obj=neighbor, attr=new_distance)
+            else:
+                continue
+            predecessors[neighbor] = current_vertex
+    return (shortest_distances, predecessors)
+
+
+def build_path(predecessors: HashMap[T, Optional[T]], target_vertex: T) -> LinkedList[T]:
+    """根据前驱顶点回溯出从起点到终点的最短路径（不含起点）
+
+    Args:
+        predecessors (HashMap[T, Optional[T]]): heap_dijkstra 返回的前驱顶点
+        target_vertex (T): 终点
+
+    Raises:
+        ValueError: 终点不可达
+
+    Returns:
+        LinkedList[T]: 最短路径
+    """
+    if target_vertex not in predecessors:
+        raise ValueError(f"顶点{target_vertex}不可达")
+    stack: ArrayStack[T] = ArrayStack[T]() # 存储最短路径经过的每一个顶点
+    vertex: Optional[T] = target_vertex
+    while predecessors[vertex] is not None: # type: ignore # 起点的前驱顶点为 None
+        stack.push(item=vertex) # type: ignore
+        vertex = predecessors[vertex] # type: ignore
+    path: LinkedList[T] = LinkedList[T]()
+    while len(stack) > 0:
+        path.append(val=stack.pop())
+    return path
+
+
+def dijkstra(graph: GraphLike[T], start_vertex: T) -> Tuple[HashMap[T, int], HashMap[T, LinkedList[T]]]:
     """迪杰斯特拉算法确定非负加权图的单源最短路径
 
     Args:
-        graph (Graph[T]): 图
+        graph (GraphLike[T]): 图
         start_vertex (T): 起点
 
     Returns:
         Tuple[HashMap[T, int], HashMap[T, LinkedList[T]]]: 前往其他顶点的最短距离和最短路径
     """
-    unvisited_vertexes: HashMap[T, int] = HashMap[T, int]()
-    for vertex in graph.vertexes:
-        # 初始化所有节点距离为无穷大
-        unvisited_vertexes[vertex] = float("inf") # type: ignore
-    unvisited_vertexes[start_vertex] = 0 # 起始节点距离为0
+    shortest_distances: HashMap[T, int]
+    predecessors: HashMap[T, Optional[T]]
+    shortest_distances, predecessors = heap_dijkstra(graph=graph, start_vertex=start_vertex)
     shortest_paths: HashMap[T, LinkedList[T]] = HashMap[T, LinkedList[T]]()
-    shortest_distances: HashMap[T, int] = HashMap[T, int]()
-    shortest_paths[start_vertex], shortest_distances[start_vertex] = LinkedList[T](), 0
-    while len(unvisited_vertexes) > 0:
-        current_vertex: T = min(unvisited_vertexes, key=unvisited_vertexes.get) # type: ignore # 找到未访问节点中距离最近的节点
-        current_distance: int = unvisited_vertexes[current_vertex]
-        to_edges: HashMap[T ,int] = graph[current_vertex].get_to_edges()
-        neighbor: T
-        for neighbor in to_edges: # type: ignore
-            if neighbor in unvisited_vertexes: # 已访问过的节点跳过
-                new_distance: int = current_distance + to_edges[neighbor]
-                if new_distance < unvisited_vertexes[neighbor]: # 如果找到更短路径，更新
-                    unvisited_vertexes[neighbor] = new_distance
-                    shortest_distances[neighbor] = new_distance
-                    shortest_paths[neighbor] = deepcopy(x=shortest_paths[current_vertex])
-                    shortest_paths[neighbor].append(val=neighbor)
-        del unvisited_vertexes[current_vertex] # 当前节点已访问过，从未访问节点中删除
+    vertex: T
+    for vertex in shortest_distances: # type: ignore
+        shortest_paths[vertex] = build_path(predecessors=predecessors, target_vertex=vertex)
     return (shortest_distances, shortest_paths)
 
 
 
-def weight_matrix(graph: Graph[int]) -> List[List[int]]:
+def weight_matrix(graph: GraphLike[int]) -> List[List[int]]:
     """返回图的距离矩阵（顶点必须以连续的非负整数表示）
 
     Args:
-        graph (Graph[int]): 图
+        graph (GraphLike[int]): 图
 
     Returns:
         List[List[int]]: 距离矩阵
     """
     result: List[List[int]] = [[float("inf")] * len(graph) for _ in range(len(graph))] # type: ignore # result[i][j] 为无穷表示不存在从 i 到 j 的边
     from_vertex: int
-    for from_vertex in graph.vertexes: # type: ignore
+    for from_vertex in graph.get_vertexes():
         result[from_vertex][from_vertex] = 0 # 没有自身到自身的边则设为 0
-        to_edges: HashMap[int ,int] = graph[from_vertex].get_to_edges()
         to_vertex: int
-        for to_vertex in to_edges: # type: ignore
-            result[from_vertex][to_vertex] = to_edges[to_vertex]
+        weight: int
+        for to_vertex, weight in graph.get_neighbors(vertex=from_vertex):
+            result[from_vertex][to_vertex] = weight
     return result
 
 
 
-def floyd(graph: Graph[int]) -> List[Tuple[Tuple[int, int], int, LinkedList[int]]]:
+def floyd(graph: GraphLike[int]) -> List[Tuple[Tuple[int, int], int, LinkedList[int]]]:
     """弗洛伊德算法确定非负加权图的多源最短路径（顶点必须以连续的非负整数表示）
 
     Args:
-        graph (Graph[int]): 图
+        graph (GraphLike[int]): 图
 
     Returns:
         List[Tuple[Tuple[int, int], int, LinkedList[int]]]: 每一个元素表示((起点, 终点), 最短距离, 最短路径)元组
@@ -353,11 +873,9 @@ def floyd(graph: Graph[int]) -> List[Tuple[Tuple[int, int], int, LinkedList[int]
     D: List[List[int]] = weight_matrix(graph=graph) # D[i][j] 表示从 i 到 j 的最短距离
     P: List[List[Optional[int]]] = [[None] * n for _ in range(n)] # P[i][j] 表示从 i 到 j 的最短路径中 j 的前一个顶点
     from_vertex: int
-    for from_vertex in graph.vertexes: # type: ignore
-        to_edges: HashMap[int ,int] = graph[from_vertex].get_to_edges()
-        to_vertex: int
-        for to_vertex in to_edges: # type: ignore
-            P[from_vertex][to_vertex] = from_vertex
+    to_vertex: int
+    for from_vertex, to_vertex, _ in graph.get_edges():
+        P[from_vertex][to_vertex] = from_vertex
     middle_vertex: int
     for middle_vertex in range(n): # 依次将每个顶点作为允许经过的点，更新最短路径
         for from_vertex in range(n):
@@ -396,53 +914,129 @@ def floyd(graph: Graph[int]) -> List[Tuple[Tuple[int, int], int, LinkedList[int]
 
 
 # 最小生成树：连通图（任意顶点 v 到顶点 w 之间都存在路径）中的一个子图，使得所有顶点都相互连通，且总边权和最小
-def prim(graph: Graph[T]) -> Graph[T]:
+def _csr_prim(graph: CSRGraph[T]) -> Graph[T]:
+    """只读图上的普里姆算法，已选集合和最近的边都存放在按编号索引的数组中
+
+    Args:
+        graph (CSRGraph[T]): 只读图
+
+    Returns:
+        Graph[T]: 与 prim 相同
+    """
+    n: int = len(graph)
+    offsets: array = graph.offsets
+    targets: array = graph.targets
+    weights: array = graph.weights
+    labels: List[T] = graph.labels
+    minimum_spanning_tree: Graph[T] = Graph[T]()
+    selected: bytearray = bytearray(n) # 是否已选
+    links: array = array("q", bytes(8 * n)) # 未选节点距离已选节点集合最近的边在已选节点集合中的端点
+    queue: IndexedMinPriorityQueue[int, int] = IndexedMinPriorityQueue[int, int]()
+    root: int
+    for root in range(n):
+        if selected[root]:
+            continue
+        minimum_spanning_tree.add_vertex(vertex=labels[root])
+        queue.enqueue(item=Pair(obj=root, attr=0))
+        while len(queue) > 0:
+            item: Pair[int, int] = queue.dequeue()
+            cur: int = item.obj
+            selected[cur] = 1
+            if cur != root:
+                minimum_spanning_tree.set_edge(from_vertex=labels[links[cur]], to_vertex=labels[cur], weight=item.attr)
+                minimum_spanning_tree.set_edge(from_vertex=labels[cur], to_vertex=labels[links[cur]], weight=item.attr)
+            i: int
+            for i in range(offsets[cur], offsets[cur + 1]):
+                neighbor: int = targets[i]
+                if selected[neighbor]:
+                    continue
+                if neighbor not in queue:
+                    queue.enqueue(item=Pair(obj=neighbor, attr=weights[i]))
+                elif weights[i] < queue.get_attr(obj=neighbor):
+                    queue.decrease_key(obj=neighbor, attr=weights[i])
+                else:
+                    continue
+                links[neighbor] = cur
+    return minimum_spanning_tree
+
+
+def prim(graph: GraphLike[T]) -> Graph[T]:
     """普里姆算法最小生成树：
     1. 首先选择一个起始节点，以这个节点将图分成两个集合。一个已选集合，一个未选集合，把起始节点加入已选集合；
     2. 从未选节点集合中选择距离已选节点集合最近的节点，并将其加入已选节点集合；
     3. 不断重复步骤 2，直到所有节点都被加入到已选节点集合中，形成最小生成树。
+    用带索引的小顶堆维护未选节点到已选节点集合的最短距离，每次加入新节点后只需检查其邻居；
+    图不连通时，对每个连通分量分别执行上述步骤，得到最小生成森林。
 
     Args:
-        graph (Graph[T]): 图
+        graph (GraphLike[T]): 图
 
     Returns:
-        Graph[T]: 最小生成树（子图）
+        Graph[T]: 最小生成树（子图），图不连通时为最小生成森林
     """
+    if isinstance(graph, CSRGraph): # 只读图直接在编号上运行
+        return _csr_prim(graph=graph)
+    minimum_spanning_tree: Graph[T] = Graph[T]()
     selected: HashMap[T, None] = HashMap[T, None]() # 模拟集合，{vertex}
-    first_vertex: T = next(iter(graph.vertexes)) # type: ignore
-    selected.put(key=first_vertex, val=None) # 从第一个顶点开始
-    unselected: List[T] = graph.vertexes.keys()
-    unselected.remove(first_vertex)
-    used_edges: LinkedList[Tuple[T, T, int]] = LinkedList[Tuple[T, T, int]]() # 用于组成最小生成树的边
-    while len(unselected) > 0:
-        minimum: int | float = float("inf")
-        from_vertex: T
-        to_vertex: T
-        # 从未选中部分找到距离已选中部分最近的顶点
-        vertex: T
-        for vertex in selected: # type: ignore
-            to_edges: HashMap[T, int] = graph[vertex].get_to_edges()
+    links: HashMap[T, T] = HashMap[T, T]() # 未选节点距离已选节点集合最近的边在已选节点集合中的端点
+    queue: IndexedMinPriorityQueue[T, int] = IndexedMinPriorityQueue[T, int]() # 未选节点到已选节点集合的最短距离
+    root: T
+    for root in graph.get_vertexes(): # 每个连通分量中第一个被遍历到的顶点作为起始节点
+        if root in selected:
+            continue
+        minimum_spanning_tree.add_vertex(vertex=root) # 孤立的顶点同样属于最小生成森林
+        queue.enqueue(item=Pair(obj=root, attr=0))
+        while len(queue) > 0:
+            item: Pair[T, int] = queue.dequeue() # 距离已选节点集合最近的节点
+            vertex: T = item.obj
+            selected.put(key=vertex, val=None)
+            if vertex != root:
+                minimum_spanning_tree.set_edge(from_vertex=links[vertex], to_vertex=vertex, weight=item.attr)
+                minimum_spanning_tree.set_edge(from_vertex=vertex, to_vertex=links[vertex], weight=item.attr)
             neighbor: T
-            for neighbor in to_edges: # type: ignore
-                if neighbor in unselected:
-                    if to_edges[neighbor] < minimum: # 找到权值最小的边
-                        minimum = to_edges[neighbor]
-                        from_vertex = vertex
-                        to_vertex = neighbor
-        used_edges.append(val=(from_vertex, to_vertex, minimum)) # type: ignore
-        selected.put(key=to_vertex, val=None) # type: ignore
-        unselected.remove(to_vertex) # type: ignore
-    # 利用组成最小生成树的边构建一个子图
-    minimum_spanning_tree: Graph[T] = Graph[T]()
-    edge: Tuple[T, T, int]
-    for edge in used_edges: # type: ignore
-        minimum_spanning_tree.set_edge(from_vertex=edge[0], to_vertex=edge[1], weight=edge[2])
-        minimum_spanning_tree.set_edge(from_vertex=edge[1], to_vertex=edge[0], weight=edge[2])
+            weight: int
+            for neighbor, weight in graph.get_neighbors(vertex=vertex):
+                if neighbor in selected:
+                    continue
+                if neighbor not in queue:
+                    queue.enqueue(item=Pair(obj=neighbor, attr=weight))
+                elif weight < queue.get_attr(obj=neighbor): # 找到距离已选节点集合更近的边
+                    queue.decrease_key(obj=neighbor, attr=weight)
+                else:
+                    continue
+                links[neighbor] = vertex
     return minimum_spanning_tree
 
 
 
-def kruskal(graph: Graph[T]) -> Graph[T]:
+def _csr_kruskal(graph: CSRGraph[T]) -> Graph[T]:
+    """只读图上的克鲁斯卡尔算法，直接对边的编号排序，并用基于数组的并查集判断是否成环
+
+    Args:
+        graph (CSRGraph[T]): 只读图
+
+    Returns:
+        Graph[T]: 与 kruskal 相同
+    """
+    n: int = len(graph)
+    sources: array = graph.get_sources()
+    targets: array = graph.targets
+    weights: array = graph.weights
+    labels: List[T] = graph.labels
+    ufs: IntUnionFind = IntUnionFind(n=n)
+    order: List[int] = sorted(range(len(targets)), key=weights.__getitem__, reverse=True) # 边的编号按照权重降序排序
+    minimum_spanning_tree: Graph[T] = Graph[T]()
+    used: int = 0 # 已纳入最小生成树的边数
+    while used < n - 1:
+        i: int = order.pop()
+        if ufs.union(node1=sources[i], node2=targets[i]): # 两端原本不连通
+            used += 1
+            minimum_spanning_tree.set_edge(from_vertex=labels[sources[i]], to_vertex=labels[targets[i]], weight=weights[i])
+            minimum_spanning_tree.set_edge(from_vertex=labels[targets[i]], to_vertex=labels[sources[i]], weight=weights[i])
+    return minimum_spanning_tree
+
+
+def kruskal(graph: GraphLike[T]) -> Graph[T]:
     """克鲁斯卡尔算法最小生成树：
     取出所有的边，按其权值从小到大的顺序排列，
     然后不断取出权值最小的边放入图中，一共取顶点数减 1 条边。
@@ -451,23 +1045,18 @@ def kruskal(graph: Graph[T]) -> Graph[T]:
     如果形成了环，则舍弃这条边，继续取下一条边。
 
     Args:
-        graph (Graph[T]): 图
+        graph (GraphLike[T]): 图
 
     Returns:
         Graph[T]: 最小生成树（子图）
     """
+    if isinstance(graph, CSRGraph): # 只读图直接在编号上运行
+        return _csr_kruskal(graph=graph)
     used_edges: LinkedList[Tuple[T, T, int]] = LinkedList[Tuple[T, T, int]]() # 用于组成最小生成树的边
-    ufs: UnionFindSet[T] = UnionFindSet[T](arr=graph.vertexes.keys()) # 初始化并查集
-    # 获取所有的边
-    edges: List[Optional[Tuple[T, T, int]]] = [None] * graph.size()
-    idx: int = 0
+    ufs: UnionFindSet[T] = UnionFindSet[T](arr=list(graph.get_vertexes())) # 初始化并查集
+    edges: List[Tuple[T, T, int]] = list(graph.get_edges()) # 获取所有的边
     from_vertex: T
-    for from_vertex in graph.vertexes: # type: ignore
-        to_edges: HashMap[T, int] = graph[from_vertex].get_to_edges()
-        to_vertex: T
-        for to_vertex in to_edges: # type: ignore
-            edges[idx] = (from_vertex, to_vertex, to_edges[to_vertex])
-            idx += 1
+    to_vertex: T
     edges.sort(key=lambda edge: edge[2], reverse=True) # type: ignore # 将所有的边按照权重降序排序
     while len(used_edges) < len(graph) - 1:
         weight: int
@@ -485,13 +1074,229 @@ def kruskal(graph: Graph[T]) -> Graph[T]:
 
 
 
-def topological_sorting(graph: Graph[T]) -> LinkedList[T]:
+def _boruvka_scan(names: Tuple[str, str, str, str], typecode: str, lo: int, hi: int) -> List[Tuple[int, int]]:
+    """Borůvka 算法的分片扫描（在子进程中运行）：找到编号在 [lo, hi) 内的边中，每个连通分量权重最小的出边
+
+    Args:
+        names (Tuple[str, str, str, str]): 起点、终点、边权、每个顶点所属连通分量这四个数组所在共享内存的名字
+        typecode (str): 边权数组的类型码
+        lo (int): 分片的起始边编号
+        hi (int): 分片的结束边编号（不含）
+
+    Returns:
+        List[Tuple[int, int]]: (连通分量, 权重最小的出边的编号)
+    """
+    blocks: List[SharedMemory] = [SharedMemory(name=name) for name in names]
+    sources: memoryview = blocks[0].buf.cast("q")
+    targets: memoryview = blocks[1].buf.cast("q")
+    weights: memoryview = blocks[2].buf.cast(typecode)
+    components: memoryview = blocks[3].buf.cast("q")
+    try:
+        cheapest: HashMap[int, int] = HashMap[int, int]() # {连通分量：权重最小的出边的编号}
+        i: int
+        for i in range(lo, hi):
+            from_component: int = components[sources[i]]
+            to_component: int = components[targets[i]]
+            if from_component == to_component: # 连通分量内部的边
+                continue
+            component: int
+            for component in (from_component, to_component):
+                if component not in cheapest:
+                    cheapest[component] = i
+                else:
+                    j: int = cheapest[component]
+                    if (weights[i], i) < (weights[j], j): # 权重相同时比较编号，保证不会选出环
+                        cheapest[component] = i
+        return list(cheapest.items())
+    finally:
+        sources.release(); targets.release(); weights.release(); components.release() # 释放视图之后才能关闭共享内存
+        for block in blocks:
+            block.close()
+
+
+def boruvka(graph: GraphLike[T], workers: Optional[int] = None) -> Graph[T]:
+    """Borůvka 算法最小生成树：
+    1. 初始时每个顶点各自构成一个连通分量；
+    2. 每一轮为每个连通分量找到一条权重最小的出边，将这些边全部纳入最小生成树并合并其两端的连通分量；
+    3. 不断重复步骤 2，直到不再有连接不同连通分量的边，每一轮连通分量的数量至少减半。
+    步骤 2 中的扫描按边的编号分片，由进程池并行完成，所有子进程通过共享内存读取同一份边数组。
+
+    Args:
+        graph (GraphLike[T]): 图
+        workers (Optional[int], optional): 进程数，为 1 时在当前进程中扫描. Defaults to None（CPU 核数）.
+
+    Returns:
+        Graph[T]: 最小生成树（子图），图不连通时为最小生成森林
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    # 将顶点重新编号为连续的整数，并将边展开为起点、终点、边权三个数组
+    labels: List[T]
+    i: int
+    sources: array = array("q")
+    targets: array = array("q")
+    weights: array
+    if isinstance(graph, CSRGraph): # 只读图已经按编号存放，直接展开
+        labels = graph.labels
+        weights = array(graph.weights.typecode)
+        all_sources: array = graph.get_sources()
+        for i in range(graph.size()):
+            if all_sources[i] != graph.targets[i]: # 自环不可能属于最小生成树
+                sources.append(all_sources[i])
+                targets.append(graph.targets[i])
+                weights.append(graph.weights[i])
+    else:
+        labels = list(graph.get_vertexes())
+        ids: HashMap[T, int] = HashMap[T, int].from_items(items=zip(labels, range(len(labels))), size_hint=len(labels))
+        weight_list: List[int] = []
+        from_vertex: T
+        to_vertex: T
+        weight: int
+        for from_vertex, to_vertex, weight in graph.get_edges():
+            if from_vertex != to_vertex: # 自环不可能属于最小生成树
+                sources.append(ids[from_vertex])
+                targets.append(ids[to_vertex])
+                weight_list.append(weight)
+        weights = array("q" if all(isinstance(weight, int) for weight in weight_list) else "d", weight_list)
+    n: int = len(labels)
+    m: int = len(sources)
+    ufs: IntUnionFind = IntUnionFind(n=n) # 用于合并连通分量的并查集
+    minimum_spanning_tree: Graph[T] = Graph[T]()
+    minimum_spanning_tree.add_vertexes(vertexes=labels)
+    blocks: List[SharedMemory] = []
+    pool: Optional[ProcessPoolExecutor] = None
+    components: Optional[memoryview] = None
+    try:
+        for data in (sources, targets, weights, array("q", range(n))): # 初始时每个顶点各自构成一个连通分量
+            block: SharedMemory = SharedMemory(create=True, size=max(data.itemsize, len(data) * data.itemsize)) # 共享内存的大小不能为 0
+            block.buf[:len(data) * data.itemsize] = data.tobytes()
+            blocks.append(block)
+        components = blocks[3].buf.cast("q") # 每个顶点所属的连通分量（即其在并查集中的祖先节点）
+        names: Tuple[str, str, str, str] = (blocks[0].name, blocks[1].name, blocks[2].name, blocks[3].name)
+        shards: int = max(1, min(workers, m))
+        bounds: List[int] = [m * k // shards for k in range(shards + 1)]
+        if shards > 1:
+            pool = ProcessPoolExecutor(max_workers=shards)
+        while True:
+            # 并行扫描每个分片，再合并各分片中每个连通分量权重最小的出边
+            results: List[List[Tuple[int, int]]]
+            if pool is None:
+                results = [_boruvka_scan(names=names, typecode=weights.typecode, lo=bounds[0], hi=bounds[1])]
+            else:
+                futures = [pool.submit(_boruvka_scan, names, weights.typecode, bounds[k], bounds[k + 1]) for k in range(shards)]
+                results = [future.result() for future in futures]
+            cheapest: HashMap[int, int] = HashMap[int, int]()
+            result: List[Tuple[int, int]]
+            for result in results:
+                component: int
+                for component, i in result:
+                    if component not in cheapest:
+                        cheapest[component] = i
+                    else:
+                        j: int = cheapest[component]
+                        if (weights[i], i) < (weights[j], j):
+                            cheapest[component] = i
+            if len(cheapest) == 0: # 不再有连接不同连通分量的边
+                break
+            for i in cheapest.values():
+                if ufs.union(node1=sources[i], node2=targets[i]): # 两个连通分量可能选中同一条边
+                    minimum_spanning_tree.set_edge(from_vertex=labels[sources[i]], to_vertex=labels[targets[i]], weight=weights[i])
+                    minimum_spanning_tree.set_edge(from_vertex=labels[targets[i]], to_vertex=labels[sources[i]], weight=weights[i])
+            for i in range(n): # 收缩连通分量
+                components[i] = ufs.find(node=i)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+        if components is not None:
+            components.release()
+        for block in blocks:
+            block.close()
+            block.unlink()
+    return minimum_spanning_tree
+
+
+
+def _csr_topological_sorting(graph: CSRGraph[T]) -> Iterator[T]:
+    """只读图上的卡恩算法，入度计数存放在按编号索引的数组中，返回顺序数组本身就是队列
+
+    Args:
+        graph (CSRGraph[T]): 只读图
+
+    Raises:
+        AttributeError: 有环图（在返回所有无环部分的顶点之后抛出）
+
+    Yields:
+        Iterator[T]: 按拓扑顺序返回的顶点
+    """
+    n: int = len(graph)
+    offsets: array = graph.offsets
+    targets: array = graph.targets
+    in_offsets: array = graph.in_offsets
+    from_degrees: array = array("q", (in_offsets[idx + 1] - in_offsets[idx] for idx in range(n))) # 尚未返回的前驱顶点的个数
+    ready: array = array("q", (idx for idx in range(n) if from_degrees[idx] == 0)) # 入度减为 0 的顶点
+    head: int = 0 # 队首在 ready 中的位置，也是已经返回了的顶点个数
+    while head < len(ready):
+        cur: int = ready[head]
+        head += 1
+        yield graph.labels[cur]
+        i: int
+        for i in range(offsets[cur], offsets[cur + 1]):
+            from_degrees[targets[i]] -= 1
+            if from_degrees[targets[i]] == 0:
+                ready.append(targets[i])
+    if head < n:
+        raise AttributeError("图中存在环，找不到入度为 0 的顶点")
+
+
+def iter_topological_sorting(graph: GraphLike[T]) -> Iterator[T]:
+    """卡恩算法（Kahn）拓扑排序，以生成器的形式逐个返回顶点：
+    1. 统计所有顶点的入度，将入度为 0 的顶点入队；
+    2. 顶点出队时即可返回，并将其所有邻居的入度减 1，入度减为 0 的邻居入队；
+    3. 队列为空时若仍有顶点未返回，则图中存在环。
+    只维护入度计数，不会复制或修改原图。
+
+    Args:
+        graph (GraphLike[T]): 图
+
+    Raises:
+        AttributeError: 有环图（在返回所有无环部分的顶点之后抛出）
+
+    Yields:
+        Iterator[T]: 按拓扑顺序返回的顶点
+    """
+    if isinstance(graph, CSRGraph): # 只读图直接在编号上运行
+        yield from _csr_topological_sorting(graph=graph)
+        return
+    from_degrees: HashMap[T, int] = HashMap[T, int]() # 尚未返回的前驱顶点的个数
+    from_degrees.reserve(n=len(graph))
+    queue: ArrayQueue[T] = ArrayQueue[T]() # 入度为 0 的顶点
+    vertex: T
+    for vertex in graph.get_vertexes():
+        from_degree: int = graph.get_from_degree(vertex=vertex)
+        from_degrees[vertex] = from_degree
+        if from_degree == 0:
+            queue.enqueue(item=vertex)
+    had: int = 0 # 已经返回了的顶点个数
+    while len(queue) > 0:
+        vertex = queue.dequeue()
+        had += 1
+        yield vertex
+        neighbor: T
+        for neighbor, _ in graph.get_neighbors(vertex=vertex):
+            from_degrees[neighbor] -= 1
+            if from_degrees[neighbor] == 0:
+                queue.enqueue(item=neighbor)
+    if had < len(graph):
+        raise AttributeError("图中存在环，找不到入度为 0 的顶点")
+
+
+def topological_sorting(graph: GraphLike[T]) -> LinkedList[T]:
     """ 拓扑排序是一个有向无环图（环是一条只有第一个和最后一个顶点重复的非空路径）的所有顶点的线性序列，并满足以下两个条件：
     1. 每个顶点出现且只出现一次；
     2. 若存在一条从顶点 A 到顶点 B 的路径，则在序列中顶点 A 出现在顶点 B 的前面。
 
     Args:
-        graph (Graph[T]): 图
+        graph (GraphLike[T]): 图
 
     Raises:
         AttributeError: 有环图
@@ -499,17 +1304,10 @@ def topological_sorting(graph: Graph[T]) -> LinkedList[T]:
     Returns:
         LinkedList[T]: 所有顶点的线性序列
     """
-    graphCopy: Graph[T] = deepcopy(x=graph)
     result: LinkedList[T] = LinkedList[T]()
-    for _ in range(len(graphCopy)):
-        vertex: T
-        for vertex in graphCopy.vertexes: # type: ignore
-            if graphCopy.vertexes[vertex].from_degree == 0:
-                result.append(val=vertex)
-                graphCopy.remove_vertex(vertex=vertex)
-                break
-        else:
-            raise AttributeError("图中存在环，找不到入度为 0 的顶点")
+    vertex: T
+    for vertex in iter_topological_sorting(graph=graph):
+        result.append(val=vertex)
     return result
 
 
@@ -587,6 +1385,9 @@ if __name__ == "__main__":
     i: int
     for i in range(8):
         print(f"起点：4，终点：{i}，最短距离：{dis[i]}, 最短路径：{path[i].to_list()}")
+    dis3: HashMap[int, int]; prev: HashMap[int, Optional[int]]
+    dis3, prev = heap_dijkstra(graph=g2, start_vertex=4, target_vertex=0) # 确定到顶点 0 的最短距离后提前结束
+    print(f"起点：4，终点：0，最短距离：{dis3[0]}, 最短路径：{build_path(predecessors=prev, target_vertex=0).to_list()}")
     print("-------图权矩阵-------")
     print(weight_matrix(graph=g2))
     print("-------弗洛伊德算法-------")
@@ -609,4 +1410,15 @@ if __name__ == "__main__":
         to_edges2: HashMap[int, int] = g4[l].get_to_edges()
         l2: int
         for l2 in to_edges2: # type: ignore
-            print(l, l2, to_edges2[l2])
\ No newline at end of file
+            print(l, l2, to_edges2[l2])
+    print("-------压缩稀疏行格式-------")
+    csr: CSRGraph[int] = g2.freeze()
+    print(len(csr), csr.size(), csr.offsets.tolist())
+    print(graph_bfs(graph=csr, start_vertex=4).to_list())
+    dis4: HashMap[int, int]
+    dis4, _ = heap_dijkstra(graph=csr, start_vertex=4)
+    print([dis4[i] for i in range(8)])
+    print(topological_sorting(graph=g.freeze()).to_list())
+    print("-------Borůvka 算法-------")
+    g5: Graph[int] = boruvka(graph=csr, workers=2)
+    print(sorted(g5.get_edges()))
\ No newline at end of file
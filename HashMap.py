@@ -1,6 +1,13 @@
-from typing import Final, Generic, TypeVar, Optional, List, Tuple, Hashable , override
+from abc import ABC, abstractmethod
+from typing import Final, Generic, Generator, TypeVar, Optional, List, Tuple, Hashable, Iterable, Mapping, Sequence, Sized, override
+from array import array
+from mmap import mmap, ACCESS_READ
+from random import getrandbits
+from struct import Struct
+from sys import byteorder
 
-from utils import Iterator
+from Tree import AvlTree
+from utils import Iterator, KeysView, ValuesView, ItemsView
 
 
 
@@ -12,32 +19,166 @@ V = TypeVar(
 
 class Pair(Generic[K, V]):
     """键值对"""
-    def __init__(self, key: K, val: V) -> None:
+    def __init__(self, key: K, val: V, hash_code: Optional[int] = None) -> None:
         """构造方法
 
         Args:
             key (K): 键
             val (V): 值
+            hash_code (Optional[int], optional): 键的哈希值，随键值对保存以免重复计算. Defaults to None.
         """
         self._key: K = key # 键
         self._val: V = val # 值
+        self._hash: Optional[int] = hash_code # 键的哈希值（删除标记为 None，不会与任何键的哈希值相等）
+
+class ProbeStrategy(ABC):
+    """开放寻址的探测策略"""
+    def fit_capacity(self, capacity: int) -> int:
+        """调整容量，使得探测序列能够遍历所有的桶
+
+        Args:
+            capacity (int): 期望的容量
+
+        Returns:
+            int: 实际采用的容量
+        """
+        return capacity
+
+    @abstractmethod
+    def next(self, idx: int, i: int, hash_code: int, capacity: int) -> int:
+        """计算下一个探测的桶
+
+        Args:
+            idx (int): 上一次探测的桶
+            i (int): 当前是第几次再探测（从 1 开始）
+            hash_code (int): 键的哈希值
+            capacity (int): 哈希表容量
+
+        Returns:
+            int: 下一个探测的桶
+        """
+        pass
+
+class LinearProbe(ProbeStrategy):
+    """线性探测：依次探测相邻的桶，缓存友好，但容易形成聚集"""
+    @override
+    def next(self, idx: int, i: int, hash_code: int, capacity: int) -> int:
+        """计算下一个探测的桶
+
+        Args:
+            idx (int): 上一次探测的桶
+            i (int): 当前是第几次再探测（从 1 开始）
+            hash_code (int): 键的哈希值
+            capacity (int): 哈希表容量
+
+        Returns:
+            int: 下一个探测的桶
+        """
+        return (idx + 1) % capacity
+
+class QuadraticProbe(ProbeStrategy):
+    """
+    二次探测：第 i 次再探测与起点的距离为三角数 i(i+1)/2，可以缓解线性探测的聚集；
+    容量为 2 的幂时三角数序列能够遍历所有的桶，因此会将容量向上调整为 2 的幂
+    """
+    @override
+    def fit_capacity(self, capacity: int) -> int:
+        """将容量向上调整为 2 的幂
+
+        Args:
+            capacity (int): 期望的容量
+
+        Returns:
+            int: 不小于期望容量的最小的 2 的幂
+        """
+        return 1 << (capacity - 1).bit_length()
+
+    @override
+    def next(self, idx: int, i: int, hash_code: int, capacity: int) -> int:
+        """计算下一个探测的桶
+
+        Args:
+            idx (int): 上一次探测的桶
+            i (int): 当前是第几次再探测（从 1 开始）
+            hash_code (int): 键的哈希值
+            capacity (int): 哈希表容量
+
+        Returns:
+            int: 下一个探测的桶
+        """
+        return (idx + i) % capacity # 相邻两个三角数之差为 i
+
+class DoubleHashProbe(QuadraticProbe):
+    """
+    双重哈希：步长由哈希值中未参与定位起点的高位决定，不同的键即使起点相同，探测序列也不同；
+    容量为 2 的幂且步长为奇数时步长与容量互素，探测序列能够遍历所有的桶
+    """
+    @override
+    def next(self, idx: int, i: int, hash_code: int, capacity: int) -> int:
+        """计算下一个探测的桶
+
+        Args:
+            idx (int): 上一次探测的桶
+            i (int): 当前是第几次再探测（从 1 开始）
+            hash_code (int): 键的哈希值
+            capacity (int): 哈希表容量
+
+        Returns:
+            int: 下一个探测的桶
+        """
+        step: int = (hash_code // capacity % capacity) | 1 # 步长必须为奇数
+        return (idx + step) % capacity
+
+class ProbeStats:
+    """开放寻址哈希表的探测统计"""
+    def __init__(self, histogram: List[int], avg_hit: float, avg_miss: float, tombstone_ratio: float, resizes: int) -> None:
+        """构造方法
+
+        Args:
+            histogram (List[int]): 探测长度直方图，第 n 项为恰好检查了 n 个桶的查找次数
+            avg_hit (float): 成功查找的平均探测长度
+            avg_miss (float): 失败查找（包括新增键）的平均探测长度
+            tombstone_ratio (float): 删除标记占据的桶的比例
+            resizes (int): 扩容次数
+        """
+        self.histogram: List[int] = histogram
+        self.avg_hit: float = avg_hit
+        self.avg_miss: float = avg_miss
+        self.tombstone_ratio: float = tombstone_ratio
+        self.resizes: int = resizes
 
 class HashMapOpenAddressing(Generic[K, V]):
     """
     基于数组实现的开放寻址哈希表；
+    探测策略可以替换（线性探测、二次探测、双重哈希），并统计探测长度，便于根据实际负载选择策略；
     采用惰性删除机制，否则再哈希过程中可能会提前停止；
     除了更新键值对，其他操作时不要改变键值对的存放位置
     """
     _TOMBSTONE: Final[Pair] = Pair(key=-1, val=None) # 删除标记（不可变）
     capacity: Final[int] = 10 # 初始容量（不可变）
     extend_ratio: Final[int] = 2 # 扩容系数（不可变）
-    load_threshold: Final[float] = 0.75 # 触发扩容的负载因子阈值（不可变）
+    load_threshold: Final[float] = 0.75 # 键值对与删除标记占据的桶的比例达到该值时重建数组桶（不可变）
+    shrink_threshold: Final[float] = 0.1 # 重建数组桶时负载因子低于该值则缩容（不可变）
 
-    def __init__(self) -> None:
-        """构造方法"""
-        self._capacity: int = HashMapOpenAddressing.capacity # 哈希表容量
+    def __init__(self, probe: Optional[ProbeStrategy] = None) -> None:
+        """构造方法
+
+        Args:
+            probe (Optional[ProbeStrategy], optional): 探测策略，为 None 时采用线性探测. Defaults to None.
+        """
+        self._probe: ProbeStrategy = probe or LinearProbe() # 探测策略
+        self._capacity: int = self._probe.fit_capacity(capacity=HashMapOpenAddressing.capacity) # 哈希表容量
         self._bucket: List[Optional[Pair[K, V]]] = [None] * self._capacity # 数组桶
         self._size: int = 0 # 键值对数量
+        self._tombstones: int = 0 # 删除标记数量
+        self._modcount: int = 0 # 结构性修改的次数，用于在视图迭代过程中检测修改
+        # 探测统计
+        self._histogram: array = array("q", [0]) # 探测长度直方图
+        self._hits: int = 0 # 成功查找次数
+        self._hit_probes: int = 0 # 成功查找检查的桶的总数
+        self._misses: int = 0 # 失败查找次数
+        self._miss_probes: int = 0 # 失败查找检查的桶的总数
+        self._resizes: int = 0 # 扩容次数
 
     @staticmethod # 静态方法
     def Hash(key: K) -> int:
@@ -62,17 +203,54 @@ class HashMapOpenAddressing(Generic[K, V]):
         """
         return HashMapOpenAddressing.Hash(key=key) % self._capacity
     
-    def rehash(self, old_hash: int) -> int:
-        """通过再哈希来开放寻址
+    def rehash(self, old_hash: int, i: int = 1, hash_code: int = 0) -> int:
+        """通过再哈希来开放寻址（再探测时如果不能遍历所有的桶又无法触发扩容机制，则可能陷入死循环，因此由探测策略保证能够遍历所有的桶）
 
         Args:
             old_hash (int): 旧哈希函数值
+            i (int, optional): 当前是第几次再探测. Defaults to 1.
+            hash_code (int, optional): 键的哈希值. Defaults to 0.
 
         Returns:
             int: 新哈希函数值
         """
-        k: int = 1 # 再探测时如果不能遍历所有的桶又无法触发扩容机制，则可能陷入死循环（探测到的永远是被占据的桶）
-        return (old_hash + k) % self._capacity # 线性探测
+        return self._probe.next(idx=old_hash, i=i, hash_code=hash_code, capacity=self._capacity)
+
+    def _record(self, probes: int, hit: bool) -> None:
+        """记录一次查找的探测长度
+
+        Args:
+            probes (int): 检查了的桶的数量
+            hit (bool): 是否查找成功
+        """
+        while len(self._histogram) <= probes:
+            self._histogram.append(0)
+        self._histogram[probes] += 1
+        if hit:
+            self._hits += 1
+            self._hit_probes += probes
+        else:
+            self._misses += 1
+            self._miss_probes += probes
+
+    def probe_stats(self) -> ProbeStats:
+        """查看探测统计
+
+        Returns:
+            ProbeStats: 探测统计
+        """
+        return ProbeStats(
+            histogram=self._histogram.tolist(),
+            avg_hit=self._hit_probes / self._hits if self._hits else 0.0,
+            avg_miss=self._miss_probes / self._misses if self._misses else 0.0,
+            tombstone_ratio=self._tombstones / self._capacity,
+            resizes=self._resizes
+        )
+
+    def reset_probe_stats(self) -> None:
+        """清空探测长度的统计（不清空扩容次数）"""
+        self._histogram = array("q", [0])
+        self._hits = self._hit_probes = self._misses = self._miss_probes = 0
     
     def load_factor(self) -> float:
         """查看负载因子
@@ -89,27 +267,44 @@ class HashMapOpenAddressing(Generic[K, V]):
             key (K): 键
             val (V): 值
         """
-        if self.load_factor() >= HashMapOpenAddressing.load_threshold: # 扩容
+        if (self._size + self._tombstones) / self._capacity >= HashMapOpenAddressing.load_threshold: # 重建数组桶（删除标记同样会占据桶，必须计入，否则数组中可能不再有 None）
             self._extend()
-        idx: int = self.hash_func(key=key)
+        self._put(key=key, val=val)
+
+    def _put(self, key: K, val: V) -> None:
+        """新增或更新键值对，不检查负载（由调用方保证插入后数组中仍有 None）
+
+        Args:
+            key (K): 键
+            val (V): 值
+        """
+        hash_code: int = HashMapOpenAddressing.Hash(key=key) # 每次操作只计算一次哈希值
+        idx: int = hash_code % self._capacity
+        i: int = 0 # 再探测次数
         first_blank: Optional[int] = None # 记录遇到的首个空桶（存储了 None 或删除标记）
         while self._bucket[idx] is not None: # 扩容机制保证了数组中一定有 None 的存在
-            if self._bucket[idx]._key == key: # type: ignore # 键存在则更新其对应值
+            if (self._bucket[idx]._hash == hash_code) and (self._bucket[idx]._key == key): # type: ignore # 先比较哈希值，不相等时无需比较键
                 if first_blank is not None: # 将元素移至距离探测起点更近的空桶，减少查找时所需的哈希次数
                     self._bucket[idx] = HashMapOpenAddressing._TOMBSTONE
-                    self._bucket[first_blank] = Pair(key=key, val=val)
+                    self._bucket[first_blank] = Pair(key=key, val=val, hash_code=hash_code)
+                    self._modcount += 1 # 改变了键值对的存放位置
                 else:
                     self._bucket[idx]._val = val # type: ignore
+                self._record(probes=i + 1, hit=True)
                 return
             if first_blank is None: # 最多只会触发一次
                 if (self._bucket[idx] is HashMapOpenAddressing._TOMBSTONE) or (self._bucket[idx] is None):
                     first_blank = idx
-            idx = self.rehash(old_hash=idx)
+            i += 1
+            idx = self.rehash(old_hash=idx, i=i, hash_code=hash_code)
+        self._record(probes=i + 1, hit=False)
         # 探测到 None 表示键不存在，如果键存在则其应该被存储在此处（探测到删除标记不能证明键不存在）
         if first_blank is not None:
             idx = first_blank
-        self._bucket[idx] = Pair(key=key, val=val)
+            self._tombstones -= 1 # 复用了删除标记所在的桶
+        self._bucket[idx] = Pair(key=key, val=val, hash_code=hash_code)
         self._size += 1
+        self._modcount += 1
 
     def index(self, key: K) -> int:
         """确定索引位置
@@ -123,11 +318,16 @@ class HashMapOpenAddressing(Generic[K, V]):
         Returns:
             int: 哈希表中存放键的位置
         """
-        idx: int = self.hash_func(key=key)
+        hash_code: int = HashMapOpenAddressing.Hash(key=key)
+        idx: int = hash_code % self._capacity
+        i: int = 0 # 再探测次数
         while self._bucket[idx] is not None: # 扩容机制保证了数组中一定有 None 的存在
-            if self._bucket[idx]._key == key: # type: ignore # 键存在
+            if (self._bucket[idx]._hash == hash_code) and (self._bucket[idx]._key == key): # type: ignore # 键存在
+                self._record(probes=i + 1, hit=True)
                 return idx
-            idx = self.rehash(old_hash=idx)
+            i += 1
+            idx = self.rehash(old_hash=idx, i=i, hash_code=hash_code)
+        self._record(probes=i + 1, hit=False)
         raise KeyError(f"{key}不在哈希表中")
 
     def remove(self, key: K) -> None:
@@ -139,6 +339,8 @@ class HashMapOpenAddressing(Generic[K, V]):
         idx: int = self.index(key=key)
         self._bucket[idx] = HashMapOpenAddressing._TOMBSTONE
         self._size -= 1
+        self._tombstones += 1
+        self._modcount += 1
     
     def get(self, key: K) -> V:
         """查询键值对
@@ -152,12 +354,95 @@ class HashMapOpenAddressing(Generic[K, V]):
         idx: int = self.index(key=key)
         return self._bucket[idx]._val # type: ignore
 
+    def _fit_capacity(self) -> int:
+        """根据存活的键值对数量确定重建后的容量
+
+        Returns:
+            int: 重建后的容量
+        """
+        capacity: int = self._capacity
+        if self._size >= capacity * HashMapOpenAddressing.load_threshold / HashMapOpenAddressing.extend_ratio: # 清理删除标记后仍然较满，扩容
+            return capacity * HashMapOpenAddressing.extend_ratio
+        minimum: int = self._probe.fit_capacity(capacity=HashMapOpenAddressing.capacity) # 不低于初始容量
+        while (capacity // HashMapOpenAddressing.extend_ratio >= minimum) and (self._size < capacity * HashMapOpenAddressing.shrink_threshold): # 键值对过少，缩容
+            capacity //= HashMapOpenAddressing.extend_ratio
+        return capacity # 主要被删除标记占据时保持原容量，只清理删除标记
+
     def _extend(self) -> None:
-        """扩容"""
+        """占据的桶过多时重建数组桶：存活的键值对较多时扩容，否则原地清理删除标记，键值对过少时缩容"""
+        self._rebuild(capacity=self._fit_capacity())
+
+    def compact(self) -> None:
+        """手动清理删除标记，键值对过少时同时缩容（不会扩容）"""
+        self._rebuild(capacity=min(self._capacity, self._fit_capacity()))
+
+    def reserve(self, n: int) -> None:
+        """预留容量，使得键值对数量增长到 n 之前都不会再重建数组桶（不会缩容）
+
+        Args:
+            n (int): 预计存放的键值对总数
+        """
+        if n + self._tombstones < self._capacity * HashMapOpenAddressing.load_threshold: # 删除标记同样会占据桶
+            return
+        capacity: int = self._capacity
+        while n >= capacity * HashMapOpenAddressing.load_threshold:
+            capacity *= HashMapOpenAddressing.extend_ratio
+        self._rebuild(capacity=self._probe.fit_capacity(capacity=capacity)) # 容量不变时只清理删除标记
+
+    def put_many(self, items: Iterable[Tuple[K, V]]) -> None:
+        """批量新增或更新键值对；能够确定数量时只调整一次容量，之后插入不再逐个检查负载
+
+        Args:
+            items (Iterable[Tuple[K, V]]): 键值对序列
+        """
+        key: K
+        val: V
+        if not isinstance(items, Sized): # 无法预知数量，逐个插入
+            for key, val in items:
+                self.put(key=key, val=val)
+            return
+        self.reserve(n=self._size + len(items)) # 按所有键都不存在预留，保证插入过程中数组中始终有 None
+        for key, val in items:
+            self._put(key=key, val=val)
+
+    def update(self, mapping: Mapping[K, V] | Iterable[Tuple[K, V]]) -> None:
+        """用另一个映射（或键值对序列）中的键值对批量新增或更新
+
+        Args:
+            mapping (Mapping[K, V] | Iterable[Tuple[K, V]]): 拥有 items 方法的映射（本仓库中的各种映射或 dict），或者键值对序列
+        """
+        self.put_many(items=mapping.items() if hasattr(mapping, "items") else mapping) # type: ignore
+
+    @classmethod # 类方法
+    def from_items(cls, items: Iterable[Tuple[K, V]], size_hint: Optional[int] = None) -> "HashMapOpenAddressing[K, V]":
+        """由键值对序列构建哈希表，一次性确定容量，避免逐步扩容
+
+        Args:
+            items (Iterable[Tuple[K, V]]): 键值对序列
+            size_hint (Optional[int], optional): 预计的键值对数量，为 None 时尝试取序列的长度. Defaults to None.
+
+        Returns:
+            HashMapOpenAddressing[K, V]: 哈希表
+        """
+        hash_map: HashMapOpenAddressing[K, V] = cls()
+        if size_hint is not None:
+            hash_map.reserve(n=size_hint)
+        hash_map.put_many(items=items)
+        return hash_map
+
+    def _rebuild(self, capacity: int) -> None:
+        """以指定的容量重建数组桶
+
+        Args:
+            capacity (int): 新的容量
+        """
         cur: List[Optional[Pair]] = self._bucket
         prev_capacity: int = self._capacity
-        self._capacity *= HashMapOpenAddressing.extend_ratio
+        self._capacity = capacity
         self._bucket = [None] * self._capacity
+        self._tombstones = 0 # 重建后不再有删除标记
+        self._resizes += 1
+        self._modcount += 1
         i: int = 0 # 当前桶
         n: int = 0 # 已经复制了的元素个数
         while i < prev_capacity:
@@ -166,62 +451,48 @@ class HashMapOpenAddressing(Generic[K, V]):
             item: Optional[Pair[K, V]] = cur[i]
             i += 1
             if (item is not None) and (item is not HashMapOpenAddressing._TOMBSTONE):
-                idx: int = self.hash_func(key=item._key)
+                idx: int = item._hash % self._capacity # type: ignore # 复用保存的哈希值
+                probe: int = 0 # 再探测次数
                 while self._bucket[idx] is not None:
-                    idx = self.rehash(old_hash=idx)
+                    probe += 1
+                    idx = self.rehash(old_hash=idx, i=probe, hash_code=item._hash) # type: ignore
                 self._bucket[idx] = item
                 n += 1
 
-    def keys(self) -> List[K]:
+    def _entries(self) -> Generator[Tuple[K, V], None, None]:
+        """依次遍历所有键值对
+
+        Yields:
+            Generator[Tuple[K, V], None, None]: (键, 值)
+        """
+        item: Optional[Pair[K, V]]
+        for item in self._bucket:
+            if (item is not None) and (item is not HashMapOpenAddressing._TOMBSTONE):
+                yield (item._key, item._val)
+
+    def keys(self) -> KeysView[K]:
         """查看所有键
 
         Returns:
-            List[K]: 将哈希表中的键以列表的形式返回
+            KeysView[K]: 惰性遍历的键视图
         """
-        result: List[Optional[K]] = [None] * self._size
-        idx: int = 0
-        for i in range(self._capacity):
-            item: Optional[Pair[K, V]] = self._bucket[i]
-            if (item is not None) and (item is not HashMapOpenAddressing._TOMBSTONE):
-                result[idx] = item._key
-                idx += 1
-            if idx >= self._size:
-                break
-        return result # type: ignore
-    
-    def values(self) -> List[V]:
+        return KeysView[K](mapping=self)
+
+    def values(self) -> ValuesView[V]:
         """查看所有值
 
         Returns:
-            List[K]: 将哈希表中的值以列表的形式返回
+            ValuesView[V]: 惰性遍历的值视图
         """
-        result: List[Optional[V]] = [None] * self._size
-        idx: int = 0
-        for i in range(self._capacity):
-            item: Optional[Pair[K, V]] = self._bucket[i]
-            if (item is not None) and (item is not HashMapOpenAddressing._TOMBSTONE):
-                result[idx] = item._val
-                idx += 1
-            if idx >= self._size:
-                break
-        return result # type: ignore
-    
-    def items(self) -> List[Tuple[K, V]]:
+        return ValuesView[V](mapping=self)
+
+    def items(self) -> ItemsView[Tuple[K, V]]:
         """查看所有键值对
 
         Returns:
-            List[K]: 将哈希表中的键值对元组以列表的形式返回
+            ItemsView[Tuple[K, V]]: 惰性遍历的键值对视图
         """
-        result: List[Optional[Tuple[K, V]]] = [None] * self._size
-        idx: int = 0
-        for i in range(self._capacity):
-            item: Optional[Pair[K, V]] = self._bucket[i]
-            if (item is not None) and (item is not HashMapOpenAddressing._TOMBSTONE):
-                result[idx] = (item._key, item._val)
-                idx += 1
-            if idx >= self._size:
-                break
-        return result # type: ignore
+        return ItemsView[Tuple[K, V]](mapping=self)
     
     def __getitem__(self, key: K) -> V:
         """查询键值对
@@ -317,211 +588,1621 @@ class HashMapOpenAddressing(Generic[K, V]):
 
 
 
-class Node(Generic[K, V]):
-    """链表节点"""
-    def __init__(self, key: K, val: V) -> None:
+class RobinHoodPair(Pair[K, V]):
+    """记录了探测距离的键值对"""
+    def __init__(self, key: K, val: V, dist: int, hash_code: Optional[int] = None) -> None:
         """构造方法
 
         Args:
             key (K): 键
             val (V): 值
+            dist (int): 探测距离，即所在的桶与哈希函数值之间的距离
+            hash_code (Optional[int], optional): 键的哈希值. Defaults to None.
         """
-        self._key: K = key
-        self._val: V = val
-        self.next: Optional[Node[K, V]] = None
-
-class HashMapChaining(Generic[K, V]):
-    """链式地址哈希表，数组的每一个桶存储的都是节点"""
-    capacity: Final[int] = 13 # 初始容量（不可变）
-    extend_ratio: Final[int] = 2 # 扩容系数（不可变）
-    avg_threshold: Final[int] = 8 # 平均每个桶可以存储的最大元素个数（用于触发扩容，不可变）
+        super().__init__(key=key, val=val, hash_code=hash_code)
+        self._dist: int = dist
 
+class HashMapRobinHood(HashMapOpenAddressing[K, V]):
+    """
+    采用罗宾汉（Robin Hood）线性探测的开放寻址哈希表；
+    插入时如果遇到探测距离比自身更短的键值对，就将其挤出并继续为它寻找位置（劫富济贫），使得探测距离的方差更小；
+    由于探测距离沿探测方向不会骤降，查找时一旦遇到探测距离比当前更短的桶即可断定键不存在；
+    删除时将后续的键值对依次前移（反向移位），因此不需要删除标记；
+    上述性质都依赖于线性探测，因此不能替换探测策略
+    """
+    @override
     def __init__(self) -> None:
         """构造方法"""
-        self._capacity: int = HashMapChaining.capacity
-        self._bucket: List[Optional[Node[K, V]]] = [None] * self._capacity
-        self._size: int = 0
-        
+        super().__init__(probe=LinearProbe())
 
-    @staticmethod # 静态方法（用类名或者实例来调用）
-    def Hash(key: K) -> int:
-        """哈希算法
+    @override
+    def put(self, key: K, val: V) -> None:
+        """新增或更新键值对
 
         Args:
             key (K): 键
-
-        Returns:
-            int: 键的哈希值
+            val (V): 值
         """
-        return hash(key)
+        if self._size / self._capacity >= HashMapOpenAddressing.load_threshold: # 扩容
+            self._extend()
+        self._put(key=key, val=val)
 
-    def hash_func(self, key: K) -> int:
-        """哈希函数
+    @override
+    def _put(self, key: K, val: V) -> None:
+        """新增或更新键值对，不检查负载（由调用方保证插入后数组中仍有 None）
 
         Args:
             key (K): 键
+            val (V): 值
+        """
+        hash_code: int = HashMapOpenAddressing.Hash(key=key)
+        idx: int = hash_code % self._capacity
+        dist: int = 0
+        while self._bucket[idx] is not None: # 扩容机制保证了数组中一定有 None 的存在
+            item: RobinHoodPair[K, V] = self._bucket[idx] # type: ignore
+            if (item._hash == hash_code) and (item._key == key): # 键存在则更新其对应值
+                item._val = val
+                self._record(probes=dist + 1, hit=True)
+                return
+            if item._dist < dist: # 键不存在，将其放在此处，再为被挤出的键值对寻找位置
+                self._bucket[idx] = RobinHoodPair(key=key, val=val, dist=dist, hash_code=hash_code)
+                self._size += 1
+                self._modcount += 1
+                self._record(probes=dist + 1, hit=False)
+                self._place(item=item, idx=self.rehash(old_hash=idx))
+                return
+            idx = self.rehash(old_hash=idx)
+            dist += 1
+        self._bucket[idx] = RobinHoodPair(key=key, val=val, dist=dist, hash_code=hash_code)
+        self._size += 1
+        self._modcount += 1
+        self._record(probes=dist + 1, hit=False)
 
-        Returns:
-            int: 键的哈希函数值
+    def _place(self, item: RobinHoodPair[K, V], idx: int) -> None:
+        """从指定的桶开始为一个（确定不在哈希表中的）键值对寻找位置
+
+        Args:
+            item (RobinHoodPair[K, V]): 待放置的键值对
+            idx (int): 开始探测的桶
         """
-        return HashMapChaining.Hash(key=key) % self._capacity
+        item._dist = (idx - item._hash) % self._capacity # type: ignore
+        while self._bucket[idx] is not None:
+            cur: RobinHoodPair[K, V] = self._bucket[idx] # type: ignore
+            if cur._dist < item._dist: # 挤出探测距离更短的键值对
+                self._bucket[idx], item = item, cur
+            idx = self.rehash(old_hash=idx)
+            item._dist += 1
+        self._bucket[idx] = item
 
-    def put(self, key: K, val: V) -> None:
-        """新增或更新键值对
+    @override
+    def index(self, key: K) -> int:
+        """确定索引位置
 
         Args:
             key (K): 键
-            val (V): 值
+
+        Raises:
+            KeyError: 键在哈希表中不存在
+
+        Returns:
+            int: 哈希表中存放键的位置
         """
-        if self._size >= HashMapChaining.avg_threshold * self._capacity: # 扩容
-            self._extend()
-        idx: int = self.hash_func(key=key)
-        if self._bucket[idx] is not None:
-            cur: Node[K, V] = self._bucket[idx] # type: ignore
-            while cur.next is not None:
-                if cur._key == key: # 键存在，更新键值对
-                    cur._val = val
-                    return
-                cur = cur.next
-            if cur._key == key: # 检查当前存在的最后一个节点
-                cur._val = val
-                return
-            cur.next = Node(key=key, val=val) # 键不存在，在尾部新增节点
-        else: # 桶为空，直接在此处存储元素
-            self._bucket[idx] = Node(key=key, val=val)
-        self._size += 1
-    
+        hash_code: int = HashMapOpenAddressing.Hash(key=key)
+        idx: int = hash_code % self._capacity
+        dist: int = 0
+        while (self._bucket[idx] is not None) and (self._bucket[idx]._dist >= dist): # type: ignore # 遇到探测距离更短的桶即可提前结束
+            if (self._bucket[idx]._hash == hash_code) and (self._bucket[idx]._key == key): # type: ignore # 键存在
+                self._record(probes=dist + 1, hit=True)
+                return idx
+            idx = self.rehash(old_hash=idx)
+            dist += 1
+        self._record(probes=dist + 1, hit=False)
+        raise KeyError(f"{key}不在哈希表中")
+
+    @override
     def remove(self, key: K) -> None:
-        """删除键值对
+        """删除键值对，并将后续探测距离不为 0 的键值对依次前移一位
 
         Args:
             key (K): 待删除的键
         """
-        idx: int = self.hash_func(key=key)
-        if self._bucket[idx] is not None:
-            cur: Node[K, V] = self._bucket[idx] # type: ignore
-            if cur._key == key:
-                self._bucket[idx] = cur.next
-                cur.next = None # 便于内存回收
-                self._size -= 1
-                return
-            while cur.next is not None: # 在 cur 定位到某个桶时，这个桶在这之前已经被检查过了
-                if cur.next._key == key:
-                    tmp: Node = cur.next
-                    cur.next = tmp.next
-                    tmp.next = None # 便于内存回收
-                    self._size -= 1
-                    return
-                cur = cur.next
-        raise KeyError(f"{key}不在哈希表中")
-    
-    def get(self, key: K) -> V:
-        """查询键值对
+        idx: int = self.index(key=key)
+        nxt: int = self.rehash(old_hash=idx)
+        while (self._bucket[nxt] is not None) and (self._bucket[nxt]._dist > 0): # type: ignore
+            self._bucket[idx] = self._bucket[nxt]
+            self._bucket[idx]._dist -= 1 # type: ignore
+            idx = nxt
+            nxt = self.rehash(old_hash=nxt)
+        self._bucket[idx] = None
+        self._size -= 1
+        self._modcount += 1
 
-        Args:
-            key (K): 待查询的键
+    @override
+    def _rebuild(self, capacity: int) -> None:
+        """以指定的容量重建数组桶
 
-        Returns:
-            V: 值
+        Args:
+            capacity (int): 新的容量
         """
-        idx: int = self.hash_func(key=key)
-        cur: Optional[Node[K, V]] = self._bucket[idx]
-        while cur is not None:
-            if cur._key == key: # 键存在，返回值
-                return cur._val
-            cur = cur.next
-        raise KeyError(f"{key}不在哈希表中")
-    
-    def _extend(self) -> None:
-        """扩容"""
-        cur: List[Optional[Node[K, V]]] = self._bucket
-        prev_capacity: int = self._capacity
-        self._capacity *= HashMapChaining.extend_ratio
+        cur: List[Optional[Pair]] = self._bucket
+        self._capacity = capacity
         self._bucket = [None] * self._capacity
-        i: int = 0 # 当前桶
-        n: int = 0 # 已经复制了的元素个数
-        item: Optional[Node[K, V]] = cur[i] # 当前节点
-        while i < prev_capacity:
-            if n == self._size:
-                break
+        self._resizes += 1
+        self._modcount += 1
+        item: Optional[RobinHoodPair[K, V]]
+        for item in cur: # type: ignore
             if item is not None:
-                idx: int = self.hash_func(key=item._key)
-                tmp: Optional[Node[K, V]] = self._bucket[idx]
-                self._bucket[idx] = item # 在链表头部新增节点
-                item = item.next
-                self._bucket[idx].next = tmp # type: ignore # 更新完 item 再更新链表头节点的下一个指向
-                n += 1
-            else:
-                i += 1
-                item = cur[i]
-    
-    def keys(self) -> List[K]:
-        """查看所有键
+                self._place(item=item, idx=item._hash % self._capacity) # type: ignore
 
-        Returns:
-            List[K]: 将哈希表中的键以列表的形式返回
+
+
+class HashMapOpenAddressingIncremental(HashMapOpenAddressing[K, V]):
+    """
+    渐进式扩容的开放寻址哈希表（类似 Redis 的渐进式 rehash）；
+    扩容时只分配新的数组桶，旧数组桶中的键值对在之后的每次增删时分批迁移，避免一次性迁移所有键值对造成的停顿；
+    查询不会迁移（类似 Redis 遍历时暂停 rehash），因此只读的遍历中可以随意查询；
+    迁移期间每个键只存在于新旧数组桶中的一个，新增的键值对总是存放在新的数组桶中
+    """
+    rehash_step: Final[int] = 4 # 每次操作最多迁移的旧桶数量，需保证新的数组桶触发扩容之前迁移已经完成（不可变）
+
+    def __init__(self, probe: Optional[ProbeStrategy] = None) -> None:
+        """构造方法
+
+        Args:
+            probe (Optional[ProbeStrategy], optional): 探测策略，为 None 时采用线性探测. Defaults to None.
         """
-        result: List[Optional[K]] = [None] * self._size
-        idx: int = 0
-        for i in range(self._capacity):
-            cur: Optional[Node[K, V]] = self._bucket[i]
-            while cur is not None:
-                result[idx] = cur._key
-                idx += 1
-                cur = cur.next
-        return result # type: ignore
-    
-    def values(self) -> List[V]:
-        """查看所有值
+        super().__init__(probe=probe)
+        self._old_bucket: Optional[List[Optional[Pair[K, V]]]] = None # 旧数组桶，不在迁移时为 None
+        self._old_capacity: int = 0 # 旧数组桶的容量
+        self._rehash_idx: int = 0 # 下一个待迁移的旧桶
+
+    def is_rehashing(self) -> bool:
+        """是否正在迁移
 
         Returns:
-            List[K]: 将哈希表中的值以列表的形式返回
+            bool: 是否正在迁移
         """
-        result: List[Optional[V]] = [None] * self._size
-        idx: int = 0
-        for i in range(self._capacity):
-            cur: Optional[Node[K, V]] = self._bucket[i]
-            while cur is not None:
-                result[idx] = cur._val
-                idx += 1
-                cur = cur.next
-        return result # type: ignore
-    
-    def items(self) -> List[Tuple[K, V]]:
-        """查看所有键值对
+        return self._old_bucket is not None
+
+    def rehash_progress(self) -> float:
+        """查看迁移进度
 
         Returns:
-            List[K]: 将哈希表中的键值对元组以列表的形式返回
+            float: 已经迁移了的旧桶的比例，不在迁移时为 1.0
         """
-        result: List[Optional[Tuple[K, V]]] = [None] * self._size
-        idx: int = 0
-        for i in range(self._capacity):
-            cur: Optional[Node[K, V]] = self._bucket[i]
-            while cur is not None:
-                result[idx] = (cur._key, cur._val)
-                idx += 1
-                cur = cur.next
-        return result # type: ignore
+        if self._old_bucket is None:
+            return 1.0
+        return self._rehash_idx / self._old_capacity
 
-    def __getitem__(self, key: K) -> V:
-        """查询键值对
+    def _rehash_step(self, n: int) -> None:
+        """迁移至多 n 个旧桶
 
         Args:
-            key (K): 待查询的键
-
-        Returns:
-            V: 值
+            n (int): 迁移的旧桶数量
         """
-        return self.get(key=key)
-    
-    def __setitem__(self, key: K, val: V) -> None:
-        """新增或更新键值对
+        if self._old_bucket is None:
+            return
+        stop: int = min(self._rehash_idx + n, self._old_capacity)
+        while self._rehash_idx < stop:
+            item: Optional[Pair[K, V]] = self._old_bucket[self._rehash_idx]
+            if (item is not None) and (item is not HashMapOpenAddressing._TOMBSTONE):
+                idx: int = item._hash % self._capacity # type: ignore # 迁移期间每个键只存在于一个数组桶中，因此新的数组桶中一定没有该键
+                probe: int = 0 # 再探测次数
+                while (self._bucket[idx] is not None) and (self._bucket[idx] is not HashMapOpenAddressing._TOMBSTONE):
+                    probe += 1
+                    idx = self.rehash(old_hash=idx, i=probe, hash_code=item._hash) # type: ignore
+                if self._bucket[idx] is HashMapOpenAddressing._TOMBSTONE:
+                    self._tombstones -= 1
+                self._bucket[idx] = item
+                self._old_bucket[self._rehash_idx] = HashMapOpenAddressing._TOMBSTONE # 不能改为 None，否则会截断旧数组桶中尚未迁移的键的探测路径
+                self._modcount += 1 # 迁移会改变键值对的位置，属于结构性修改（只在增删时发生）
+            self._rehash_idx += 1
+        if self._rehash_idx == self._old_capacity: # 迁移完成
+            self._old_bucket = None
+            self._old_capacity = 0
+            self._rehash_idx = 0
+
+    def _old_index(self, key: K) -> int:
+        """在旧数组桶中确定索引位置
 
         Args:
             key (K): 键
-            val (V): 值
-        """
-        self.put(key=key, val=val)
+
+        Returns:
+            int: 旧数组桶中存放键的位置，键不在旧数组桶中时为 -1
+        """
+        if self._old_bucket is None:
+            return -1
+        hash_code: int = HashMapOpenAddressing.Hash(key=key)
+        idx: int = hash_code % self._old_capacity
+        i: int = 0 # 再探测次数
+        while self._old_bucket[idx] is not None:
+            item: Pair[K, V] = self._old_bucket[idx] # type: ignore
+            if (item._hash == hash_code) and (item._key == key): # 删除标记的哈希值为 None，不会被匹配
+                return idx
+            i += 1
+            idx = self._probe.next(idx=idx, i=i, hash_code=hash_code, capacity=self._old_capacity)
+        return -1
+
+    @override
+    def _extend(self) -> None:
+        """重建数组桶：先完成尚未完成的迁移，再分配新的数组桶（容量的确定方式同非渐进式），旧数组桶留待之后分批迁移"""
+        self._rehash_step(n=self._old_capacity)
+        capacity: int = self._fit_capacity()
+        self._old_bucket = self._bucket
+        self._old_capacity = self._capacity
+        self._rehash_idx = 0
+        self._capacity = capacity
+        self._bucket = [None] * self._capacity
+        self._tombstones = 0
+        self._resizes += 1
+        self._modcount += 1
+
+    @override
+    def compact(self) -> None:
+        """手动清理删除标记，键值对过少时同时缩容（不会扩容），会先完成尚未完成的迁移"""
+        self._rehash_step(n=self._old_capacity)
+        super().compact()
+
+    @override
+    def reserve(self, n: int) -> None:
+        """预留容量，会先完成尚未完成的迁移，之后批量插入时无需再查找旧数组桶
+
+        Args:
+            n (int): 预计存放的键值对总数
+        """
+        self._rehash_step(n=self._old_capacity)
+        super().reserve(n=n)
+
+    @override
+    def put(self, key: K, val: V) -> None:
+        """新增或更新键值对
+
+        Args:
+            key (K): 键
+            val (V): 值
+        """
+        self._rehash_step(n=HashMapOpenAddressingIncremental.rehash_step)
+        if (self._size + self._tombstones) / self._capacity >= HashMapOpenAddressing.load_threshold: # 扩容必须在查找旧数组桶之前，否则扩容后键可能留在新的旧数组桶中
+            self._extend()
+        idx: int = self._old_index(key=key)
+        if idx >= 0: # 键在旧数组桶中，直接更新
+            self._old_bucket[idx]._val = val # type: ignore
+            return
+        super().put(key=key, val=val)
+
+    @override
+    def get(self, key: K) -> V:
+        """查询键值对
+
+        Args:
+            key (K): 待查询的键
+
+        Raises:
+            KeyError: 键在哈希表中不存在
+
+        Returns:
+            V: 值
+        """
+        idx: int = self._old_index(key=key) # 查询不迁移键值对，否则正在进行的遍历可能重复访问被迁移到新数组桶的键
+        if idx >= 0:
+            return self._old_bucket[idx]._val # type: ignore
+        return super().get(key=key)
+
+    @override
+    def remove(self, key: K) -> None:
+        """删除键值对
+
+        Args:
+            key (K): 待删除的键
+
+        Raises:
+            KeyError: 键在哈希表中不存在
+        """
+        self._rehash_step(n=HashMapOpenAddressingIncremental.rehash_step)
+        idx: int = self._old_index(key=key)
+        if idx >= 0:
+            self._old_bucket[idx] = HashMapOpenAddressing._TOMBSTONE # type: ignore
+            self._size -= 1
+            self._modcount += 1
+            return
+        super().remove(key=key)
+
+    @override
+    def __contains__(self, key: K) -> bool:
+        """哈希表中是否存在指定键
+
+        Args:
+            key (K): 键
+
+        Returns:
+            bool: 键在哈希表中是否存在
+        """
+        return (self._old_index(key=key) >= 0) or super().__contains__(key)
+
+    def _pairs(self) -> Generator[Pair[K, V], None, None]:
+        """依次遍历旧数组桶和新数组桶中的键值对
+
+        Yields:
+            Generator[Pair[K, V], None, None]: 键值对
+        """
+        bucket: List[Optional[Pair[K, V]]]
+        for bucket in (self._old_bucket or [], self._bucket):
+            item: Optional[Pair[K, V]]
+            for item in bucket:
+                if (item is not None) and (item is not HashMapOpenAddressing._TOMBSTONE):
+                    yield item
+
+    @override
+    def _entries(self) -> Generator[Tuple[K, V], None, None]:
+        """依次遍历旧数组桶和新数组桶中的键值对
+
+        Yields:
+            Generator[Tuple[K, V], None, None]: (键, 值)
+        """
+        item: Pair[K, V]
+        for item in self._pairs():
+            yield (item._key, item._val)
+
+    class Itr(Iterator):
+        """该类配套的迭代器"""
+        def __init__(self, outer: "HashMapOpenAddressingIncremental[K, V]") -> None:
+            """构造方法
+
+            Args:
+                outer (HashMapOpenAddressingIncremental[K, V]): 指向外部类的引用
+            """
+            self.pairs: Generator[Pair[K, V], None, None] = outer._pairs() # type: ignore
+
+        @override
+        def __next__(self) -> K:
+            """实现 Iterator 接口声明的 __next__ 方法
+
+            Raises:
+                StopIteration: 停止迭代
+
+            Returns:
+                K: 
+            """
+            return next(self.pairs)._key
+
+    @override
+    def __iter__(self) -> Itr: # type: ignore
+        """使自身可迭代
+
+        Returns:
+            Itr: 类内部实现的迭代器
+        """
+        return self.Itr(outer=self)
+
+
+
+class HashMapCompact(Generic[K, V]):
+    """
+    紧凑布局的开放寻址哈希表（类似 CPython 3.6 之后的 dict）；
+    稀疏的索引表只存放键值对在稠密数组中的位置，并根据容量选用最窄的整数类型，
+    键值对本身按插入顺序依次存放在 hashes、keys、values 三个稠密数组中，
+    因此不需要为每个键值对分配对象，遍历时也只需要扫描稠密数组，且遍历顺序即插入顺序
+    """
+    _EMPTY: Final[int] = -1 # 索引表中的空桶（不可变）
+    _DUMMY: Final[int] = -2 # 索引表中的删除标记（不可变）
+    _DELETED: Final[object] = object() # 稠密数组中已删除的键（不可变）
+    capacity: Final[int] = 8 # 初始容量，必须是 2 的幂（不可变）
+    usable_ratio: Final[float] = 2 / 3 # 稠密数组的长度（含已删除的键值对）达到容量的该比例时触发扩容（不可变）
+
+    def __init__(self) -> None:
+        """构造方法"""
+        self._capacity: int = HashMapCompact.capacity # 索引表容量
+        self._indices: array = HashMapCompact._new_indices(capacity=self._capacity) # 稀疏的索引表
+        self._hashes: List[int] = [] # 稠密数组，键的哈希值
+        self._keys: List[K] = [] # 稠密数组，键
+        self._values: List[Optional[V]] = [] # 稠密数组，值
+        self._size: int = 0 # 键值对数量
+        self._modcount: int = 0 # 结构性修改的次数，用于在视图迭代过程中检测修改
+
+    @staticmethod
+    def _new_indices(capacity: int) -> array:
+        """根据容量创建元素宽度最小的索引表
+
+        Args:
+            capacity (int): 容量
+
+        Returns:
+            array: 所有桶均为空的索引表
+        """
+        typecode: str
+        if capacity <= 2**7:
+            typecode = "b"
+        elif capacity <= 2**15:
+            typecode = "h"
+        elif capacity <= 2**31:
+            typecode = "i"
+        else:
+            typecode = "q"
+        return array(typecode, [HashMapCompact._EMPTY]) * capacity
+
+    @staticmethod
+    def Hash(key: K) -> int:
+        """哈希算法
+
+        Args:
+            key (K): 键
+
+        Returns:
+            int: 键的哈希值
+        """
+        return hash(key)
+
+    def _lookup(self, key: K, hash_code: int) -> Tuple[int, int]:
+        """在索引表中查找键
+
+        Args:
+            key (K): 键
+            hash_code (int): 键的哈希值
+
+        Returns:
+            Tuple[int, int]: (桶, 键值对在稠密数组中的位置)；键不存在时位置为 -1，桶为可以用于插入的桶
+        """
+        mask: int = self._capacity - 1
+        idx: int = hash_code & mask
+        first_dummy: int = -1 # 遇到的首个删除标记
+        while True: # 扩容机制保证了索引表中一定有空桶
+            entry: int = self._indices[idx]
+            if entry == HashMapCompact._EMPTY:
+                return (first_dummy if first_dummy >= 0 else idx, -1)
+            if entry == HashMapCompact._DUMMY:
+                if first_dummy < 0:
+                    first_dummy = idx
+            elif (self._hashes[entry] == hash_code) and ((self._keys[entry] is key) or (self._keys[entry] == key)): # 先比较哈希值再比较键
+                return (idx, entry)
+            idx = (idx + 1) & mask # 线性探测
+
+    def put(self, key: K, val: V) -> None:
+        """新增或更新键值对
+
+        Args:
+            key (K): 键
+            val (V): 值
+        """
+        hash_code: int = HashMapCompact.Hash(key=key)
+        idx: int
+        entry: int
+        idx, entry = self._lookup(key=key, hash_code=hash_code)
+        if entry >= 0: # 键存在则更新其对应值
+            self._values[entry] = val
+            return
+        if len(self._keys) >= self._capacity * HashMapCompact.usable_ratio: # 扩容（或仅清理已删除的键值对）后需重新查找插入的桶
+            self._resize()
+            idx, entry = self._lookup(key=key, hash_code=hash_code)
+        self._indices[idx] = len(self._keys)
+        self._hashes.append(hash_code)
+        self._keys.append(key)
+        self._values.append(val)
+        self._size += 1
+        self._modcount += 1
+
+    def get(self, key: K) -> V:
+        """查询键值对
+
+        Args:
+            key (K): 待查询的键
+
+        Raises:
+            KeyError: 键在哈希表中不存在
+
+        Returns:
+            V: 值
+        """
+        entry: int = self._lookup(key=key, hash_code=HashMapCompact.Hash(key=key))[1]
+        if entry < 0:
+            raise KeyError(f"{key}不在哈希表中")
+        return self._values[entry] # type: ignore
+
+    def remove(self, key: K) -> None:
+        """删除键值对，索引表中留下删除标记，稠密数组中留下空位，二者都在下次扩容时清理
+
+        Args:
+            key (K): 待删除的键
+
+        Raises:
+            KeyError: 键在哈希表中不存在
+        """
+        idx: int
+        entry: int
+        idx, entry = self._lookup(key=key, hash_code=HashMapCompact.Hash(key=key))
+        if entry < 0:
+            raise KeyError(f"{key}不在哈希表中")
+        self._indices[idx] = HashMapCompact._DUMMY
+        self._keys[entry] = HashMapCompact._DELETED # type: ignore
+        self._values[entry] = None
+        self._size -= 1
+        self._modcount += 1
+
+    def _resize(self) -> None:
+        """重建索引表，并压缩稠密数组中已删除的键值对；容量取能容纳 3 倍键值对数量的最小的 2 的幂"""
+        capacity: int = HashMapCompact.capacity
+        while capacity < 3 * self._size:
+            capacity *= 2
+        hashes: List[int] = self._hashes
+        keys: List[K] = self._keys
+        values: List[Optional[V]] = self._values
+        self._capacity = capacity
+        self._indices = HashMapCompact._new_indices(capacity=capacity)
+        self._hashes, self._keys, self._values = [], [], []
+        self._modcount += 1
+        mask: int = capacity - 1
+        i: int
+        for i in range(len(keys)):
+            if keys[i] is HashMapCompact._DELETED:
+                continue
+            idx: int = hashes[i] & mask
+            while self._indices[idx] != HashMapCompact._EMPTY:
+                idx = (idx + 1) & mask
+            self._indices[idx] = len(self._keys)
+            self._hashes.append(hashes[i])
+            self._keys.append(keys[i])
+            self._values.append(values[i])
+
+    def _entries(self) -> Generator[Tuple[K, V], None, None]:
+        """按插入顺序依次遍历所有键值对
+
+        Yields:
+            Generator[Tuple[K, V], None, None]: (键, 值)
+        """
+        i: int
+        for i in range(len(self._keys)):
+            if self._keys[i] is not HashMapCompact._DELETED:
+                yield (self._keys[i], self._values[i]) # type: ignore
+
+    def keys(self) -> KeysView[K]:
+        """查看所有键
+
+        Returns:
+            KeysView[K]: 惰性遍历的键视图
+        """
+        return KeysView[K](mapping=self)
+
+    def values(self) -> ValuesView[V]:
+        """查看所有值
+
+        Returns:
+            ValuesView[V]: 惰性遍历的值视图
+        """
+        return ValuesView[V](mapping=self)
+
+    def items(self) -> ItemsView[Tuple[K, V]]:
+        """查看所有键值对
+
+        Returns:
+            ItemsView[Tuple[K, V]]: 惰性遍历的键值对视图
+        """
+        return ItemsView[Tuple[K, V]](mapping=self)
+
+    def __getitem__(self, key: K) -> V:
+        """查询键值对
+
+        Args:
+            key (K): 待查询的键
+
+        Returns:
+            V: 值
+        """
+        return self.get(key=key)
+
+    def __setitem__(self, key: K, val: V) -> None:
+        """新增或更新键值对
+
+        Args:
+            key (K): 键
+            val (V): 值
+        """
+        self.put(key=key, val=val)
+
+    def __delitem__(self, key: K) -> None:
+        """删除键值对
+
+        Args:
+            key (K): 待删除的键
+        """
+        self.remove(key=key)
+
+    def __len__(self) -> int:
+        """查看哈希表长度
+
+        Returns:
+            int: 哈希表中键值对数量
+        """
+        return self._size
+
+    def __contains__(self, key: K) -> bool:
+        """哈希表中是否存在指定键
+
+        Args:
+            key (K): 键
+
+        Returns:
+            bool: 键在哈希表中是否存在
+        """
+        return self._lookup(key=key, hash_code=HashMapCompact.Hash(key=key))[1] >= 0
+
+    class Itr(Iterator):
+        """该类配套的迭代器"""
+        def __init__(self, outer: "HashMapCompact[K, V]") -> None:
+            """构造方法
+
+            Args:
+                outer (HashMapCompact[K, V]): 指向外部类的引用
+            """
+            self.outer: HashMapCompact[K, V] = outer # type: ignore
+            self.cursor: int = 0 # 稠密数组中的当前位置
+
+        @override
+        def __next__(self) -> K:
+            """实现 Iterator 接口声明的 __next__ 方法
+
+            Raises:
+                StopIteration: 停止迭代
+
+            Returns:
+                K: 
+            """
+            while self.cursor < len(self.outer._keys):
+                key: K = self.outer._keys[self.cursor] # type: ignore
+                self.cursor += 1
+                if key is not HashMapCompact._DELETED:
+                    return key
+            raise StopIteration
+
+    def __iter__(self) -> Itr:
+        """使自身可迭代
+
+        Returns:
+            Itr: 类内部实现的迭代器
+        """
+        return self.Itr(outer=self)
+
+
+
+class HashMapCuckoo(Generic[K, V]):
+    """
+    布谷鸟哈希表；
+    两张数组桶各自使用一个带种子的哈希函数，每个键只可能存放在两个候选桶之一，因此查找最多检查两个桶；
+    插入时若两个候选桶都被占据，就踢出其中的键值对并将其放到它的另一个候选桶，依此类推；
+    踢出次数超过上限时（通常意味着出现了环）更换种子重建，负载过高时同时扩容；
+    重建时同一容量下最多尝试 max_reseeds 组种子，仍无处安置的少量键值对才放入容量有限的溢出区，
+    溢出区放不下时扩容，因此查找最多检查两个桶和 max_stash 个溢出槽位；
+    完整哈希值相同的键只有两个候选桶，第三个及以后的键任何种子都无法安置，
+    这类键不重建也不占用溢出区，而是按完整哈希值停放在链式地址哈希表中，查找仍为 O(1)
+    """
+    capacity: Final[int] = 8 # 每张数组桶的初始容量，必须是 2 的幂（不可变）
+    extend_ratio: Final[int] = 2 # 扩容系数（不可变）
+    load_threshold: Final[float] = 0.45 # 触发扩容的负载因子阈值，两张数组桶各一个槽位时负载接近一半插入失败率急剧上升（不可变）
+    max_kicks: Final[int] = 64 # 单次插入最多踢出的次数（不可变）
+    max_reseeds: Final[int] = 4 # 同一容量下重建时最多尝试的种子组数（不可变）
+    max_stash: Final[int] = 4 # 溢出区的容量上限，超出时扩容（不可变）
+    _MASK: Final[int] = (1 << 64) - 1 # 将哈希值截断为 64 位无符号整数（不可变）
+
+    def __init__(self) -> None:
+        """构造方法"""
+        self._capacity: int = HashMapCuckoo.capacity # 每张数组桶的容量
+        self._shift: int = 65 - self._capacity.bit_length() # 乘积右移的位数，使得结果落在 [0, capacity) 中
+        self._tables: List[List[Optional[Pair[K, V]]]] = [[None] * self._capacity, [None] * self._capacity] # 两张数组桶
+        self._seeds: List[int] = HashMapCuckoo._new_seeds() # 两个哈希函数的种子
+        self._stash: List[Pair[K, V]] = [] # 溢出区
+        self._crowd: HashMapChaining[int, List[Pair[K, V]]] = HashMapChaining[int, List[Pair[K, V]]]() # {完整哈希值：两个候选桶已被同哈希值的键占据的键值对}
+        self._parked: int = 0 # 停放在 _crowd 中的键值对数量
+        self._size: int = 0 # 键值对数量
+        self._modcount: int = 0 # 结构性修改的次数，用于在视图迭代过程中检测修改
+        self._rehashes: int = 0 # 重建次数（含扩容）
+
+    @staticmethod
+    def _new_seeds() -> List[int]:
+        """随机生成两个种子（奇数，保证乘法哈希是双射）
+
+        Returns:
+            List[int]: 两个种子
+        """
+        return [getrandbits(64) | 1, getrandbits(64) | 1]
+
+    @staticmethod
+    def Hash(key: K) -> int:
+        """哈希算法
+
+        Args:
+            key (K): 键
+
+        Returns:
+            int: 键的哈希值
+        """
+        return hash(key)
+
+    def hash_func(self, hash_code: int, t: int) -> int:
+        """带种子的哈希函数（乘法哈希，取乘积的高位）
+
+        Args:
+            hash_code (int): 键的哈希值
+            t (int): 第几张数组桶（0 或 1）
+
+        Returns:
+            int: 键在该数组桶中的位置
+        """
+        return ((hash_code * self._seeds[t]) & HashMapCuckoo._MASK) >> self._shift
+
+    def _find(self, key: K, hash_code: int) -> Tuple[int, int]:
+        """确定键所在的位置
+
+        Args:
+            key (K): 键
+            hash_code (int): 键的哈希值
+
+        Returns:
+            Tuple[int, int]: (第几张数组桶, 桶的位置)，在溢出区中时为 (-1, 溢出区中的位置)，
+            停放在 _crowd 中时为 (-2, 在同哈希值列表中的位置)，键不存在时为 (-1, -1)
+        """
+        t: int
+        for t in range(2):
+            idx: int = self.hash_func(hash_code=hash_code, t=t)
+            item: Optional[Pair[K, V]] = self._tables[t][idx]
+            if (item is not None) and (item._hash == hash_code) and (item._key == key):
+                return (t, idx)
+        i: int
+        for i in range(len(self._stash)): # 溢出区通常为空
+            if (self._stash[i]._hash == hash_code) and (self._stash[i]._key == key):
+                return (-1, i)
+        if self._parked > 0:
+            group: List[Pair[K, V]]
+            try:
+                group = self._crowd.get(key=hash_code)
+            except KeyError:
+                return (-1, -1)
+            for i in range(len(group)):
+                if group[i]._key == key:
+                    return (-2, i)
+        return (-1, -1)
+
+    def _shared(self, hash_code: int) -> bool:
+        """两个候选桶是否都已被完整哈希值相同的键占据（此时换种子或扩容都无法再安置该哈希值的键）
+
+        Args:
+            hash_code (int): 键的哈希值
+
+        Returns:
+            bool: 是否都已被占据
+        """
+        t: int
+        for t in range(2):
+            item: Optional[Pair[K, V]] = self._tables[t][self.hash_func(hash_code=hash_code, t=t)]
+            if (item is None) or (item._hash != hash_code):
+                return False
+        return True
+
+    def _park(self, item: Pair[K, V]) -> None:
+        """将无法安置的键值对按完整哈希值停放
+
+        Args:
+            item (Pair[K, V]): 键值对
+        """
+        try:
+            self._crowd.get(key=item._hash).append(item) # type: ignore
+        except KeyError:
+            self._crowd.put(key=item._hash, val=[item]) # type: ignore
+        self._parked += 1
+
+    def _insert(self, item: Pair[K, V]) -> Optional[Pair[K, V]]:
+        """放置一个（确定不在哈希表中的）键值对
+
+        Args:
+            item (Pair[K, V]): 待放置的键值对
+
+        Returns:
+            Optional[Pair[K, V]]: 踢出次数达到上限时仍无处安置的键值对，放置成功时为 None
+        """
+        t: int = 0
+        for _ in range(HashMapCuckoo.max_kicks):
+            idx: int = self.hash_func(hash_code=item._hash, t=t) # type: ignore
+            cur: Optional[Pair[K, V]] = self._tables[t][idx]
+            self._tables[t][idx] = item
+            if cur is None:
+                return None
+            item = cur # 被踢出的键值对只能去另一张数组桶
+            t = 1 - t
+        return item
+
+    def _rehash(self, capacity: int) -> None:
+        """更换种子并以指定的容量重建；
+        同一容量下每组种子都有键值对无处安置时，不超过 max_stash 个则放入溢出区，否则扩容后重试；
+        两个候选桶已被同哈希值的键占据的键值对直接停放，不计入溢出区的上限，也不会引起扩容
+
+        Args:
+            capacity (int): 每张数组桶的新容量
+        """
+        items: List[Pair[K, V]] = [item for table in self._tables for item in table if item is not None] + self._stash
+        self._modcount += 1
+        attempts: int = 0 # 当前容量下已经尝试的种子组数
+        homeless: List[Pair[K, V]]
+        while True:
+            self._capacity = capacity
+            self._shift = 65 - self._capacity.bit_length()
+            self._tables = [[None] * self._capacity, [None] * self._capacity]
+            self._seeds = HashMapCuckoo._new_seeds()
+            self._rehashes += 1
+            homeless = []
+            item: Pair[K, V]
+            for item in items:
+                rest: Optional[Pair[K, V]] = self._insert(item=item)
+                if rest is not None:
+                    homeless.append(rest)
+            stuck: List[Pair[K, V]] = [item for item in homeless if self._shared(hash_code=item._hash)] # type: ignore
+            if len(stuck) > 0: # 任何种子都无法安置，停放后不再参与重建
+                for item in stuck:
+                    self._park(item=item)
+                parked: set = {id(item) for item in stuck}
+                items = [item for item in items if id(item) not in parked]
+                homeless = [item for item in homeless if id(item) not in parked]
+            if len(homeless) == 0:
+                break
+            attempts += 1
+            if attempts < HashMapCuckoo.max_reseeds:
+                continue
+            if len(homeless) <= HashMapCuckoo.max_stash:
+                break
+            capacity *= HashMapCuckoo.extend_ratio
+            attempts = 0
+        self._stash = homeless
+
+    def put(self, key: K, val: V) -> None:
+        """新增或更新键值对
+
+        Args:
+            key (K): 键
+            val (V): 值
+        """
+        hash_code: int = HashMapCuckoo.Hash(key=key)
+        t: int
+        idx: int
+        t, idx = self._find(key=key, hash_code=hash_code)
+        if t >= 0: # 键存在则更新其对应值
+            self._tables[t][idx]._val = val # type: ignore
+            return
+        if t == -2:
+            self._crowd.get(key=hash_code)[idx]._val = val
+            return
+        if idx >= 0:
+            self._stash[idx]._val = val
+            return
+        self._size += 1
+        self._modcount += 1
+        if self._shared(hash_code=hash_code): # 两个候选桶已被同哈希值的键占据，直接停放，无需重建
+            self._park(item=Pair(key=key, val=val, hash_code=hash_code))
+            return
+        if self._size - self._parked > HashMapCuckoo.load_threshold * 2 * self._capacity: # 扩容（停放的键值对不占用桶）
+            self._rehash(capacity=self._capacity * HashMapCuckoo.extend_ratio)
+        homeless: Optional[Pair[K, V]] = self._insert(item=Pair(key=key, val=val, hash_code=hash_code))
+        if homeless is None:
+            return
+        if self._shared(hash_code=homeless._hash): # type: ignore
+            self._park(item=homeless)
+            return
+        # 出现了环，先暂存到溢出区，再更换种子重建（重建会一并安置溢出区中的键值对）；负载并不高时保持原容量
+        self._stash.append(homeless)
+        self._rehash(capacity=self._capacity)
+
+    def get(self, key: K) -> V:
+        """查询键值对
+
+        Args:
+            key (K): 待查询的键
+
+        Raises:
+            KeyError: 键在哈希表中不存在
+
+        Returns:
+            V: 值
+        """
+        hash_code: int = HashMapCuckoo.Hash(key=key)
+        t: int
+        for t in range(2):
+            item: Optional[Pair[K, V]] = self._tables[t][self.hash_func(hash_code=hash_code, t=t)]
+            if (item is not None) and (item._hash == hash_code) and (item._key == key):
+                return item._val
+        if self._stash or self._parked:
+            idx: int
+            t, idx = self._find(key=key, hash_code=hash_code)
+            if t == -2:
+                return self._crowd.get(key=hash_code)[idx]._val
+            if idx >= 0:
+                return self._stash[idx]._val
+        raise KeyError(f"{key}不在哈希表中")
+
+    def remove(self, key: K) -> None:
+        """删除键值对（两个候选桶之外不存在探测路径，因此无需删除标记）
+
+        Args:
+            key (K): 待删除的键
+
+        Raises:
+            KeyError: 键在哈希表中不存在
+        """
+        t: int
+        idx: int
+        hash_code: int = HashMapCuckoo.Hash(key=key)
+        t, idx = self._find(key=key, hash_code=hash_code)
+        if t == -2:
+            self._unpark(hash_code=hash_code, idx=idx)
+        elif t >= 0:
+            self._tables[t][idx] = None
+            if self._parked > 0: # 空出的桶同样是停放的同哈希值键的候选桶
+                try:
+                    self._tables[t][idx] = self._unpark(hash_code=hash_code, idx=-1)
+                except KeyError: # 没有同哈希值的键停放
+                    pass
+        elif idx >= 0:
+            self._stash.pop(idx)
+        else:
+            raise KeyError(f"{key}不在哈希表中")
+        self._size -= 1
+        self._modcount += 1
+
+    def _unpark(self, hash_code: int, idx: int) -> Pair[K, V]:
+        """取出一个停放的键值对
+
+        Args:
+            hash_code (int): 键的哈希值
+            idx (int): 在同哈希值列表中的位置
+
+        Returns:
+            Pair[K, V]: 键值对
+        """
+        group: List[Pair[K, V]] = self._crowd.get(key=hash_code)
+        item: Pair[K, V] = group.pop(idx)
+        if len(group) == 0:
+            self._crowd.remove(key=hash_code)
+        self._parked -= 1
+        return item
+
+    def load_factor(self) -> float:
+        """查看负载因子（停放的键值对不占用桶）
+
+        Returns:
+            float: 负载因子
+        """
+        return (self._size - self._parked) / (2 * self._capacity)
+
+    def _pairs(self) -> Generator[Pair[K, V], None, None]:
+        """依次遍历两张数组桶和溢出区中的键值对
+
+        Yields:
+            Generator[Pair[K, V], None, None]: 键值对
+        """
+        table: List[Optional[Pair[K, V]]]
+        for table in self._tables:
+            item: Optional[Pair[K, V]]
+            for item in table:
+                if item is not None:
+                    yield item
+        yield from self._stash
+        group: List[Pair[K, V]]
+        for group in self._crowd.values():
+            yield from group
+
+    def _entries(self) -> Generator[Tuple[K, V], None, None]:
+        """依次遍历两张数组桶和溢出区中的键值对
+
+        Yields:
+            Generator[Tuple[K, V], None, None]: (键, 值)
+        """
+        item: Pair[K, V]
+        for item in self._pairs():
+            yield (item._key, item._val)
+
+    def keys(self) -> KeysView[K]:
+        """查看所有键
+
+        Returns:
+            KeysView[K]: 惰性遍历的键视图
+        """
+        return KeysView[K](mapping=self)
+
+    def values(self) -> ValuesView[V]:
+        """查看所有值
+
+        Returns:
+            ValuesView[V]: 惰性遍历的值视图
+        """
+        return ValuesView[V](mapping=self)
+
+    def items(self) -> ItemsView[Tuple[K, V]]:
+        """查看所有键值对
+
+        Returns:
+            ItemsView[Tuple[K, V]]: 惰性遍历的键值对视图
+        """
+        return ItemsView[Tuple[K, V]](mapping=self)
+
+    def __getitem__(self, key: K) -> V:
+        """查询键值对
+
+        Args:
+            key (K): 待查询的键
+
+        Returns:
+            V: 值
+        """
+        return self.get(key=key)
+
+    def __setitem__(self, key: K, val: V) -> None:
+        """新增或更新键值对
+
+        Args:
+            key (K): 键
+            val (V): 值
+        """
+        self.put(key=key, val=val)
+
+    def __delitem__(self, key: K) -> None:
+        """删除键值对
+
+        Args:
+            key (K): 待删除的键
+        """
+        self.remove(key=key)
+
+    def __len__(self) -> int:
+        """查看哈希表长度
+
+        Returns:
+            int: 哈希表中键值对数量
+        """
+        return self._size
+
+    def __contains__(self, key: K) -> bool:
+        """哈希表中是否存在指定键
+
+        Args:
+            key (K): 键
+
+        Returns:
+            bool: 键在哈希表中是否存在
+        """
+        t: int
+        idx: int
+        t, idx = self._find(key=key, hash_code=HashMapCuckoo.Hash(key=key))
+        return (t >= 0) or (idx >= 0)
+
+    class Itr(Iterator):
+        """该类配套的迭代器"""
+        def __init__(self, outer: "HashMapCuckoo[K, V]") -> None:
+            """构造方法
+
+            Args:
+                outer (HashMapCuckoo[K, V]): 指向外部类的引用
+            """
+            self.pairs: Generator[Pair[K, V], None, None] = outer._pairs() # type: ignore
+
+        @override
+        def __next__(self) -> K:
+            """实现 Iterator 接口声明的 __next__ 方法
+
+            Raises:
+                StopIteration: 停止迭代
+
+            Returns:
+                K: 
+            """
+            return next(self.pairs)._key
+
+    def __iter__(self) -> Itr:
+        """使自身可迭代
+
+        Returns:
+            Itr: 类内部实现的迭代器
+        """
+        return self.Itr(outer=self)
+
+
+
+class Node(Generic[K, V]):
+    """链表节点"""
+    def __init__(self, key: K, val: V, hash_code: int) -> None:
+        """构造方法
+
+        Args:
+            key (K): 键
+            val (V): 值
+            hash_code (int): 键的哈希值，随节点保存以免重复计算
+        """
+        self._key: K = key
+        self._val: V = val
+        self._hash: int = hash_code
+        self.next: Optional[Node[K, V]] = None
+
+class TreeBucket(Generic[K, V]):
+    """
+    树化的桶（类似 Java 8 的 HashMap）；
+    以键的哈希值为键构建 AVL 树，使得单个桶中的查找不会退化为 O(n)；
+    键不一定可比较，因此哈希值完全相同的节点仍以链表的形式挂在同一个树节点上
+    """
+    def __init__(self, head: Optional[Node[K, V]] = None) -> None:
+        """构造方法
+
+        Args:
+            head (Optional[Node[K, V]], optional): 待树化的链表的头节点. Defaults to None.
+        """
+        self._tree: AvlTree[int, Node[K, V]] = AvlTree[int, Node[K, V]]() # 哈希值到同一哈希值的节点链表的映射
+        self._size: int = 0 # 节点数量
+        while head is not None:
+            nxt: Optional[Node[K, V]] = head.next
+            self.add(node=head)
+            head = nxt
+
+    def add(self, node: Node[K, V]) -> None:
+        """新增一个（确定不在桶中的）节点
+
+        Args:
+            node (Node[K, V]): 节点
+        """
+        try:
+            node.next = self._tree.get(key=node._hash) # 哈希值已存在，在链表头部新增节点
+        except KeyError:
+            node.next = None
+        self._tree.put(key=node._hash, val=node)
+        self._size += 1
+
+    def find(self, key: K, hash_code: int) -> Optional[Node[K, V]]:
+        """查找键所在的节点
+
+        Args:
+            key (K): 键
+            hash_code (int): 键的哈希值
+
+        Returns:
+            Optional[Node[K, V]]: 键所在的节点，键不存在时为 None
+        """
+        try:
+            cur: Optional[Node[K, V]] = self._tree.get(key=hash_code)
+        except KeyError:
+            return None
+        while cur is not None:
+            if cur._key == key:
+                return cur
+            cur = cur.next
+        return None
+
+    def remove(self, key: K, hash_code: int) -> bool:
+        """删除键所在的节点
+
+        Args:
+            key (K): 键
+            hash_code (int): 键的哈希值
+
+        Returns:
+            bool: 键是否存在
+        """
+        try:
+            cur: Node[K, V] = self._tree.get(key=hash_code)
+        except KeyError:
+            return False
+        if cur._key == key: # 删除的是链表头节点
+            if cur.next is None:
+                self._tree.remove(key=hash_code)
+            else:
+                self._tree.put(key=hash_code, val=cur.next)
+            cur.next = None # 便于内存回收
+            self._size -= 1
+            return True
+        while cur.next is not None:
+            if cur.next._key == key:
+                tmp: Node[K, V] = cur.next
+                cur.next = tmp.next
+                tmp.next = None # 便于内存回收
+                self._size -= 1
+                return True
+            cur = cur.next
+        return False
+
+    def nodes(self) -> Generator[Node[K, V], None, None]:
+        """遍历桶中的节点（产出节点前已记录其下一个节点，因此调用方可以修改产出节点的指向）
+
+        Yields:
+            Generator[Node[K, V], None, None]: 节点
+        """
+        head: Node[K, V]
+        for head in self._tree.values():
+            cur: Optional[Node[K, V]] = head
+            while cur is not None:
+                nxt: Optional[Node[K, V]] = cur.next
+                yield cur
+                cur = nxt
+
+    def to_chain(self) -> Optional[Node[K, V]]:
+        """退化为链表
+
+        Returns:
+            Optional[Node[K, V]]: 链表的头节点
+        """
+        head: Optional[Node[K, V]] = None
+        node: Node[K, V]
+        for node in self.nodes():
+            node.next = head
+            head = node
+        return head
+
+    def __len__(self) -> int:
+        """查看桶中的节点数量
+
+        Returns:
+            int: 节点数量
+        """
+        return self._size
+
+class HashMapChaining(Generic[K, V]):
+    """
+    链式地址哈希表，数组的每一个桶存储的都是节点；
+    链表过长时将桶树化，以免键分布倾斜（或被刻意构造）时单个桶的查找退化为 O(n)
+    """
+    capacity: Final[int] = 13 # 初始容量（不可变）
+    extend_ratio: Final[int] = 2 # 扩容系数（不可变）
+    avg_threshold: Final[int] = 8 # 平均每个桶可以存储的最大元素个数（用于触发扩容，不可变）
+    treeify_threshold: Final[int] = 24 # 链表长度达到该值时树化（远大于平均链表长度，正常情况下几乎不会触发，不可变）
+    untreeify_threshold: Final[int] = 16 # 树化的桶中的节点数量降至该值时退化为链表（与树化阈值留出间隔，避免反复转换，不可变）
+
+    def __init__(self) -> None:
+        """构造方法"""
+        self._capacity: int = HashMapChaining.capacity
+        self._bucket: List[Optional[Node[K, V] | TreeBucket[K, V]]] = [None] * self._capacity
+        self._size: int = 0
+        self._modcount: int = 0 # 结构性修改的次数，用于在视图迭代过程中检测修改
+        
+
+    @staticmethod # 静态方法（用类名或者实例来调用）
+    def Hash(key: K) -> int:
+        """哈希算法
+
+        Args:
+            key (K): 键
+
+        Returns:
+            int: 键的哈希值
+        """
+        return hash(key)
+
+    def hash_func(self, key: K) -> int:
+        """哈希函数
+
+        Args:
+            key (K): 键
+
+        Returns:
+            int: 键的哈希函数值
+        """
+        return HashMapChaining.Hash(key=key) % self._capacity
+
+    def put(self, key: K, val: V) -> None:
+        """新增或更新键值对
+
+        Args:
+            key (K): 键
+            val (V): 值
+        """
+        if self._size >= HashMapChaining.avg_threshold * self._capacity: # 扩容
+            self._extend()
+        self._put(key=key, val=val)
+
+    def _put(self, key: K, val: V) -> None:
+        """新增或更新键值对，不检查负载
+
+        Args:
+            key (K): 键
+            val (V): 值
+        """
+        hash_code: int = HashMapChaining.Hash(key=key) # 每次操作只计算一次哈希值
+        idx: int = hash_code % self._capacity
+        head: Optional[Node[K, V] | TreeBucket[K, V]] = self._bucket[idx]
+        if isinstance(head, TreeBucket): # 桶已树化
+            node: Optional[Node[K, V]] = head.find(key=key, hash_code=hash_code)
+            if node is not None:
+                node._val = val
+            else:
+                head.add(node=Node(key=key, val=val, hash_code=hash_code))
+                self._size += 1
+                self._modcount += 1
+            return
+        if head is not None:
+            cur: Node[K, V] = head
+            length: int = 1 # 链表长度
+            while cur.next is not None:
+                if (cur._hash == hash_code) and (cur._key == key): # 键存在，更新键值对（先比较哈希值，不相等时无需比较键）
+                    cur._val = val
+                    return
+                cur = cur.next
+                length += 1
+            if (cur._hash == hash_code) and (cur._key == key): # 检查当前存在的最后一个节点
+                cur._val = val
+                return
+            cur.next = Node(key=key, val=val, hash_code=hash_code) # 键不存在，在尾部新增节点
+            if length + 1 >= HashMapChaining.treeify_threshold: # 链表过长，树化
+                self._bucket[idx] = TreeBucket(head=head)
+        else: # 桶为空，直接在此处存储元素
+            self._bucket[idx] = Node(key=key, val=val, hash_code=hash_code)
+        self._size += 1
+        self._modcount += 1
+
+    @staticmethod # 静态方法
+    def _find(bucket: List[Optional[Node[K, V] | TreeBucket[K, V]]], idx: int, key: K, hash_code: int) -> Optional[Node[K, V]]:
+        """在指定数组桶的指定桶中查找键
+
+        Args:
+            bucket (List[Optional[Node[K, V] | TreeBucket[K, V]]]): 数组桶
+            idx (int): 桶的位置
+            key (K): 键
+            hash_code (int): 键的哈希值
+
+        Returns:
+            Optional[Node[K, V]]: 键所在的节点，键不存在时为 None
+        """
+        cur: Optional[Node[K, V] | TreeBucket[K, V]] = bucket[idx]
+        if isinstance(cur, TreeBucket):
+            return cur.find(key=key, hash_code=hash_code)
+        while cur is not None:
+            if (cur._hash == hash_code) and (cur._key == key):
+                return cur
+            cur = cur.next
+        return None
+
+    @staticmethod # 静态方法
+    def _unlink(bucket: List[Optional[Node[K, V] | TreeBucket[K, V]]], idx: int, key: K, hash_code: int) -> bool:
+        """从指定数组桶的指定桶中删除键，树化的桶过小时退化为链表
+
+        Args:
+            bucket (List[Optional[Node[K, V] | TreeBucket[K, V]]]): 数组桶
+            idx (int): 桶的位置
+            key (K): 键
+            hash_code (int): 键的哈希值
+
+        Returns:
+            bool: 键是否存在
+        """
+        cur: Optional[Node[K, V] | TreeBucket[K, V]] = bucket[idx]
+        if isinstance(cur, TreeBucket):
+            if not cur.remove(key=key, hash_code=hash_code):
+                return False
+            if len(cur) <= HashMapChaining.untreeify_threshold:
+                bucket[idx] = cur.to_chain()
+            return True
+        if cur is None:
+            return False
+        if (cur._hash == hash_code) and (cur._key == key):
+            bucket[idx] = cur.next
+            cur.next = None # 便于内存回收
+            return True
+        while cur.next is not None: # 在 cur 定位到某个桶时，这个桶在这之前已经被检查过了
+            if (cur.next._hash == hash_code) and (cur.next._key == key):
+                tmp: Node[K, V] = cur.next
+                cur.next = tmp.next
+                tmp.next = None # 便于内存回收
+                return True
+            cur = cur.next
+        return False
+
+    @staticmethod # 静态方法
+    def _bucket_nodes(item: Optional[Node[K, V] | TreeBucket[K, V]]) -> Generator[Node[K, V], None, None]:
+        """遍历一个桶中的节点（产出节点前已记录其下一个节点，因此调用方可以修改产出节点的指向）
+
+        Args:
+            item (Optional[Node[K, V] | TreeBucket[K, V]]): 桶中存储的链表头节点或树
+
+        Yields:
+            Generator[Node[K, V], None, None]: 节点
+        """
+        if isinstance(item, TreeBucket):
+            yield from item.nodes()
+            return
+        while item is not None:
+            nxt: Optional[Node[K, V]] = item.next
+            yield item
+            item = nxt
+
+    def _link(self, node: Node[K, V]) -> int:
+        """将一个（确定不在哈希表中的）节点放入数组桶
+
+        Args:
+            node (Node[K, V]): 节点
+
+        Returns:
+            int: 节点所在的桶
+        """
+        idx: int = node._hash % self._capacity # 复用保存的哈希值
+        head: Optional[Node[K, V] | TreeBucket[K, V]] = self._bucket[idx]
+        if isinstance(head, TreeBucket):
+            head.add(node=node)
+        else: # 在链表头部新增节点
+            node.next = head
+            self._bucket[idx] = node
+        return idx
+
+    def _treeify_if_long(self, idx: int) -> None:
+        """链表长度达到阈值时将桶树化（最多遍历阈值个节点）
+
+        Args:
+            idx (int): 桶的位置
+        """
+        head: Optional[Node[K, V] | TreeBucket[K, V]] = self._bucket[idx]
+        if isinstance(head, TreeBucket):
+            return
+        cur: Optional[Node[K, V]] = head
+        length: int = 0
+        while cur is not None:
+            length += 1
+            if length >= HashMapChaining.treeify_threshold:
+                self._bucket[idx] = TreeBucket(head=head)
+                return
+            cur = cur.next
+
+    def remove(self, key: K) -> None:
+        """删除键值对
+
+        Args:
+            key (K): 待删除的键
+        """
+        hash_code: int = HashMapChaining.Hash(key=key)
+        if not HashMapChaining._unlink(bucket=self._bucket, idx=hash_code % self._capacity, key=key, hash_code=hash_code):
+            raise KeyError(f"{key}不在哈希表中")
+        self._size -= 1
+        self._modcount += 1
+    
+    def get(self, key: K) -> V:
+        """查询键值对
+
+        Args:
+            key (K): 待查询的键
+
+        Returns:
+            V: 值
+        """
+        hash_code: int = HashMapChaining.Hash(key=key)
+        node: Optional[Node[K, V]] = HashMapChaining._find(bucket=self._bucket, idx=hash_code % self._capacity, key=key, hash_code=hash_code)
+        if node is None:
+            raise KeyError(f"{key}不在哈希表中")
+        return node._val
+    
+    def _extend(self) -> None:
+        """扩容"""
+        self._rebuild(capacity=self._capacity * HashMapChaining.extend_ratio)
+
+    def reserve(self, n: int) -> None:
+        """预留容量，使得键值对数量增长到 n 之前都不会再扩容
+
+        Args:
+            n (int): 预计存放的键值对总数
+        """
+        capacity: int = self._capacity
+        while n >= HashMapChaining.avg_threshold * capacity:
+            capacity *= HashMapChaining.extend_ratio
+        if capacity != self._capacity:
+            self._rebuild(capacity=capacity)
+
+    def put_many(self, items: Iterable[Tuple[K, V]]) -> None:
+        """批量新增或更新键值对；能够确定数量时只调整一次容量，之后插入不再逐个检查负载
+
+        Args:
+            items (Iterable[Tuple[K, V]]): 键值对序列
+        """
+        key: K
+        val: V
+        if not isinstance(items, Sized): # 无法预知数量，逐个插入
+            for key, val in items:
+                self.put(key=key, val=val)
+            return
+        self.reserve(n=self._size + len(items))
+        for key, val in items:
+            self._put(key=key, val=val)
+
+    def update(self, mapping: Mapping[K, V] | Iterable[Tuple[K, V]]) -> None:
+        """用另一个映射（或键值对序列）中的键值对批量新增或更新
+
+        Args:
+            mapping (Mapping[K, V] | Iterable[Tuple[K, V]]): 拥有 items 方法的映射（本仓库中的各种映射或 dict），或者键值对序列
+        """
+        self.put_many(items=mapping.items() if hasattr(mapping, "items") else mapping) # type: ignore
+
+    @classmethod # 类方法
+    def from_items(cls, items: Iterable[Tuple[K, V]], size_hint: Optional[int] = None) -> "HashMapChaining[K, V]":
+        """由键值对序列构建哈希表，一次性确定容量，避免逐步扩容
+
+        Args:
+            items (Iterable[Tuple[K, V]]): 键值对序列
+            size_hint (Optional[int], optional): 预计的键值对数量，为 None 时尝试取序列的长度. Defaults to None.
+
+        Returns:
+            HashMapChaining[K, V]: 哈希表
+        """
+        hash_map: HashMapChaining[K, V] = cls()
+        if size_hint is not None:
+            hash_map.reserve(n=size_hint)
+        hash_map.put_many(items=items)
+        return hash_map
+
+    def _rebuild(self, capacity: int) -> None:
+        """以指定的容量重建数组桶（树化的桶拆分后先以链表的形式存放，再将过长的链表重新树化）
+
+        Args:
+            capacity (int): 新的容量
+        """
+        cur: List[Optional[Node[K, V] | TreeBucket[K, V]]] = self._bucket
+        self._capacity = capacity
+        self._bucket = [None] * self._capacity
+        self._modcount += 1
+        item: Optional[Node[K, V] | TreeBucket[K, V]]
+        for item in cur:
+            node: Node[K, V]
+            for node in HashMapChaining._bucket_nodes(item=item):
+                self._link(node=node)
+        for i in range(self._capacity):
+            self._treeify_if_long(idx=i)
+
+    def _nodes(self) -> Generator[Node[K, V], None, None]:
+        """遍历哈希表中的节点
+
+        Yields:
+            Generator[Node[K, V], None, None]: 节点
+        """
+        item: Optional[Node[K, V] | TreeBucket[K, V]]
+        for item in self._bucket:
+            yield from HashMapChaining._bucket_nodes(item=item)
+    
+    def _entries(self) -> Generator[Tuple[K, V], None, None]:
+        """依次遍历所有键值对
+
+        Yields:
+            Generator[Tuple[K, V], None, None]: (键, 值)
+        """
+        node: Node[K, V]
+        for node in self._nodes():
+            yield (node._key, node._val)
+
+    def keys(self) -> KeysView[K]:
+        """查看所有键
+
+        Returns:
+            KeysView[K]: 惰性遍历的键视图
+        """
+        return KeysView[K](mapping=self)
+
+    def values(self) -> ValuesView[V]:
+        """查看所有值
+
+        Returns:
+            ValuesView[V]: 惰性遍历的值视图
+        """
+        return ValuesView[V](mapping=self)
+
+    def items(self) -> ItemsView[Tuple[K, V]]:
+        """查看所有键值对
+
+        Returns:
+            ItemsView[Tuple[K, V]]: 惰性遍历的键值对视图
+        """
+        return ItemsView[Tuple[K, V]](mapping=self)
+
+    def __getitem__(self, key: K) -> V:
+        """查询键值对
+
+        Args:
+            key (K): 待查询的键
+
+        Returns:
+            V: 值
+        """
+        return self.get(key=key)
+    
+    def __setitem__(self, key: K, val: V) -> None:
+        """新增或更新键值对
+
+        Args:
+            key (K): 键
+            val (V): 值
+        """
+        self.put(key=key, val=val)
 
     def __delitem__(self, key: K) -> None:
         """删除键值对
@@ -562,10 +2243,7 @@ class HashMapChaining(Generic[K, V]):
             Args:
                 outer (HashMapChaining[K, V]): 指向外部类的引用
             """
-            self.outer: HashMapChaining[K, V] = outer # type: ignore
-            self.idx: int = 0 # 当前桶
-            self.had: int = 0 # 已经遍历了的元素个数
-            self.cursor: Optional[Node] = self.outer._bucket[self.idx] # 当前节点
+            self.nodes: Generator[Node[K, V], None, None] = outer._nodes() # type: ignore
 
         @override
         def __next__(self) -> K:
@@ -577,19 +2255,7 @@ class HashMapChaining(Generic[K, V]):
             Returns:
                 K: 
             """
-            result: K # type: ignore
-            while self.idx < self.outer._capacity:
-                if self.had == self.outer._size:
-                    break
-                if self.cursor is not None:
-                    result = self.cursor._key
-                    self.cursor = self.cursor.next
-                    self.had += 1
-                    return result
-                else:
-                    self.idx += 1
-                    self.cursor = self.outer._bucket[self.idx]
-            raise StopIteration
+            return next(self.nodes)._key
 
     def __iter__(self) -> Itr:
         """使自身可迭代
@@ -600,6 +2266,517 @@ class HashMapChaining(Generic[K, V]):
         return self.Itr(outer=self)
 
 
+class HashMapChainingIncremental(HashMapChaining[K, V]):
+    """
+    渐进式扩容的链式地址哈希表（类似 Redis 的渐进式 rehash）；
+    扩容时只分配新的数组桶，旧数组桶中的链表在之后的每次增删时分批整体迁移，避免一次性迁移所有键值对造成的停顿；
+    查询不会迁移（类似 Redis 遍历时暂停 rehash），因此只读的遍历中可以随意查询；
+    迁移期间每个键只存在于新旧数组桶中的一个，新增的键值对总是存放在新的数组桶中
+    """
+    rehash_step: Final[int] = 1 # 每次操作最多迁移的非空旧桶数量（不可变）
+    empty_visits: Final[int] = 10 # 每迁移一个非空旧桶最多跳过的空桶数量，避免单次操作耗时过长（不可变）
+
+    def __init__(self) -> None:
+        """构造方法"""
+        super().__init__()
+        self._old_bucket: Optional[List[Optional[Node[K, V] | TreeBucket[K, V]]]] = None # 旧数组桶，不在迁移时为 None
+        self._old_capacity: int = 0 # 旧数组桶的容量
+        self._rehash_idx: int = 0 # 下一个待迁移的旧桶
+
+    def is_rehashing(self) -> bool:
+        """是否正在迁移
+
+        Returns:
+            bool: 是否正在迁移
+        """
+        return self._old_bucket is not None
+
+    def rehash_progress(self) -> float:
+        """查看迁移进度
+
+        Returns:
+            float: 已经迁移了的旧桶的比例，不在迁移时为 1.0
+        """
+        if self._old_bucket is None:
+            return 1.0
+        return self._rehash_idx / self._old_capacity
+
+    def _rehash_step(self, n: int) -> None:
+        """迁移至多 n 个非空旧桶
+
+        Args:
+            n (int): 迁移的非空旧桶数量
+        """
+        if self._old_bucket is None:
+            return
+        visits: int = n * HashMapChainingIncremental.empty_visits # 最多跳过的空桶数量
+        while (n > 0) and (self._rehash_idx < self._old_capacity):
+            item: Optional[Node[K, V] | TreeBucket[K, V]] = self._old_bucket[self._rehash_idx]
+            if item is None:
+                self._rehash_idx += 1
+                visits -= 1
+                if visits == 0:
+                    break
+                continue
+            node: Node[K, V]
+            for node in HashMapChaining._bucket_nodes(item=item): # 将整个桶中的节点逐个放入新数组桶
+                self._treeify_if_long(idx=self._link(node=node))
+            self._old_bucket[self._rehash_idx] = None
+            self._modcount += 1 # 迁移会改变键值对的位置，属于结构性修改（只在增删时发生）
+            self._rehash_idx += 1
+            n -= 1
+        if self._rehash_idx == self._old_capacity: # 迁移完成
+            self._old_bucket = None
+            self._old_capacity = 0
+            self._rehash_idx = 0
+
+    def _old_find(self, key: K) -> Optional[Node[K, V]]:
+        """在旧数组桶中查找键
+
+        Args:
+            key (K): 键
+
+        Returns:
+            Optional[Node[K, V]]: 键所在的节点，键不在旧数组桶中时为 None
+        """
+        if self._old_bucket is None:
+            return None
+        hash_code: int = HashMapChaining.Hash(key=key)
+        return HashMapChaining._find(bucket=self._old_bucket, idx=hash_code % self._old_capacity, key=key, hash_code=hash_code)
+
+    @override
+    def _extend(self) -> None:
+        """扩容：先完成尚未完成的迁移，再分配新的数组桶，旧数组桶留待之后分批迁移"""
+        while self._old_bucket is not None:
+            self._rehash_step(n=self._old_capacity)
+        self._old_bucket = self._bucket
+        self._old_capacity = self._capacity
+        self._rehash_idx = 0
+        self._capacity *= HashMapChaining.extend_ratio
+        self._bucket = [None] * self._capacity
+        self._modcount += 1
+
+    @override
+    def reserve(self, n: int) -> None:
+        """预留容量，会先完成尚未完成的迁移，之后批量插入时无需再查找旧数组桶
+
+        Args:
+            n (int): 预计存放的键值对总数
+        """
+        while self._old_bucket is not None:
+            self._rehash_step(n=self._old_capacity)
+        super().reserve(n=n)
+
+    @override
+    def put(self, key: K, val: V) -> None:
+        """新增或更新键值对
+
+        Args:
+            key (K): 键
+            val (V): 值
+        """
+        self._rehash_step(n=HashMapChainingIncremental.rehash_step)
+        if self._size >= HashMapChaining.avg_threshold * self._capacity: # 扩容必须在查找旧数组桶之前，否则扩容后键可能留在新的旧数组桶中
+            self._extend()
+        node: Optional[Node[K, V]] = self._old_find(key=key)
+        if node is not None: # 键在旧数组桶中，直接更新
+            node._val = val
+            return
+        super().put(key=key, val=val)
+
+    @override
+    def get(self, key: K) -> V:
+        """查询键值对
+
+        Args:
+            key (K): 待查询的键
+
+        Raises:
+            KeyError: 键在哈希表中不存在
+
+        Returns:
+            V: 值
+        """
+        node: Optional[Node[K, V]] = self._old_find(key=key) # 查询不迁移键值对，否则正在进行的遍历可能重复访问被迁移到新数组桶的键
+        if node is not None:
+            return node._val
+        return super().get(key=key)
+
+    @override
+    def remove(self, key: K) -> None:
+        """删除键值对
+
+        Args:
+            key (K): 待删除的键
+
+        Raises:
+            KeyError: 键在哈希表中不存在
+        """
+        self._rehash_step(n=HashMapChainingIncremental.rehash_step)
+        if self._old_bucket is not None:
+            hash_code: int = HashMapChaining.Hash(key=key)
+            if HashMapChaining._unlink(bucket=self._old_bucket, idx=hash_code % self._old_capacity, key=key, hash_code=hash_code):
+                self._size -= 1
+                self._modcount += 1
+                return
+        super().remove(key=key)
+
+    @override
+    def _nodes(self) -> Generator[Node[K, V], None, None]:
+        """依次遍历旧数组桶和新数组桶中的节点
+
+        Yields:
+            Generator[Node[K, V], None, None]: 节点
+        """
+        bucket: List[Optional[Node[K, V] | TreeBucket[K, V]]]
+        for bucket in (self._old_bucket or [], self._bucket):
+            item: Optional[Node[K, V] | TreeBucket[K, V]]
+            for item in bucket:
+                yield from HashMapChaining._bucket_nodes(item=item)
+
+
+
+class StaticHashMap:
+    """
+    只读的整数哈希表，基于 CHD（压缩、哈希、位移）最小完美哈希；
+    键先被哈希到平均含 2 个键的桶中，按桶从大到小依次为每个桶寻找位移 d = d0 * n + d1，
+    使桶中每个键的位置 (f1 + d0 * f2 + d1) % n 互不相同且未被占用，n 个键恰好占满 n 个槽位；
+    查询时只需计算一次桶和位置并比较一次键，不需要任何探测；
+    键、值和位移分别存放在三个 64 位整数数组中，可以转储到文件后通过内存映射零拷贝地加载；
+    纯 Python 下构造和查询都比开放寻址哈希表慢（混合哈希需要多次大整数运算），
+    适合需要省内存、跨进程共享或持久化的只读表，不宜在每次调用中临时构造
+    """
+    _MASK: Final[int] = (1 << 64) - 1 # 将哈希值截断为 64 位无符号整数（不可变）
+    _MAGIC: Final[bytes] = b"SHM1" # 文件的魔数（不可变）
+    _HEADER: Final[Struct] = Struct("<4s4xQQQ") # 文件头：魔数、种子、键的数量、桶的数量，长度为 8 的倍数使得数组按 8 字节对齐（不可变）
+    keys_per_bucket: Final[int] = 2 # 每个桶平均的键数，越大位移数组越小但构造越慢（不可变）
+    max_attempts: Final[int] = 32 # 构造失败时更换种子重试的最大次数（不可变）
+    max_rounds: Final[int] = 64 # 每个桶尝试的 d0 的最大个数（不可变）
+
+    def __init__(self, seed: int, keys: Sequence[int], values: Sequence[int], displacements: Sequence[int]) -> None:
+        """构造方法（请使用 build 或 load 创建实例）
+
+        Args:
+            seed (int): 哈希种子
+            keys (Sequence[int]): 按槽位排列的键
+            values (Sequence[int]): 按槽位排列的值
+            displacements (Sequence[int]): 每个桶的位移
+        """
+        self._seed: int = seed
+        self._keys: Sequence[int] = keys # array 或内存映射上的 memoryview
+        self._values: Sequence[int] = values
+        self._displacements: Sequence[int] = displacements
+        self._size: int = len(keys)
+        self._buckets: int = len(displacements)
+        self._mmap: Optional[mmap] = None # 通过内存映射加载时持有的映射
+        self._modcount: int = 0 # 只读，始终为 0，供视图检测修改
+
+    @staticmethod
+    def _mix(x: int) -> int:
+        """splitmix64 的最终混合函数，是 64 位整数上的双射
+
+        Args:
+            x (int): 64 位无符号整数
+
+        Returns:
+            int: 混合后的 64 位无符号整数
+        """
+        x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & StaticHashMap._MASK
+        x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & StaticHashMap._MASK
+        return x ^ (x >> 31)
+
+    @classmethod
+    def build(cls, keys: Sequence[int], values: Sequence[int]) -> "StaticHashMap":
+        """构造最小完美哈希表
+
+        Args:
+            keys (Sequence[int]): 键，必须是互不相同的 64 位有符号整数
+            values (Sequence[int]): 与键一一对应的值，必须是 64 位有符号整数
+
+        Raises:
+            ValueError: 键和值的数量不同，或键重复
+            RuntimeError: 多次更换种子后仍无法构造
+
+        Returns:
+            StaticHashMap: 只读哈希表
+        """
+        if len(keys) != len(values):
+            raise ValueError("键和值的数量必须相同")
+        key_array: array = array("q", keys) # 同时检查键和值是否超出 64 位整数的范围
+        value_array: array = array("q", values)
+        attempt: int
+        for attempt in range(StaticHashMap.max_attempts):
+            seed: int = getrandbits(64)
+            result: Optional[StaticHashMap] = cls._try_build(seed=seed, keys=key_array, values=value_array)
+            if result is not None:
+                return result
+        raise RuntimeError("无法构造最小完美哈希")
+
+    @classmethod
+    def _try_build(cls, seed: int, keys: array, values: array) -> Optional["StaticHashMap"]:
+        """用给定的种子尝试构造
+
+        Args:
+            seed (int): 哈希种子
+            keys (array): 键
+            values (array): 值
+
+        Raises:
+            ValueError: 键重复
+
+        Returns:
+            Optional[StaticHashMap]: 只读哈希表，某个桶找不到位移时为 None
+        """
+        n: int = len(keys)
+        r: int = max(1, -(-n // StaticHashMap.keys_per_bucket)) # 桶的数量
+        buckets: List[List[int]] = [[] for _ in range(r)] # 每个桶中键的下标
+        f1: array = array("q", bytes(8 * n))
+        f2: array = array("q", bytes(8 * n))
+        i: int
+        for i in range(n):
+            z: int = StaticHashMap._mix(x=(keys[i] ^ seed) & StaticHashMap._MASK)
+            buckets[z % r].append(i) # 桶、f1、f2 取自同一个哈希值的不同位段
+            f1[i] = (z >> 21) % n
+            f2[i] = (z >> 42) % n
+        order: List[int] = sorted(range(r), key=lambda b: len(buckets[b]), reverse=True) # 先安置大桶，此时空槽位最多
+        taken: bytearray = bytearray(n) # 槽位是否已被占用
+        slots: array = array("q", bytes(8 * n)) # 每个键的槽位
+        displacements: array = array("Q", bytes(8 * r))
+        free: int = 0 # 为只含一个键的桶顺序查找空槽位的游标
+        b: int
+        for b in order:
+            members: List[int] = buckets[b]
+            if len(members) == 0: # 之后都是空桶
+                break
+            if len(members) == 1: # 单个键可以直接放进任意空槽位：d0 = 0，d1 取恰好落到该槽位的值
+                while taken[free]:
+                    free += 1
+                taken[free] = 1
+                slots[members[0]] = free
+                displacements[b] = (free - f1[members[0]]) % n
+                continue
+            placed: bool = False
+            d0: int
+            for d0 in range(StaticHashMap.max_rounds):
+                base: List[int] = [(f1[i] + d0 * f2[i]) % n for i in members]
+                if len(set(base)) < len(base): # 桶内自相冲突，与 d1 无关
+                    continue
+                d1: int
+                for d1 in range(n):
+                    if not any(taken[(p + d1) % n] for p in base):
+                        for i, p in zip(members, base):
+                            slots[i] = (p + d1) % n
+                            taken[slots[i]] = 1
+                        displacements[b] = d0 * n + d1
+                        placed = True
+                        break
+                if placed:
+                    break
+            if not placed:
+                j: int
+                for i in range(len(members)): # 两个键的哈希完全相同，很可能是键重复
+                    for j in range(i + 1, len(members)):
+                        if keys[members[i]] == keys[members[j]]:
+                            raise ValueError(f"键{keys[members[i]]}重复")
+                return None
+        table_keys: array = array("q", bytes(8 * n))
+        table_values: array = array("q", bytes(8 * n))
+        for i in range(n):
+            table_keys[slots[i]] = keys[i]
+            table_values[slots[i]] = values[i]
+        return cls(seed=seed, keys=table_keys, values=table_values, displacements=displacements)
+
+    def _locate(self, key: object) -> int:
+        """计算键所在的槽位
+
+        Args:
+            key (object): 键
+
+        Returns:
+            int: 槽位，键不存在时为 -1
+        """
+        if (not isinstance(key, int)) or (self._size == 0):
+            return -1
+        n: int = self._size
+        mask: int = StaticHashMap._MASK
+        z: int = (key ^ self._seed) & mask # 与 _mix 相同，内联以省去函数调用
+        z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & mask
+        z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & mask
+        z ^= z >> 31
+        d0: int
+        d1: int
+        d0, d1 = divmod(self._displacements[z % self._buckets], n)
+        slot: int = ((z >> 21) % n + d0 * ((z >> 42) % n) + d1) % n
+        return slot if self._keys[slot] == key else -1 # 最小完美哈希只保证已有的键互不冲突，仍需比较一次键
+
+    def get(self, key: int) -> int:
+        """查询键值对
+
+        Args:
+            key (int): 待查询的键
+
+        Raises:
+            KeyError: 键在哈希表中不存在
+
+        Returns:
+            int: 值
+        """
+        slot: int = self._locate(key=key)
+        if slot < 0:
+            raise KeyError(f"{key}不在哈希表中")
+        return self._values[slot]
+
+    def memory_bytes(self) -> int:
+        """查看键、值和位移三个数组占用的字节数
+
+        Returns:
+            int: 字节数
+        """
+        return 8 * (2 * self._size + self._buckets)
+
+    def dump(self, path: str) -> None:
+        """转储到文件：文件头之后依次是键、值和位移数组，均为小端序的 64 位整数
+
+        Args:
+            path (str): 文件路径
+        """
+        with open(path, "wb") as file:
+            file.write(StaticHashMap._HEADER.pack(StaticHashMap._MAGIC, self._seed, self._size, self._buckets))
+            typecode: str
+            data: Sequence[int]
+            for typecode, data in (("q", self._keys), ("q", self._values), ("Q", self._displacements)):
+                chunk: array = array(typecode, data)
+                if byteorder != "little":
+                    chunk.byteswap()
+                file.write(chunk.tobytes())
+
+    @classmethod
+    def load(cls, path: str, use_mmap: bool = True) -> "StaticHashMap":
+        """从文件加载
+
+        Args:
+            path (str): dump 生成的文件路径
+            use_mmap (bool, optional): 是否通过内存映射零拷贝地加载（大端序的平台上总是复制）. Defaults to True.
+
+        Raises:
+            ValueError: 文件格式错误
+
+        Returns:
+            StaticHashMap: 只读哈希表，使用内存映射时用完后应调用 close
+        """
+        header: Struct = StaticHashMap._HEADER
+        with open(path, "rb") as file:
+            if use_mmap and (byteorder == "little"):
+                mapped: mmap = mmap(file.fileno(), 0, access=ACCESS_READ)
+                view: memoryview = memoryview(mapped)
+            else:
+                mapped = None # type: ignore
+                view = memoryview(file.read())
+        if len(view) < header.size:
+            raise ValueError("文件格式错误")
+        magic, seed, size, buckets = header.unpack_from(view)
+        if (magic != StaticHashMap._MAGIC) or (len(view) != header.size + 8 * (2 * size + buckets)) or ((size > 0) and (buckets == 0)):
+            raise ValueError("文件格式错误")
+        offsets: List[int] = [header.size, header.size + 8 * size, header.size + 16 * size, len(view)]
+        parts: List[Sequence[int]] = []
+        i: int
+        for i, typecode in enumerate(("q", "q", "Q")):
+            if mapped is not None:
+                parts.append(view[offsets[i]:offsets[i + 1]].cast(typecode))
+            else:
+                part: array = array(typecode)
+                part.frombytes(view[offsets[i]:offsets[i + 1]])
+                if byteorder != "little":
+                    part.byteswap()
+                parts.append(part)
+        result: StaticHashMap = cls(seed=seed, keys=parts[0], values=parts[1], displacements=parts[2])
+        result._mmap = mapped
+        return result
+
+    def close(self) -> None:
+        """释放内存映射，之后不能再查询"""
+        if self._mmap is None:
+            return
+        part: Sequence[int]
+        for part in (self._keys, self._values, self._displacements):
+            if isinstance(part, memoryview):
+                part.release()
+        self._mmap.close()
+        self._mmap = None
+
+    def _entries(self) -> Generator[Tuple[int, int], None, None]:
+        """按槽位顺序依次遍历所有键值对
+
+        Yields:
+            Generator[Tuple[int, int], None, None]: (键, 值)
+        """
+        i: int
+        for i in range(self._size):
+            yield (self._keys[i], self._values[i])
+
+    def keys(self) -> KeysView[int]:
+        """查看所有键
+
+        Returns:
+            KeysView[int]: 惰性遍历的键视图
+        """
+        return KeysView[int](mapping=self)
+
+    def values(self) -> ValuesView[int]:
+        """查看所有值
+
+        Returns:
+            ValuesView[int]: 惰性遍历的值视图
+        """
+        return ValuesView[int](mapping=self)
+
+    def items(self) -> ItemsView[Tuple[int, int]]:
+        """查看所有键值对
+
+        Returns:
+            ItemsView[Tuple[int, int]]: 惰性遍历的键值对视图
+        """
+        return ItemsView[Tuple[int, int]](mapping=self)
+
+    def __getitem__(self, key: int) -> int:
+        """查询键值对
+
+        Args:
+            key (int): 待查询的键
+
+        Returns:
+            int: 值
+        """
+        return self.get(key=key)
+
+    def __len__(self) -> int:
+        """查看哈希表长度
+
+        Returns:
+            int: 哈希表中键值对数量
+        """
+        return self._size
+
+    def __contains__(self, key: object) -> bool:
+        """哈希表中是否存在指定键
+
+        Args:
+            key (object): 键
+
+        Returns:
+            bool: 键在哈希表中是否存在
+        """
+        return self._locate(key=key) >= 0
+
+    def __iter__(self) -> Iterator:
+        """使自身可迭代
+
+        Returns:
+            Iterator: 键的迭代器
+        """
+        return iter(self.keys())
+
+
 
 if __name__ == "__main__":
     h1: HashMapOpenAddressing[int, str] = HashMapOpenAddressing[int, str](); h2: HashMapChaining[int, str] = HashMapChaining[int, str]()
@@ -614,3 +2791,57 @@ if __name__ == "__main__":
     print("开始遍历h2")
     for i in h2:
         print(i)
+
+    h3: HashMapRobinHood[int, str] = HashMapRobinHood[int, str]()
+    for i in range(30):
+        h3.put(key=i, val=str(object=i))
+    del h3[3]
+    print("开始遍历h3")
+    print(h3.items())
+    h4: HashMapCompact[str, int] = HashMapCompact[str, int]()
+    for i in range(30):
+        h4.put(key=str(object=29 - i), val=i)
+    del h4["3"]
+    print("开始遍历h4（插入顺序）")
+    print(h4.keys())
+    h5: HashMapChainingIncremental[int, str] = HashMapChainingIncremental[int, str]()
+    for i in range(200):
+        h5.put(key=i, val=str(object=i))
+        if h5.is_rehashing():
+            print(f"第{i}次插入后的迁移进度：{h5.rehash_progress():.2f}")
+    incremental: HashMapOpenAddressingIncremental[int, str] | HashMapChainingIncremental[int, str]
+    for incremental in (HashMapOpenAddressingIncremental[int, str](), HashMapChainingIncremental[int, str]()):
+        i = 0
+        while (i < 8) or not incremental.is_rehashing(): # 插入到恰好处于迁移中为止
+            incremental.put(key=i, val=str(object=i))
+            i += 1
+        visited: List[int] = [key for key in incremental.keys() if incremental[key] == str(object=key)] # 遍历中查询不会迁移键值对
+        print(f"{type(incremental).__name__}：迁移中遍历{len(visited)}个键，共{len(incremental)}个键，迁移进度{incremental.rehash_progress():.2f}")
+    print("不同探测策略的平均探测长度")
+    probe: ProbeStrategy
+    for probe in (LinearProbe(), QuadraticProbe(), DoubleHashProbe()):
+        h6: HashMapOpenAddressing[int, int] = HashMapOpenAddressing[int, int](probe=probe)
+        for i in range(1000):
+            h6.put(key=i * 64, val=i) # 键的低位相同，容易形成聚集
+        for i in range(2000):
+            _ = (i * 64) in h6
+        stats: ProbeStats = h6.probe_stats()
+        print(f"{type(probe).__name__}：成功{stats.avg_hit:.2f}，失败{stats.avg_miss:.2f}，扩容{stats.resizes}次")
+    h7: HashMapCuckoo[str, int] = HashMapCuckoo[str, int]()
+    for i in range(30):
+        h7.put(key=str(object=i), val=i)
+    del h7["3"]
+    print(f"开始遍历h7（负载因子{h7.load_factor():.2f}）")
+    print(sorted(h7.keys()))
+    for i in range(1000):
+        h7.put(key=i * (2 ** 61 - 1) + 7, val=i) # type: ignore # 完整哈希值全部相同
+    del h7[7] # type: ignore
+    print(f"同哈希值的键：{len(h7)}个，重建{h7._rehashes}次，溢出区{len(h7._stash)}个，{h7[999 * (2 ** 61 - 1) + 7]}") # type: ignore
+    h8: StaticHashMap = StaticHashMap.build(keys=[i * 1000003 for i in range(100)], values=list(range(100)))
+    from tempfile import TemporaryDirectory
+    from os.path import join
+    with TemporaryDirectory() as directory:
+        h8.dump(path=join(directory, "static.shm"))
+        h9: StaticHashMap = StaticHashMap.load(path=join(directory, "static.shm")) # 内存映射，零拷贝
+        print(f"最小完美哈希：{h9[5 * 1000003]}，{7 in h9}，{h9.memory_bytes()}字节")
+        h9.close()
\ No newline at end of file
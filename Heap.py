@@ -1,10 +1,12 @@
-from typing import Final, Generic, TypeVar, Optional, List, Sequence, override
+from typing import Final, Generic, TypeVar, Optional, List, Sequence, Hashable, override
 
 from utils import Comparable
+from HashMap import HashMapOpenAddressing as HashMap
 
 
 
 K = TypeVar(name="K", bound=Comparable) # 声明一个类型参数，不宜对其进行 type hints
+H = TypeVar(name="H", bound=Hashable)
 V = TypeVar(
             name="V", 
             # covariant=True
@@ -270,6 +272,15 @@ class MaxPriorityQueue(Generic[K, V]):
             raise IndexError("优先级队列为空")
         return self._heap[0] # type: ignore
     
+    def _swap(self, i: int, j: int) -> None:
+        """交换堆中两个位置的元素
+
+        Args:
+            i (int): 位置1
+            j (int): 位置2
+        """
+        self._heap[i], self._heap[j] = self._heap[j], self._heap[i]
+
     def _sift_up(self, idx: int) -> None:
         """上浮节点
 
@@ -280,7 +291,7 @@ class MaxPriorityQueue(Generic[K, V]):
             parent: int = (idx - 1) // 2 # 父节点的索引
             if self._heap[parent].attr >= self._heap[idx].attr: # type: ignore # 无需再修复节点
                 break
-            self._heap[parent], self._heap[idx] = self._heap[idx], self._heap[parent] # 修复节点
+            self._swap(i=parent, j=idx) # 修复节点
             idx = parent
 
     def _sift_down(self, idx: int) -> None:
@@ -299,7 +310,7 @@ class MaxPriorityQueue(Generic[K, V]):
                 if (right < self._size) and (self._heap[right].attr > self._heap[maximum].attr): # type: ignore
                     maximum = right
                 if maximum != idx: # 需要修复节点
-                    self._heap[idx], self._heap[maximum] = self._heap[maximum], self._heap[idx]
+                    self._swap(i=idx, j=maximum)
                     idx = maximum
                     continue
             break # 无需修复节点
@@ -327,7 +338,7 @@ class MinPriorityQueue(MaxPriorityQueue[K, V]):
             parent: int = (idx - 1) // 2 # 父节点的索引
             if self._heap[parent].attr <= self._heap[idx].attr: # type: ignore # 无需再修复节点
                 break
-            self._heap[parent], self._heap[idx] = self._heap[idx], self._heap[parent] # 修复节点
+            self._swap(i=parent, j=idx) # 修复节点
             idx = parent
 
     @override
@@ -347,12 +358,199 @@ class MinPriorityQueue(MaxPriorityQueue[K, V]):
                 if (right < self._size) and (self._heap[right].attr < self._heap[minimum].attr): # type: ignore
                     minimum = right
                 if minimum != idx: # 需要修复节点
-                    self._heap[idx], self._heap[minimum] = self._heap[minimum], self._heap[idx]
+                    self._swap(i=idx, j=minimum)
                     idx = minimum
                     continue
             break # 无需修复节点
 
 
+class IndexedMaxPriorityQueue(MaxPriorityQueue[H, V]):
+    """
+    带索引的大顶堆优先级队列；
+    用哈希表记录每个对象在堆中的位置，从而支持在 O(log n) 时间内修改对象的属性或删除对象；
+    同一个对象只能在队列中出现一次
+    """
+    def __init__(self, data: Optional[Sequence[Pair[H, V]]] = None) -> None:
+        """构造方法
+
+        Args:
+            data (Optional[Sequence[Pair[H, V]]], optional): 待堆化的序列. Defaults to None.
+
+        Raises:
+            ValueError: 序列中存在重复的对象
+        """
+        self._index: HashMap[H, int] = HashMap[H, int]() # {对象：对象在堆中的位置}
+        if data is not None:
+            for i in range(len(data)): # 先记录堆化前的位置，堆化过程中交换元素时会同步更新
+                if data[i].obj in self._index:
+                    raise ValueError(f"对象{data[i].obj}重复")
+                self._index[data[i].obj] = i
+        super().__init__(data=data)
+
+    @override
+    def _swap(self, i: int, j: int) -> None:
+        """交换堆中两个位置的元素，并更新其索引
+
+        Args:
+            i (int): 位置1
+            j (int): 位置2
+        """
+        self._heap[i], self._heap[j] = self._heap[j], self._heap[i]
+        self._index[self._heap[i].obj] = i # type: ignore
+        self._index[self._heap[j].obj] = j # type: ignore
+
+    @override
+    def enqueue(self, item: Pair[H, V]) -> None:
+        """入队
+
+        Args:
+            item (Pair[H, V]): 待入队元素
+
+        Raises:
+            ValueError: 对象已在队列中
+        """
+        if item.obj in self._index:
+            raise ValueError(f"对象{item.obj}已在优先级队列中")
+        self._index[item.obj] = self._size # 入队时位于堆的尾部
+        super().enqueue(item=item)
+
+    @override
+    def dequeue(self) -> Pair[H, V]:
+        """出队
+
+        Raises:
+            IndexError: 空队
+
+        Returns:
+            Pair[H, V]: 出队元素
+        """
+        if self._size == 0:
+            raise IndexError("优先级队列为空")
+        return self._pop(idx=0)
+
+    def _pop(self, idx: int) -> Pair[H, V]:
+        """删除并返回指定位置的元素，用堆尾元素填补空位后再修复堆
+
+        Args:
+            idx (int): 待删除的位置
+
+        Returns:
+            Pair[H, V]: 被删除的元素
+        """
+        result: Pair[H, V] = self._heap[idx] # type: ignore
+        del self._index[result.obj]
+        last: int = self._size - 1
+        moved: Pair[H, V] = self._heap[last] # type: ignore # 用于填补空位的堆尾元素
+        self._heap[last] = None
+        self._size -= 1 # 因为下沉节点时需要引用堆的长度，务必先更新堆的长度再下沉节点
+        if idx != last: # 填补空位的元素可能需要上浮或下沉
+            self._heap[idx] = moved
+            self._index[moved.obj] = idx
+            self._sift_up(idx=idx)
+            self._sift_down(idx=self._index[moved.obj])
+        return result
+
+    def contains(self, obj: H) -> bool:
+        """对象是否在队列中
+
+        Args:
+            obj (H): 对象
+
+        Returns:
+            bool: 对象是否在队列中
+        """
+        return obj in self._index
+
+    def __contains__(self, obj: H) -> bool:
+        """对象是否在队列中
+
+        Args:
+            obj (H): 对象
+
+        Returns:
+            bool: 对象是否在队列中
+        """
+        return self.contains(obj=obj)
+
+    def get_attr(self, obj: H) -> V:
+        """查询对象当前的属性
+
+        Args:
+            obj (H): 对象
+
+        Raises:
+            KeyError: 对象不在队列中
+
+        Returns:
+            V: 对象的属性
+        """
+        return self._heap[self._index[obj]].attr # type: ignore
+
+    def update(self, obj: H, attr: V) -> None:
+        """修改对象的属性，并将其调整至合适位置
+
+        Args:
+            obj (H): 对象
+            attr (V): 新的属性
+
+        Raises:
+            KeyError: 对象不在队列中
+        """
+        idx: int = self._index[obj]
+        self._heap[idx].attr = attr # type: ignore
+        self._sift_up(idx=idx)
+        self._sift_down(idx=self._index[obj]) # 上浮和下沉至多只有一个会真正移动节点
+
+    def decrease_key(self, obj: H, attr: V) -> None:
+        """减小对象的属性
+
+        Args:
+            obj (H): 对象
+            attr (V): 新的属性（不能大于原属性）
+
+        Raises:
+            KeyError: 对象不在队列中
+            ValueError: 新的属性大于原属性
+        """
+        if attr > self.get_attr(obj=obj): # type: ignore
+            raise ValueError(f"新的属性{attr}大于原属性")
+        self.update(obj=obj, attr=attr)
+
+    def increase_key(self, obj: H, attr: V) -> None:
+        """增大对象的属性
+
+        Args:
+            obj (H): 对象
+            attr (V): 新的属性（不能小于原属性）
+
+        Raises:
+            KeyError: 对象不在队列中
+            ValueError: 新的属性小于原属性
+        """
+        if attr < self.get_attr(obj=obj): # type: ignore
+            raise ValueError(f"新的属性{attr}小于原属性")
+        self.update(obj=obj, attr=attr)
+
+    def remove(self, obj: H) -> Pair[H, V]:
+        """删除队列中的对象
+
+        Args:
+            obj (H): 待删除的对象
+
+        Raises:
+            KeyError: 对象不在队列中
+
+        Returns:
+            Pair[H, V]: 被删除的元素
+        """
+        return self._pop(idx=self._index[obj])
+
+
+
+class IndexedMinPriorityQueue(IndexedMaxPriorityQueue[H, V], MinPriorityQueue[H, V]): # 沿用 MinPriorityQueue 的 _sift_up 方法和 _sift_down 方法即可
+    """带索引的小顶堆优先级队列"""
+    pass
+
 
 
 if __name__ == "__main__":
@@ -382,4 +580,13 @@ if __name__ == "__main__":
     print("-------------")
     for _ in range(len(h3)):
         tmp = h3.dequeue()
+        print(tmp.obj, tmp.attr)
+    print("-------------")
+    h4: IndexedMinPriorityQueue[str, int] = IndexedMinPriorityQueue[str, int](data=[Pair(obj=str(object=i), attr=i) for i in range(10)])
+    h4.decrease_key(obj="9", attr=-1)
+    h4.increase_key(obj="1", attr=100)
+    h4.remove(obj="5")
+    print("7" in h4, "5" in h4)
+    for _ in range(len(h4)):
+        tmp = h4.dequeue()
         print(tmp.obj, tmp.attr)
\ No newline at end of file
@@ -0,0 +1,607 @@
+from typing import Final, Generic, Hashable, Iterable, List, Optional, Tuple, TypeVar
+from array import array
+from math import ceil, e, log
+from random import Random, getrandbits
+from struct import Struct
+from sys import byteorder
+
+from utils import stable_hash
+from Heap import Pair, IndexedMinPriorityQueue
+
+
+
+T = TypeVar(name="T", bound=Hashable) # 声明一个类型参数，不宜对其进行 type hints
+
+class CountMinSketch(Generic[T]):
+    """
+    Count-Min 频率草图；
+    共 depth 行计数器，每行 width 个，每行使用一个带种子的乘法哈希，元素计入时每行对应的计数器都加上次数，
+    估计值取各行对应计数器的最小值，只会高估而不会低估；
+    可选的老化机制：累计计入 sample_size 次后将所有计数器减半，使得估计值偏向最近的频率；
+    可选的保守更新：只把各行中小于“当前估计值 + 次数”的计数器抬高到该值，同样不会低估，但高估的幅度小得多；
+    指定 seed 时使用与进程无关的哈希和确定的种子，参数相同的草图可以跨进程合并
+    """
+    _MASK: Final[int] = (1 << 64) - 1 # 将哈希值截断为 64 位无符号整数（不可变）
+    _MAGIC: Final[bytes] = b"CMS1" # 序列化的魔数（不可变）
+    _HEADER: Final[Struct] = Struct(">4sIIQ?") # 序列化的头部：魔数、宽度、深度、总次数、是否保守更新（不可变）
+
+    def __init__(self, width: int, depth: int = 4, sample_size: Optional[int] = None, conservative: bool = False, seed: Optional[int] = None) -> None:
+        """构造方法
+
+        Args:
+            width (int): 每行计数器的数量，向上取整为 2 的幂
+            depth (int, optional): 行数，即哈希函数的个数. Defaults to 4.
+            sample_size (Optional[int], optional): 累计计入该次数后老化一次，为 None 时不老化. Defaults to None.
+            conservative (bool, optional): 是否使用保守更新. Defaults to False.
+            seed (Optional[int], optional): 随机种子，为 None 时使用内置的 hash 和随机的种子（无法跨进程合并）. Defaults to None.
+
+        Raises:
+            ValueError: 宽度、深度或采样数不是正数
+        """
+        if (width <= 0) or (depth <= 0) or ((sample_size is not None) and (sample_size <= 0)):
+            raise ValueError("宽度、深度和采样数必须是正数")
+        self._width: int = 1 << (width - 1).bit_length() # 每行计数器的数量
+        self._shift: int = 65 - self._width.bit_length() # 乘积右移的位数，使得结果落在 [0, width) 中
+        self._depth: int = depth # 行数
+        self._table: array = array("q", [0]) * (self._width * self._depth) # 所有行的计数器依次存放在一个数组中
+        self._stable: bool = seed is not None # 是否使用与进程无关的哈希
+        getbits = getrandbits if seed is None else Random(seed).getrandbits
+        self._seeds: List[int] = [getbits(64) | 1 for _ in range(self._depth)] # 每行哈希函数的种子（奇数）
+        self._sample_size: Optional[int] = sample_size
+        self._conservative: bool = conservative
+        self._additions: int = 0 # 距离下一次老化已经计入的次数
+        self._total: int = 0 # 计入的总次数（老化时同样减半）
+
+    @classmethod
+    def from_error(cls, epsilon: float, delta: float, conservative: bool = False, seed: Optional[int] = None) -> "CountMinSketch[T]":
+        """根据误差要求构造草图：估计值以不低于 1 - delta 的概率不超过真实值 + epsilon * 总次数
+
+        Args:
+            epsilon (float): 相对总次数的误差上限
+            delta (float): 超出误差上限的概率
+            conservative (bool, optional): 是否使用保守更新. Defaults to False.
+            seed (Optional[int], optional): 随机种子. Defaults to None.
+
+        Raises:
+            ValueError: epsilon 或 delta 不在 (0, 1) 中
+
+        Returns:
+            CountMinSketch[T]: 草图
+        """
+        if not ((0 < epsilon < 1) and (0 < delta < 1)):
+            raise ValueError("epsilon 和 delta 必须在 (0, 1) 中")
+        return cls(width=ceil(e / epsilon), depth=ceil(log(1 / delta)), conservative=conservative, seed=seed)
+
+    def add(self, item: T, count: int = 1) -> int:
+        """计入元素
+
+        Args:
+            item (T): 元素
+            count (int, optional): 次数. Defaults to 1.
+
+        Returns:
+            int: 计入后该元素频率的估计值
+        """
+        hash_code: int = stable_hash(obj=item)[0] if self._stable else hash(item) # 只计算一次哈希值
+        table: array = self._table
+        offset: int = 0 # 当前行在数组中的起始位置
+        seed: int
+        result: int = -1
+        if self._conservative:
+            positions: List[int] = [] # 先求出当前估计值，再抬高不足的计数器
+            for seed in self._seeds:
+                position: int = offset + (((hash_code * seed) & CountMinSketch._MASK) >> self._shift)
+                positions.append(position)
+                if (result < 0) or (table[position] < result):
+                    result = table[position]
+                offset += self._width
+            result += count
+            for position in positions:
+                if table[position] < result:
+                    table[position] = result
+        else:
+            for seed in self._seeds:
+                position = offset + (((hash_code * seed) & CountMinSketch._MASK) >> self._shift)
+                table[position] += count
+                if (result < 0) or (table[position] < result):
+                    result = table[position]
+                offset += self._width
+        self._total += count
+        if self._sample_size is not None:
+            self._additions += count
+            if self._additions >= self._sample_size:
+                self.age()
+                result >>= 1
+        return result
+
+    def estimate(self, item: T) -> int:
+        """估计元素的频率
+
+        Args:
+            item (T): 元素
+
+        Returns:
+            int: 频率的估计值（不低于真实值）
+        """
+        hash_code: int = stable_hash(obj=item)[0] if self._stable else hash(item)
+        result: int = -1
+        offset: int = 0
+        seed: int
+        for seed in self._seeds:
+            count: int = self._table[offset + (((hash_code * seed) & CountMinSketch._MASK) >> self._shift)]
+            if (result < 0) or (count < result):
+                result = count
+            offset += self._width
+        return result
+
+    def age(self) -> None:
+        """老化：所有计数器减半"""
+        i: int
+        for i in range(len(self._table)):
+            self._table[i] >>= 1
+        self._additions >>= 1
+        self._total >>= 1
+
+    def total(self) -> int:
+        """查看计入的总次数
+
+        Returns:
+            int: 计入的总次数
+        """
+        return self._total
+
+    def merge(self, other: "CountMinSketch[T]") -> None:
+        """将另一个草图合并进来（对应计数器相加），合并后的估计值不低于两者真实频率之和
+
+        Args:
+            other (CountMinSketch[T]): 另一个草图
+
+        Raises:
+            ValueError: 两个草图的宽度、深度、种子或哈希方式不同
+        """
+        if (self._width != other._width) or (self._seeds != other._seeds) or (self._stable != other._stable):
+            raise ValueError("只能合并宽度、深度和种子都相同的草图")
+        table: array = self._table
+        i: int
+        for i in range(len(table)):
+            table[i] += other._table[i]
+        self._total += other._total
+        self._additions += other._additions
+
+    def to_bytes(self) -> bytes:
+        """序列化（只支持指定了 seed 的草图，否则其他进程中的哈希值不同）
+
+        Raises:
+            ValueError: 草图没有指定 seed
+
+        Returns:
+            bytes: 序列化的结果
+        """
+        if not self._stable:
+            raise ValueError("没有指定 seed 的草图无法序列化")
+        table: array = array("q", self._table)
+        if byteorder != "little": # 统一按小端序存放计数器
+            table.byteswap()
+        seeds: bytes = b"".join(seed.to_bytes(length=8, byteorder="little") for seed in self._seeds)
+        return CountMinSketch._HEADER.pack(CountMinSketch._MAGIC, self._width, self._depth, self._total, self._conservative) + seeds + table.tobytes()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "CountMinSketch[T]":
+        """反序列化（老化的设置不会被序列化）
+
+        Args:
+            data (bytes): to_bytes 的结果
+
+        Raises:
+            ValueError: 数据格式错误
+
+        Returns:
+            CountMinSketch[T]: 草图
+        """
+        header: Struct = CountMinSketch._HEADER
+        if len(data) < header.size:
+            raise ValueError("数据格式错误")
+        magic, width, depth, total, conservative = header.unpack_from(data)
+        if (magic != CountMinSketch._MAGIC) or (width <= 0) or (width & (width - 1) != 0) or (depth <= 0) or (len(data) != header.size + depth * 8 * (width + 1)):
+            raise ValueError("数据格式错误")
+        result: CountMinSketch[T] = cls(width=width, depth=depth, conservative=conservative, seed=0)
+        offset: int = header.size
+        result._seeds = [int.from_bytes(data[offset + 8 * i:offset + 8 * (i + 1)], byteorder="little") for i in range(depth)]
+        result._table = array("q")
+        result._table.frombytes(data[offset + 8 * depth:])
+        if byteorder != "little":
+            result._table.byteswap()
+        result._total = total
+        return result
+
+
+class HeavyHitters(Generic[T]):
+    """
+    近似 Top-K（高频元素）；
+    用保守更新的 Count-Min 草图估计每个元素的频率，再用带索引的小顶堆维护估计值最大的 k 个候选元素，
+    新元素的估计值超过堆顶时替换堆顶；内存只与 k 和草图的大小有关，与不同元素的个数无关；
+    草图使用与进程无关的哈希，参数相同的实例可以跨进程合并
+    """
+    def __init__(self, k: int, width: int = 2048, depth: int = 4, seed: int = 0) -> None:
+        """构造方法
+
+        Args:
+            k (int): 保留的高频元素个数
+            width (int, optional): 草图每行计数器的数量. Defaults to 2048.
+            depth (int, optional): 草图的行数. Defaults to 4.
+            seed (int, optional): 草图的随机种子，需要合并的实例必须相同. Defaults to 0.
+
+        Raises:
+            ValueError: k 不是正数
+        """
+        if k <= 0:
+            raise ValueError("k 必须是正数")
+        self._k: int = k
+        self._sketch: CountMinSketch[T] = CountMinSketch[T](width=width, depth=depth, conservative=True, seed=seed)
+        self._heap: IndexedMinPriorityQueue[T, int] = IndexedMinPriorityQueue[T, int]() # 候选元素，按估计值排列的小顶堆
+
+    def _offer(self, item: T, count: int) -> None:
+        """用元素的估计值更新候选堆
+
+        Args:
+            item (T): 元素
+            count (int): 元素频率的估计值
+        """
+        heap: IndexedMinPriorityQueue[T, int] = self._heap
+        if item in heap:
+            heap.increase_key(obj=item, attr=count) # 保守更新的估计值只增不减
+        elif len(heap) < self._k:
+            heap.enqueue(item=Pair[T, int](obj=item, attr=count))
+        elif count > heap.peek().attr:
+            heap.dequeue()
+            heap.enqueue(item=Pair[T, int](obj=item, attr=count))
+
+    def add(self, item: T, count: int = 1) -> None:
+        """计入元素
+
+        Args:
+            item (T): 元素
+            count (int, optional): 次数. Defaults to 1.
+        """
+        self._offer(item=item, count=self._sketch.add(item=item, count=count))
+
+    def add_many(self, items: Iterable[T]) -> None:
+        """逐个计入元素
+
+        Args:
+            items (Iterable[T]): 元素
+        """
+        item: T
+        for item in items:
+            self._offer(item=item, count=self._sketch.add(item=item))
+
+    def _candidates(self) -> List[T]:
+        """查看候选堆中的所有元素
+
+        Returns:
+            List[T]: 候选元素
+        """
+        return [self._heap._heap[i].obj for i in range(len(self._heap))] # type: ignore
+
+    def top(self, n: Optional[int] = None) -> List[Tuple[T, int]]:
+        """查看估计频率最高的元素
+
+        Args:
+            n (Optional[int], optional): 个数，为 None 时返回全部 k 个. Defaults to None.
+
+        Returns:
+            List[Tuple[T, int]]: (元素, 频率的估计值)，按估计值从大到小排列
+        """
+        result: List[Tuple[T, int]] = [(item, self._heap.get_attr(obj=item)) for item in self._candidates()]
+        result.sort(key=lambda pair: pair[1], reverse=True)
+        return result if n is None else result[:n]
+
+    def estimate(self, item: T) -> int:
+        """估计任意元素的频率
+
+        Args:
+            item (T): 元素
+
+        Returns:
+            int: 频率的估计值（不低于真实值）
+        """
+        return self._sketch.estimate(item=item)
+
+    def total(self) -> int:
+        """查看计入的总次数
+
+        Returns:
+            int: 计入的总次数
+        """
+        return self._sketch.total()
+
+    def merge(self, other: "HeavyHitters[T]") -> None:
+        """将另一个实例合并进来：先合并草图，再用合并后的估计值在两边的候选元素中重新选出前 k 个
+
+        Args:
+            other (HeavyHitters[T]): 另一个实例
+
+        Raises:
+            ValueError: 两个实例的 k 或草图参数不同
+        """
+        if self._k != other._k:
+            raise ValueError("只能合并 k 相同的实例")
+        self._sketch.merge(other=other._sketch)
+        candidates: List[T] = self._candidates()
+        item: T
+        for item in other._candidates():
+            if item not in self._heap:
+                candidates.append(item)
+        self._heap = IndexedMinPriorityQueue[T, int]()
+        for item in candidates:
+            self._offer(item=item, count=self._sketch.estimate(item=item))
+
+    def __getstate__(self) -> Tuple[int, bytes, List[Tuple[T, int]]]:
+        """序列化时只保存 k、草图和候选元素（候选堆内部的开放寻址哈希表依赖墓碑标记的同一性，不能直接 pickle）
+
+        Returns:
+            Tuple[int, bytes, List[Tuple[T, int]]]: 状态
+        """
+        return self._k, self._sketch.to_bytes(), self.top()
+
+    def __setstate__(self, state: Tuple[int, bytes, List[Tuple[T, int]]]) -> None:
+        """反序列化
+
+        Args:
+            state (Tuple[int, bytes, List[Tuple[T, int]]]): __getstate__ 的结果
+        """
+        self._k = state[0]
+        self._sketch = CountMinSketch[T].from_bytes(data=state[1])
+        self._heap = IndexedMinPriorityQueue[T, int]()
+        item: T
+        count: int
+        for item, count in state[2]:
+            self._heap.enqueue(item=Pair[T, int](obj=item, attr=count))
+
+    def __len__(self) -> int:
+        """返回候选元素的个数
+
+        Returns:
+            int: 候选元素的个数
+        """
+        return len(self._heap)
+
+
+class HyperLogLog(Generic[T]):
+    """
+    HyperLogLog 基数估计（不同元素的个数）；
+    64 位哈希的高 precision 位选择寄存器，其余位前导零的个数 + 1 作为秩，每个寄存器保留见过的最大秩；
+    元素较少时使用稀疏表示（HLL++）：以更高的精度 25 位记录 (索引, 秩) 的有序数组，只存放非零寄存器，
+    用线性计数估计，精度更高且内存与元素个数成正比，非零寄存器超过 m / 4 个时转换为 m 字节的稠密寄存器；
+    使用与进程无关的哈希，精度相同的实例可以跨进程合并（对应寄存器取最大值）；
+    稠密模式下的小基数偏差使用线性计数修正，没有使用 HLL++ 的经验偏差表
+    """
+    _SPARSE_PRECISION: Final[int] = 25 # 稀疏表示的索引位数（不可变）
+    _RANK_BITS: Final[int] = 6 # 稀疏表示中秩占用的位数（不可变）
+    _MAGIC: Final[bytes] = b"HLL1" # 序列化的魔数（不可变）
+    _HEADER: Final[Struct] = Struct(">4sB?I") # 序列化的头部：魔数、精度、是否稀疏、数据长度（不可变）
+    _INV_POW: Final[List[float]] = [2.0 ** -i for i in range(66)] # 2 的 -i 次方（不可变）
+
+    def __init__(self, precision: int = 14) -> None:
+        """构造方法
+
+        Args:
+            precision (int, optional): 精度 p，寄存器个数为 2 ** p，标准误差约为 1.04 / sqrt(2 ** p). Defaults to 14.
+
+        Raises:
+            ValueError: 精度不在 [4, 18] 中
+        """
+        if not (4 <= precision <= 18):
+            raise ValueError("精度必须在 [4, 18] 中")
+        self._precision: int = precision
+        self._m: int = 1 << precision # 寄存器个数
+        self._registers: Optional[bytearray] = None # 稠密寄存器，稀疏模式下为 None
+        self._sparse: array = array("I") # 稀疏表示：(索引 << 6 | 秩) 的有序数组，同一索引只保留最大的秩
+        self._buffer: array = array("I") # 尚未并入有序数组的稀疏条目
+        self._sparse_limit: int = self._m >> 2 # 稀疏条目超过该数量时转换为稠密表示
+
+    def add(self, item: T) -> None:
+        """计入元素
+
+        Args:
+            item (T): 元素
+        """
+        hash_code: int = stable_hash(obj=item)[0]
+        if self._registers is not None:
+            idx: int = hash_code >> (64 - self._precision)
+            rank: int = 65 - self._precision - (hash_code & ((1 << (64 - self._precision)) - 1)).bit_length()
+            if self._registers[idx] < rank:
+                self._registers[idx] = rank
+            return
+        rest: int = 64 - HyperLogLog._SPARSE_PRECISION
+        self._buffer.append(((hash_code >> rest) << HyperLogLog._RANK_BITS) | (rest + 1 - (hash_code & ((1 << rest) - 1)).bit_length()))
+        if len(self._buffer) >= self._sparse_limit:
+            self._flush()
+
+    def add_many(self, items: Iterable[T]) -> None:
+        """逐个计入元素
+
+        Args:
+            items (Iterable[T]): 元素
+        """
+        item: T
+        for item in items:
+            self.add(item=item)
+
+    def _flush(self) -> None:
+        """将缓冲区并入有序数组，条目过多时转换为稠密表示"""
+        if len(self._buffer) == 0:
+            return
+        entries: List[int] = sorted(self._sparse + self._buffer) # 同一索引的条目相邻，且秩大的排在后面
+        self._buffer = array("I")
+        merged: array = array("I")
+        i: int
+        for i in range(len(entries)):
+            if (i + 1 == len(entries)) or ((entries[i] >> HyperLogLog._RANK_BITS) != (entries[i + 1] >> HyperLogLog._RANK_BITS)):
+                merged.append(entries[i])
+        self._sparse = merged
+        if len(self._sparse) > self._sparse_limit:
+            self._densify()
+
+    def _densify(self) -> None:
+        """将稀疏表示转换为稠密寄存器"""
+        self._registers = bytearray(self._m)
+        self._merge_sparse(entries=self._sparse)
+        self._merge_sparse(entries=self._buffer)
+        self._sparse = array("I")
+        self._buffer = array("I")
+
+    def _merge_sparse(self, entries: array) -> None:
+        """将稀疏条目并入稠密寄存器
+
+        Args:
+            entries (array): 稀疏条目
+        """
+        registers: bytearray = self._registers # type: ignore
+        extra: int = HyperLogLog._SPARSE_PRECISION - self._precision # 稀疏索引比稠密索引多出的位数
+        low_mask: int = (1 << extra) - 1
+        rank_mask: int = (1 << HyperLogLog._RANK_BITS) - 1
+        entry: int
+        for entry in entries:
+            sparse_idx: int = entry >> HyperLogLog._RANK_BITS
+            low: int = sparse_idx & low_mask # 多出的位属于稠密表示下秩的计算范围
+            rank: int = (extra - low.bit_length() + 1) if low != 0 else (extra + (entry & rank_mask))
+            idx: int = sparse_idx >> extra
+            if registers[idx] < rank:
+                registers[idx] = rank
+
+    def is_sparse(self) -> bool:
+        """是否处于稀疏模式
+
+        Returns:
+            bool: 是否处于稀疏模式
+        """
+        return self._registers is None
+
+    def estimate(self) -> float:
+        """估计不同元素的个数
+
+        Returns:
+            float: 基数的估计值
+        """
+        if self._registers is None:
+            self._flush()
+        if self._registers is None: # 稀疏模式：以 2 ** 25 个寄存器做线性计数
+            m: int = 1 << HyperLogLog._SPARSE_PRECISION
+            return m * log(m / (m - len(self._sparse)))
+        m = self._m
+        alpha: float = {16: 0.673, 32: 0.697, 64: 0.709}.get(m, 0.7213 / (1 + 1.079 / m))
+        inv_pow: List[float] = HyperLogLog._INV_POW
+        result: float = alpha * m * m / sum(inv_pow[rank] for rank in self._registers)
+        if result <= 2.5 * m: # 小基数时改用线性计数
+            zeros: int = self._registers.count(0)
+            if zeros > 0:
+                result = m * log(m / zeros)
+        return result
+
+    def __len__(self) -> int:
+        """返回不同元素个数的估计值
+
+        Returns:
+            int: 基数的估计值（取整）
+        """
+        return round(self.estimate())
+
+    def merge(self, other: "HyperLogLog[T]") -> None:
+        """将另一个实例合并进来，结果等价于对两者计入的元素之并集做估计
+
+        Args:
+            other (HyperLogLog[T]): 另一个实例
+
+        Raises:
+            ValueError: 两个实例的精度不同
+        """
+        if self._precision != other._precision:
+            raise ValueError("只能合并精度相同的实例")
+        if (self._registers is None) and (other._registers is None):
+            self._buffer.extend(other._sparse)
+            self._buffer.extend(other._buffer)
+            self._flush()
+            return
+        if self._registers is None:
+            self._densify()
+        if other._registers is None:
+            self._merge_sparse(entries=other._sparse)
+            self._merge_sparse(entries=other._buffer)
+        else:
+            self._registers = bytearray(map(max, self._registers, other._registers)) # type: ignore
+
+    def to_bytes(self) -> bytes:
+        """序列化：稀疏模式下存放有序条目（每个 4 字节，小端序），稠密模式下存放每个寄存器（每个 1 字节）
+
+        Returns:
+            bytes: 序列化的结果
+        """
+        if self._registers is not None:
+            return HyperLogLog._HEADER.pack(HyperLogLog._MAGIC, self._precision, False, self._m) + bytes(self._registers)
+        self._flush()
+        if self._registers is not None: # 合并缓冲区后可能已经转换为稠密表示
+            return self.to_bytes()
+        entries: array = array("I", self._sparse)
+        if byteorder != "little":
+            entries.byteswap()
+        return HyperLogLog._HEADER.pack(HyperLogLog._MAGIC, self._precision, True, len(entries)) + entries.tobytes()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "HyperLogLog[T]":
+        """反序列化
+
+        Args:
+            data (bytes): to_bytes 的结果
+
+        Raises:
+            ValueError: 数据格式错误
+
+        Returns:
+            HyperLogLog[T]: 实例
+        """
+        header: Struct = HyperLogLog._HEADER
+        if len(data) < header.size:
+            raise ValueError("数据格式错误")
+        magic, precision, sparse, length = header.unpack_from(data)
+        if (magic != HyperLogLog._MAGIC) or not (4 <= precision <= 18):
+            raise ValueError("数据格式错误")
+        result: HyperLogLog[T] = cls(precision=precision)
+        if sparse:
+            if len(data) != header.size + 4 * length:
+                raise ValueError("数据格式错误")
+            result._sparse.frombytes(data[header.size:])
+            if byteorder != "little":
+                result._sparse.byteswap()
+        else:
+            if (length != result._m) or (len(data) != header.size + length):
+                raise ValueError("数据格式错误")
+            result._registers = bytearray(data[header.size:])
+        return result
+
+
+
+if __name__ == "__main__":
+    s: CountMinSketch[str] = CountMinSketch[str](width=64, depth=4, sample_size=1000)
+    for word in "the quick brown fox jumps over the lazy dog the end".split():
+        s.add(item=word)
+    print(s.estimate(item="the"), s.estimate(item="fox"), s.estimate(item="cat"))
+    for _ in range(1000): # 触发老化，旧的频率减半
+        s.add(item="cat")
+    print(s.estimate(item="the"), s.estimate(item="cat"), s.total())
+
+    from random import random
+    import pickle
+    log_lines: List[str] = [f"user{int(1 / (random() + 1e-6))}" for _ in range(20000)] # 长尾分布的日志
+    workers: List[Tuple[HyperLogLog[str], HeavyHitters[str]]] = [(HyperLogLog[str](precision=12), HeavyHitters[str](k=5, width=512)) for _ in range(4)]
+    i: int
+    for i in range(len(log_lines)): # 模拟 4 个工作进程各处理一部分日志
+        workers[i % 4][0].add(item=log_lines[i])
+        workers[i % 4][1].add(item=log_lines[i])
+    distinct: HyperLogLog[str] = HyperLogLog[str].from_bytes(data=workers[0][0].to_bytes())
+    top: HeavyHitters[str] = pickle.loads(pickle.dumps(workers[0][1]))
+    for hll, hitters in workers[1:]: # 汇总时经过序列化，与跨进程传输相同
+        distinct.merge(other=HyperLogLog[str].from_bytes(data=hll.to_bytes()))
+        top.merge(other=pickle.loads(pickle.dumps(hitters)))
+    print(len(set(log_lines)), len(distinct), distinct.is_sparse())
+    print(top.top(n=3), top.total())
\ No newline at end of file
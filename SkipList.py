@@ -1,8 +1,8 @@
 from random import randint
-from typing import Generic, TypeVar, Optional, List, Tuple, override
+from typing import Generic, Generator, TypeVar, Optional, Tuple, override
 
 from Stack import ArrayStack
-from utils import Iterator, Comparable
+from utils import Iterator, Comparable, KeysView, ValuesView, ItemsView
 
 
 
@@ -40,6 +40,7 @@ class SkipList(Generic[K, V]):
         """构造方法"""
         self._head: HeaderNode = HeaderNode() # 表头
         self._size: int = 0
+        self._modcount: int = 0 # 结构性修改的次数，用于在视图迭代过程中检测修改
     
     def get(self, key: K) -> V:
         """查询键值对
@@ -118,6 +119,7 @@ class SkipList(Generic[K, V]):
                 top = data
         top._height = height
         self._size += 1
+        self._modcount += 1
         
     def remove(self, key: K) -> None:
         """删除键值对
@@ -151,6 +153,7 @@ class SkipList(Generic[K, V]):
                         tmp._next = None
                         tmp._down = None
                     self._size -= 1
+                    self._modcount += 1
                     return
                 elif key < cur._next._key: # 每一层是一个有序链表，此时往右的所有节点只会更大，应该降到下一层
                     cur = cur._down # type: ignore
@@ -209,56 +212,42 @@ class SkipList(Generic[K, V]):
         """
         return self._size
     
-    def keys(self) -> List[K]:
-        """查看所有键
+    def _entries(self) -> Generator[Tuple[K, V], None, None]:
+        """按键从小到大依次遍历所有键值对
 
-        Returns:
-            List[K]: 将跳表中的键以列表的形式返回
+        Yields:
+            Generator[Tuple[K, V], None, None]: (键, 值)
         """
-        result: List[Optional[K]] = [None] * self._size
         cur: HeaderNode | DataNode[K, V] = self._head
-        idx: int = 0
         while cur._down is not None: # 循环结束时定位到第 0 层的头节点
             cur = cur._down
         while cur._next is not None:
-            result[idx] = cur._next._key
+            yield (cur._next._key, cur._next._val)
             cur = cur._next
-            idx += 1
-        return result # type: ignore
-    
-    def values(self) -> List[V]:
+
+    def keys(self) -> KeysView[K]:
+        """查看所有键
+
+        Returns:
+            KeysView[K]: 惰性遍历的键视图
+        """
+        return KeysView[K](mapping=self)
+
+    def values(self) -> ValuesView[V]:
         """查看所有值
 
         Returns:
-            List[K]: 将跳表中的键以列表的形式返回
-        """        
-        result: List[Optional[V]] = [None] * self._size
-        cur: HeaderNode | DataNode[K, V] = self._head
-        idx: int = 0
-        while cur._down is not None: # 循环结束时定位到第 0 层的头节点
-            cur = cur._down
-        while cur._next is not None:
-            result[idx] = cur._next._val
-            cur = cur._next
-            idx += 1
-        return result # type: ignore
-    
-    def items(self) -> List[Tuple[K, V]]:
+            ValuesView[V]: 惰性遍历的值视图
+        """
+        return ValuesView[V](mapping=self)
+
+    def items(self) -> ItemsView[Tuple[K, V]]:
         """查看所有键值对
 
         Returns:
-            List[K]: 将哈希表中的键值对元组以列表的形式返回
+            ItemsView[Tuple[K, V]]: 惰性遍历的键值对视图
         """
-        result: List[Optional[Tuple[K, V]]] = [None] * self._size
-        cur: HeaderNode | DataNode = self._head
-        idx: int = 0
-        while cur._down is not None: # 循环结束时定位到第 0 层的头节点
-            cur = cur._down
-        while cur._next is not None:
-            result[idx] = (cur._next._key, cur._next._val)
-            cur = cur._next
-            idx += 1
-        return result # type: ignore
+        return ItemsView[Tuple[K, V]](mapping=self)
 
     def height(self, key: K) -> int:
         """查看指定键对应塔的塔高
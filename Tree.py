@@ -1,8 +1,8 @@
-from typing import Generic, TypeVar, Optional, List, Tuple, override
+from typing import Generic, Generator, TypeVar, Optional, List, Tuple, override
 
 from Queue import ArrayQueue
 from LinkedList import LinkedList
-from utils import Iterator, Comparable
+from utils import Iterator, Comparable, KeysView, ValuesView, ItemsView
 
 
 
@@ -32,6 +32,7 @@ class BinarySearchTree(Generic[K, V]):
         """构造方法（初始化一棵空的二叉搜索树）"""
         self._root: Optional[TreeNode[K, V]] = None
         self._size: int = 0
+        self._modcount: int = 0 # 结构性修改的次数，用于在视图迭代过程中检测修改
 
     def put(self, key: K, val: V) -> None:
         """新增或更新键值对
@@ -43,6 +44,7 @@ class BinarySearchTree(Generic[K, V]):
         if self._root is None: # 空树，直接在根节点存储新元素
             self._root = TreeNode(key=key, val=val)
             self._size += 1
+            self._modcount += 1
             return
         cur: Optional[TreeNode[K, V]] = self._root
         prev: TreeNode[K, V] # 用以记录前一个 cur
@@ -63,6 +65,7 @@ class BinarySearchTree(Generic[K, V]):
         else: # 不可能出现 key == prev.key 的情况
             prev.right = node # type: ignore
         self._size += 1
+        self._modcount += 1
 
     def remove(self, key: K) -> None:
         """删除键值对
@@ -110,6 +113,7 @@ class BinarySearchTree(Generic[K, V]):
                     else: # 待删除节点是其父节点的左子节点
                         prev.right = tmp
                 self._size -= 1
+                self._modcount += 1
                 cur.left = cur.right = None # 便于内存回收
                 return
         raise KeyError(f"{key}在二叉搜索树中不存在")
@@ -144,68 +148,46 @@ class BinarySearchTree(Generic[K, V]):
         """
         return self._root
     
-    def keys(self) -> List[K]:
-        """层序遍历查看所有键
+    def _entries(self) -> Generator[Tuple[K, V], None, None]:
+        """层序遍历所有键值对
 
-        Returns:
-            List[K]: 将树中的键以列表的形式返回
+        Yields:
+            Generator[Tuple[K, V], None, None]: (键, 值)
         """
         queue: ArrayQueue[TreeNode[K, V]] = ArrayQueue[TreeNode[K, V]]()
-        result: List[Optional[K]] = [None] * self._size
-        idx: int = 0
         if self._root is not None:
             queue.enqueue(item=self._root)
         while not queue.is_empty():
             cur: TreeNode[K, V] = queue.dequeue()
-            result[idx] = cur.key
-            idx += 1
+            yield (cur.key, cur.val)
             if cur.left is not None:
                 queue.enqueue(item=cur.left)
             if cur.right is not None:
                 queue.enqueue(item=cur.right)
-        return result # type: ignore
-        
-    def values(self) -> List[V]:
-        """层序遍历查看所有值
+
+    def keys(self) -> KeysView[K]:
+        """查看所有键
 
         Returns:
-            List[V]: 将树中的值以列表的形式返回
+            KeysView[K]: 惰性遍历的键视图
         """
-        queue: ArrayQueue[TreeNode[K, V]] = ArrayQueue[TreeNode[K, V]]()
-        result: List[Optional[V]] = [None] * self._size
-        idx: int = 0
-        if self._root is not None:
-            queue.enqueue(item=self._root)
-        while not queue.is_empty():
-            cur: TreeNode[K, V] = queue.dequeue()
-            result[idx] = cur.val
-            idx += 1
-            if cur.left is not None:
-                queue.enqueue(item=cur.left)
-            if cur.right is not None:
-                queue.enqueue(item=cur.right)
-        return result # type: ignore
-    
-    def items(self) -> List[Tuple[K, V]]:
-        """层序遍历查看所有键值对
+        return KeysView[K](mapping=self)
+
+    def values(self) -> ValuesView[V]:
+        """查看所有值
 
         Returns:
-            List[Tuple[K, V]]: 将树中的键值对元组以列表的形式返回
+            ValuesView[V]: 惰性遍历的值视图
         """
-        queue: ArrayQueue[TreeNode[K, V]] = ArrayQueue[TreeNode[K, V]]()
-        result: List[Optional[Tuple[K, V]]] = [None] * self._size
-        idx: int = 0
-        if self._root is not None:
-            queue.enqueue(item=self._root)
-        while not queue.is_empty():
-            cur: TreeNode[K, V] = queue.dequeue()
-            result[idx] = (cur.key, cur.val)
-            idx += 1
-            if cur.left is not None:
-                queue.enqueue(item=cur.left)
-            if cur.right is not None:
-                queue.enqueue(item=cur.right)
-        return result # type: ignore
+        return ValuesView[V](mapping=self)
+
+    def items(self) -> ItemsView[Tuple[K, V]]:
+        """查看所有键值对
+
+        Returns:
+            ItemsView[Tuple[K, V]]: 惰性遍历的键值对视图
+        """
+        return ItemsView[Tuple[K, V]](mapping=self)
 
     def __getitem__(self, key: K) -> V:
         """查询键值对
@@ -345,6 +327,7 @@ class AvlTree(Generic[K, V]):
         """构造方法（初始化一棵空的Avl树）"""
         self._root: Optional[AvlTreeNode[K, V]] = None
         self._size: int = 0
+        self._modcount: int = 0 # 结构性修改的次数，用于在视图迭代过程中检测修改
 
     @staticmethod # 静态方法
     def get_height(node: Optional[AvlTreeNode[K, V]]) -> int: # 因为需要计算空节点 None 的高度，所以不方便在 AvlTreeNode 类中定义
@@ -476,6 +459,7 @@ class AvlTree(Generic[K, V]):
         if self._root is None: # 空树，直接在根节点存储新元素
             self._root = AvlTreeNode(key=key, val=val)
             self._size += 1
+            self._modcount += 1
             return
         cur: Optional[AvlTreeNode[K, V]] = self._root
         prev: AvlTreeNode[K, V]
@@ -497,6 +481,7 @@ class AvlTree(Generic[K, V]):
             prev.right = node # type: ignore
         node.parent = prev # type: ignore
         self._size += 1
+        self._modcount += 1
         # 检查新插入节点的各个祖先节点是否失衡
         grand: Optional[AvlTreeNode[K, V]] = prev # type: ignore
         while grand is not None: # 叶子节点的高度和平衡因子无需更新
@@ -546,19 +531,22 @@ class AvlTree(Generic[K, V]):
                     grand = cur.parent # 实际被删除节点的父节点
                 else: # 待删除节点同时存在左右子节点，用待删除节点的后继节点（比当前节点大的最小的节点）来替换待删除节点
                     tmp = self.successor(node=cur) # 后继节点
-                    grand = tmp.parent # 实际被删除节点的父节点
-                    # 删除后继节点
-                    if tmp.is_left_child(): # 后继节点是其父节点的左子节点
-                        tmp.parent.left = tmp.right # type: ignore
-                    else: # 后继节点是其父节点的右子节点
-                        tmp.parent.right = tmp.right # type: ignore
-                    if tmp.right is not None: # 后继节点只可能有右子节点
-                        tmp.right.parent = tmp.parent
+                    if tmp.parent is cur: # 后继节点就是待删除节点的右子节点，保留其右子树即可
+                        grand = tmp # 高度可能变化的最低节点
+                    else:
+                        grand = tmp.parent # 实际被删除节点的父节点
+                        # 删除后继节点
+                        if tmp.is_left_child(): # 后继节点是其父节点的左子节点
+                            tmp.parent.left = tmp.right # type: ignore
+                        else: # 后继节点是其父节点的右子节点
+                            tmp.parent.right = tmp.right # type: ignore
+                        if tmp.right is not None: # 后继节点只可能有右子节点
+                            tmp.right.parent = tmp.parent
+                        tmp.right = cur.right
+                        cur.right.parent = tmp
                     # 用后继节点替换待删除节点（接替子节点关系）
                     tmp.left = cur.left
                     cur.left.parent = tmp
-                    tmp.right = cur.right
-                    cur.right.parent = tmp
                 # 用后继节点替换待删除节点（接替父节点关系）
                 if cur.parent is None: # 待删除的是根节点
                     self._root = tmp
@@ -567,9 +555,10 @@ class AvlTree(Generic[K, V]):
                         cur.parent.left = tmp
                     else: # 待删除节点是其父节点的左子节点
                         cur.parent.right = tmp
-                    if tmp is not None: # 待删除节点是叶子结点时 tmp 为 None
-                        tmp.parent = cur.parent
+                if tmp is not None: # 待删除节点是叶子结点时 tmp 为 None（删除根节点时同样需要更新，否则新的根节点仍指向被删除的节点）
+                    tmp.parent = cur.parent
                 self._size -= 1
+                self._modcount += 1
                 cur.parent = cur.left = cur.right = None # 便于内存回收
                 # 检查实际被删除节点的各个祖先节点是否失衡
                 while grand is not None:
@@ -613,68 +602,46 @@ class AvlTree(Generic[K, V]):
         """
         return self._root
     
-    def keys(self) -> List[K]:
-        """层序遍历查看所有键
+    def _entries(self) -> Generator[Tuple[K, V], None, None]:
+        """层序遍历所有键值对
 
-        Returns:
-            List[K]: 将树中的键以列表的形式返回
+        Yields:
+            Generator[Tuple[K, V], None, None]: (键, 值)
         """
         queue: ArrayQueue[AvlTreeNode[K, V]] = ArrayQueue[AvlTreeNode[K, V]]()
-        result: List[Optional[K]] = [None] * self._size
-        idx: int = 0
         if self._root is not None:
             queue.enqueue(item=self._root)
         while not queue.is_empty():
             cur: AvlTreeNode[K, V] = queue.dequeue()
-            result[idx] = cur.key
-            idx += 1
+            yield (cur.key, cur.val)
             if cur.left is not None:
                 queue.enqueue(item=cur.left)
             if cur.right is not None:
                 queue.enqueue(item=cur.right)
-        return result # type: ignore
-        
-    def values(self) -> List[V]:
-        """层序遍历查看所有值
+
+    def keys(self) -> KeysView[K]:
+        """查看所有键
 
         Returns:
-            List[V]: 将树中的值以列表的形式返回
+            KeysView[K]: 惰性遍历的键视图
         """
-        queue: ArrayQueue[AvlTreeNode[K, V]] = ArrayQueue[AvlTreeNode[K, V]]()
-        result: List[Optional[V]] = [None] * self._size
-        idx: int = 0
-        if self._root is not None:
-            queue.enqueue(item=self._root)
-        while not queue.is_empty():
-            cur: AvlTreeNode[K, V] = queue.dequeue()
-            result[idx] = cur.val
-            idx += 1
-            if cur.left is not None:
-                queue.enqueue(item=cur.left)
-            if cur.right is not None:
-                queue.enqueue(item=cur.right)
-        return result # type: ignore
-    
-    def items(self) -> List[Tuple[K, V]]:
-        """层序遍历查看所有键值对
+        return KeysView[K](mapping=self)
+
+    def values(self) -> ValuesView[V]:
+        """查看所有值
 
         Returns:
-            List[Tuple[K, V]]: 将树中的键值对元组以列表的形式返回
+            ValuesView[V]: 惰性遍历的值视图
         """
-        queue: ArrayQueue[AvlTreeNode[K, V]] = ArrayQueue[AvlTreeNode[K, V]]()
-        result: List[Optional[Tuple[K, V]]] = [None] * self._size
-        idx: int = 0
-        if self._root is not None:
-            queue.enqueue(item=self._root)
-        while not queue.is_empty():
-            cur: AvlTreeNode[K, V] = queue.dequeue()
-            result[idx] = (cur.key, cur.val)
-            idx += 1
-            if cur.left is not None:
-                queue.enqueue(item=cur.left)
-            if cur.right is not None:
-                queue.enqueue(item=cur.right)
-        return result # type: ignore
+        return ValuesView[V](mapping=self)
+
+    def items(self) -> ItemsView[Tuple[K, V]]:
+        """查看所有键值对
+
+        Returns:
+            ItemsView[Tuple[K, V]]: 惰性遍历的键值对视图
+        """
+        return ItemsView[Tuple[K, V]](mapping=self)
 
     def __getitem__(self, key: K) -> V:
         """查询键值对
@@ -1,5 +1,8 @@
-from typing import Generic, TypeVar, Sequence
+from typing import Generic, TypeVar, Sequence, Iterable, Tuple, List, Optional
+from array import array
+
 from HashMap import HashMapOpenAddressing as HashMap
+from Stack import ArrayStack
 
 
 
@@ -16,11 +19,8 @@ class UnionFindSet(Generic[T]):
         Args:
             arr (Sequence[T]): 节点序列
         """
-        self.ancestors: HashMap[T, T] = HashMap[T, T]() # 记录每个节点的祖先节点
-        self.offspring: HashMap[T, int] = HashMap[T, int]() # 记录每个节点其后代节点的个数，只有祖先节点为自身的节点的后代节点个数才是准确的
-        for i in arr:
-            self.ancestors[i] = i
-            self.offspring[i] = 0
+        self.ancestors: HashMap[T, T] = HashMap[T, T].from_items(items=((i, i) for i in arr), size_hint=len(arr)) # 记录每个节点的祖先节点
+        self.offspring: HashMap[T, int] = HashMap[T, int].from_items(items=((i, 0) for i in arr), size_hint=len(arr)) # 记录每个节点其后代节点的个数，只有祖先节点为自身的节点的后代节点个数才是准确的
     
     def find(self, node: T) -> T:
         """递归查找祖先节点，并进行路径压缩
@@ -71,6 +71,331 @@ class UnionFindSet(Generic[T]):
                 self.offspring[ancestor2] += self.offspring[ancestor1]
 
 
+class IntUnionFind:
+    """
+    基于数组实现的并查集，节点为 0 ~ n-1 的连续整数；
+    查找时进行路径减半（迭代实现，不受递归深度的限制），合并时按大小合并
+    """
+    def __init__(self, n: int = 0) -> None:
+        """每个节点的父节点设为自身
+
+        Args:
+            n (int, optional): 节点个数. Defaults to 0.
+        """
+        self._parents: array = array("l", range(n)) # 每个节点的父节点
+        self._sizes: array = array("l", [1]) * n # 每个节点所在集合的大小，只有祖先节点为自身的节点的记录才是准确的
+        self._count: int = n # 集合的个数
+
+    def add(self) -> int:
+        """新增一个节点，自成一个集合
+
+        Returns:
+            int: 新节点
+        """
+        node: int = len(self._parents)
+        self._parents.append(node)
+        self._sizes.append(1)
+        self._count += 1
+        return node
+
+    def find(self, node: int) -> int:
+        """查找祖先节点，并进行路径减半
+
+        Args:
+            node (int): 待查询节点
+
+        Raises:
+            IndexError: 节点不存在
+
+        Returns:
+            int: 祖先节点
+        """
+        parents: array = self._parents
+        while parents[node] != node:
+            parents[node] = parents[parents[node]] # 指向祖父节点，路径长度减半
+            node = parents[node]
+        return node
+
+    def is_relative(self, node1: int, node2: int) -> bool:
+        """是否有相同的祖先
+
+        Args:
+            node1 (int): 待查询节点1
+            node2 (int): 待查询节点2
+
+        Returns:
+            bool: 是否有相同的祖先
+        """
+        return self.find(node=node1) == self.find(node=node2)
+
+    def union(self, node1: int, node2: int) -> bool:
+        """合并，将较小集合的祖先节点作为较大集合的祖先节点的后代
+
+        Args:
+            node1 (int): 待合并的节点1
+            node2 (int): 待合并的节点2
+
+        Returns:
+            bool: 两个节点原本是否属于不同的集合
+        """
+        ancestor1: int = self.find(node=node1)
+        ancestor2: int = self.find(node=node2)
+        if ancestor1 == ancestor2:
+            return False
+        if self._sizes[ancestor1] < self._sizes[ancestor2]:
+            ancestor1, ancestor2 = ancestor2, ancestor1
+        self._parents[ancestor2] = ancestor1
+        self._sizes[ancestor1] += self._sizes[ancestor2]
+        self._count -= 1
+        return True
+
+    def union_many(self, pairs: Iterable[Tuple[int, int]]) -> int:
+        """批量合并
+
+        Args:
+            pairs (Iterable[Tuple[int, int]]): 待合并的节点对
+
+        Returns:
+            int: 实际发生合并的次数
+        """
+        parents: array = self._parents # 避免在循环中反复查找属性
+        sizes: array = self._sizes
+        merged: int = 0
+        node1: int
+        node2: int
+        for node1, node2 in pairs:
+            while parents[node1] != node1:
+                parents[node1] = parents[parents[node1]]
+                node1 = parents[node1]
+            while parents[node2] != node2:
+                parents[node2] = parents[parents[node2]]
+                node2 = parents[node2]
+            if node1 == node2:
+                continue
+            if sizes[node1] < sizes[node2]:
+                node1, node2 = node2, node1
+            parents[node2] = node1
+            sizes[node1] += sizes[node2]
+            merged += 1
+        self._count -= merged
+        return merged
+
+    def component_size(self, node: int) -> int:
+        """查看节点所在集合的大小
+
+        Args:
+            node (int): 待查询节点
+
+        Returns:
+            int: 节点所在集合的节点个数
+        """
+        return self._sizes[self.find(node=node)]
+
+    def count_components(self) -> int:
+        """查看集合的个数
+
+        Returns:
+            int: 集合的个数
+        """
+        return self._count
+
+    def __len__(self) -> int:
+        """查看节点的个数
+
+        Returns:
+            int: 节点的个数
+        """
+        return len(self._parents)
+
+
+
+class RollbackUnionFind:
+    """
+    可回滚的并查集，节点为 0 ~ n-1 的连续整数；
+    不进行路径压缩（否则一次查找会修改很多节点，无法廉价地撤销），按秩合并保证树高为 O(log n)；
+    每次合并都会记录在栈中，可以撤销到任意一个快照
+    """
+    def __init__(self, n: int) -> None:
+        """每个节点的父节点设为自身
+
+        Args:
+            n (int): 节点个数
+        """
+        self._parents: array = array("l", range(n)) # 每个节点的父节点
+        self._ranks: array = array("b", bytes(n)) # 每个节点的秩（树高的上界），只有祖先节点为自身的节点的记录才是准确的
+        self._history: ArrayStack[Tuple[int, bool]] = ArrayStack[Tuple[int, bool]]() # (被合并的祖先节点, 合并后的祖先节点的秩是否加 1)
+        self._count: int = n # 集合的个数
+
+    def find(self, node: int) -> int:
+        """查找祖先节点（不进行路径压缩）
+
+        Args:
+            node (int): 待查询节点
+
+        Returns:
+            int: 祖先节点
+        """
+        while self._parents[node] != node:
+            node = self._parents[node]
+        return node
+
+    def is_relative(self, node1: int, node2: int) -> bool:
+        """是否有相同的祖先
+
+        Args:
+            node1 (int): 待查询节点1
+            node2 (int): 待查询节点2
+
+        Returns:
+            bool: 是否有相同的祖先
+        """
+        return self.find(node=node1) == self.find(node=node2)
+
+    def union(self, node1: int, node2: int) -> bool:
+        """合并，将秩较小的祖先节点作为秩较大的祖先节点的后代
+
+        Args:
+            node1 (int): 待合并的节点1
+            node2 (int): 待合并的节点2
+
+        Returns:
+            bool: 两个节点原本是否属于不同的集合
+        """
+        ancestor1: int = self.find(node=node1)
+        ancestor2: int = self.find(node=node2)
+        if ancestor1 == ancestor2:
+            return False
+        if self._ranks[ancestor1] < self._ranks[ancestor2]:
+            ancestor1, ancestor2 = ancestor2, ancestor1
+        self._parents[ancestor2] = ancestor1
+        increased: bool = self._ranks[ancestor1] == self._ranks[ancestor2] # 秩相同时合并后的树高加 1
+        if increased:
+            self._ranks[ancestor1] += 1
+        self._history.push(item=(ancestor2, increased))
+        self._count -= 1
+        return True
+
+    def snapshot(self) -> int:
+        """创建快照
+
+        Returns:
+            int: 快照，即当前已经发生的合并次数
+        """
+        return len(self._history)
+
+    def rollback(self, to: int) -> None:
+        """按照与合并相反的顺序逐个撤销合并，直到回到指定的快照
+
+        Args:
+            to (int): snapshot 返回的快照
+
+        Raises:
+            ValueError: 快照之后的合并已被撤销
+        """
+        if to > len(self._history):
+            raise ValueError(f"快照{to}之后的合并已被撤销")
+        while len(self._history) > to:
+            child: int
+            increased: bool
+            child, increased = self._history.pop()
+            parent: int = self._parents[child]
+            self._parents[child] = child
+            if increased:
+                self._ranks[parent] -= 1
+            self._count += 1
+
+    def count_components(self) -> int:
+        """查看集合的个数
+
+        Returns:
+            int: 集合的个数
+        """
+        return self._count
+
+    def __len__(self) -> int:
+        """查看节点的个数
+
+        Returns:
+            int: 节点的个数
+        """
+        return len(self._parents)
+
+
+
+def offline_dynamic_connectivity(n: int, operations: Sequence[Tuple[str, int, int]]) -> List[bool]:
+    """离线动态连通性（线段树分治）：
+    1. 每条边在时间轴上存在的区间为 [加边的时刻, 删边的时刻)，将其挂到线段树上覆盖该区间的 O(log T) 个节点；
+    2. 深度优先遍历线段树，进入节点时合并挂在该节点上的边，离开节点时回滚这些合并；
+    3. 到达叶子节点（即某一时刻）时，并查集恰好包含此刻存在的所有边，可直接回答该时刻的查询。
+
+    Args:
+        n (int): 顶点个数，顶点为 0 ~ n-1 的连续整数
+        operations (Sequence[Tuple[str, int, int]]): 按时间顺序排列的操作，
+            ("add", u, v) 加边，("remove", u, v) 删边，("query", u, v) 查询 u 和 v 是否连通
+
+    Raises:
+        ValueError: 重复加边、删除不存在的边或无法识别的操作
+
+    Returns:
+        List[bool]: 按顺序返回每个查询的结果
+    """
+    t: int = len(operations)
+    if t == 0:
+        return []
+    segments: List[Optional[List[Tuple[int, int]]]] = [None] * (4 * t) # 线段树每个节点上挂的边
+    def insert(node: int, left: int, right: int, lo: int, hi: int, edge: Tuple[int, int]) -> None:
+        """将边挂到线段树上覆盖 [lo, hi) 的节点"""
+        if (hi <= left) or (right <= lo):
+            return
+        if (lo <= left) and (right <= hi):
+            if segments[node] is None:
+                segments[node] = []
+            segments[node].append(edge) # type: ignore
+            return
+        mid: int = (left + right) // 2
+        insert(node=2 * node + 1, left=left, right=mid, lo=lo, hi=hi, edge=edge)
+        insert(node=2 * node + 2, left=mid, right=right, lo=lo, hi=hi, edge=edge)
+    alive: HashMap[Tuple[int, int], int] = HashMap[Tuple[int, int], int]() # {边：加边的时刻}
+    i: int
+    for i in range(t):
+        op: str
+        u: int
+        v: int
+        op, u, v = operations[i]
+        edge: Tuple[int, int] = (u, v) if u <= v else (v, u) # 无向边
+        if op == "add":
+            if edge in alive:
+                raise ValueError(f"边{u} -- {v}已存在")
+            alive[edge] = i
+        elif op == "remove":
+            if edge not in alive:
+                raise ValueError(f"边{u} -- {v}不存在")
+            insert(node=0, left=0, right=t, lo=alive[edge], hi=i, edge=edge)
+            del alive[edge]
+        elif op != "query":
+            raise ValueError(f"无法识别的操作{op}")
+    for edge, start in alive.items(): # 直到最后都没有被删除的边
+        insert(node=0, left=0, right=t, lo=start, hi=t, edge=edge)
+    ufs: RollbackUnionFind = RollbackUnionFind(n=n)
+    answers: List[bool] = []
+    def dfs(node: int, left: int, right: int) -> None:
+        """遍历线段树，回答 [left, right) 内的查询"""
+        snapshot: int = ufs.snapshot()
+        if segments[node] is not None:
+            for u, v in segments[node]: # type: ignore
+                ufs.union(node1=u, node2=v)
+        if right - left == 1:
+            if operations[left][0] == "query":
+                answers.append(ufs.is_relative(node1=operations[left][1], node2=operations[left][2]))
+        else:
+            mid: int = (left + right) // 2
+            dfs(node=2 * node + 1, left=left, right=mid)
+            dfs(node=2 * node + 2, left=mid, right=right)
+        ufs.rollback(to=snapshot)
+    dfs(node=0, left=0, right=t)
+    return answers
+
+
 
 if __name__ == "__main__":
     ufs: UnionFindSet[int] = UnionFindSet[int](arr=range(1, 5))
@@ -81,4 +406,11 @@ if __name__ == "__main__":
     for i in range(1, 5):
         print("-------")
         print(f"节点：{i}，后代节点个数：{ufs.offspring[i]}")
-        print(f"节点：{i}，祖先节点：{ufs.ancestors[i]}")
\ No newline at end of file
+        print(f"节点：{i}，祖先节点：{ufs.ancestors[i]}")
+    print("-------")
+    iufs: IntUnionFind = IntUnionFind(n=5)
+    print(iufs.union_many(pairs=[(0, 1), (1, 2), (2, 0), (3, 4)]), iufs.add())
+    print(iufs.count_components(), iufs.component_size(node=2), iufs.is_relative(node1=0, node2=2), iufs.is_relative(node1=2, node2=3))
+    print("-------")
+    ops: List[Tuple[str, int, int]] = [("add", 0, 1), ("add", 1, 2), ("query", 0, 2), ("remove", 0, 1), ("query", 0, 2), ("add", 0, 2), ("query", 0, 1)]
+    print(offline_dynamic_connectivity(n=3, operations=ops))
\ No newline at end of file
@@ -34,15 +34,14 @@ class HuffmanTree:
     '''哈夫曼树'''
     def __init__(self, text: str) -> None:
         '''构造哈夫曼树'''
-        self.map: HashMapChaining = HashMapChaining() # Unicode 编码到字符之间的映射
-        self.counter : HashMapChaining = HashMapChaining() # 统计每个字符出现的次数
+        self.counter : HashMapChaining = HashMapChaining() # 统计每个字符出现的次数（字符的种类数通常远小于文本长度，不按文本长度预留容量）
         for s in text:
             code: int = ord(s)
-            self.map[code] = s
             try:
                 self.counter[code] += 1
             except KeyError:
                 self.counter[code] = 1
+        self.map: HashMapChaining = HashMapChaining.from_items(items=((code, chr(code)) for code in self.counter), size_hint=len(self.counter)) # Unicode 编码到字符之间的映射
         self.leaves: DynamicArray[HuffmanTreeNode | None] = DynamicArray(capacity=len(self.counter))
         for i in self.counter:
             self.leaves.append(item=HuffmanTreeNode(name=self.map[i], weight=self.counter[i]))
@@ -3,12 +3,16 @@ from pathlib import Path
 
 sys.path.append(str(object=Path(__file__).parent.parent)) # Path(__file__) 获取的当前 py 文件的路径
 from Stack import ArrayStack
-from HashMap import HashMapOpenAddressing as HashMap
+from HashMap import StaticHashMap
 
 
 
 # 只讨论正整数的进制转换
 
+DIGITS: StaticHashMap = StaticHashMap.build(keys=[ord(i) for i in '0123456789ABCDEF'], values=list(range(16))) # {字符编码：数值}，只读，模块加载时构造一次
+
+
+
 def From10BaseConverter(num: int, to_base: int) -> str:
     '''十进制转其他进制'''
     digits: str = '0123456789ABCDEF'
@@ -25,11 +29,7 @@ def From10BaseConverter(num: int, to_base: int) -> str:
 
 def To10BaseConverter(num: str, from_base: int) -> int:
     '''其他进制转十进制'''
-    digits: HashMap = HashMap()
-    for i in '0123456789':
-        digits[ord(i)] = ord(i) - 48 # ord('0') == 48
-    for i in 'ABCDEF':
-        digits[ord(i)] = ord(i) - 55 # ord('A') == 65
+    digits: StaticHashMap = DIGITS
     result: int = 0
     exp: int = len(num) - 1
     for i in num:
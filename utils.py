@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Protocol, Self, TypeVar, runtime_checkable
+from typing import Callable, Generator, Generic, List, Protocol, Self, Tuple, TypeVar, override, runtime_checkable
+from hashlib import blake2b
 
 
 
@@ -48,4 +49,250 @@ class Comparable(Protocol):
 
     @abstractmethod
     def __gt__(self: T, value: T, /) -> bool:
-        pass
\ No newline at end of file
+        pass
+
+
+
+class Viewable(Protocol):
+    """定义一个可以提供视图的映射的协议"""
+    _modcount: int # 结构性修改（新增、删除键值对或重新排布）的次数
+
+    def __len__(self) -> int:
+        pass
+
+    def __contains__(self, key: object, /) -> bool:
+        pass
+
+    def get(self, key: object) -> object:
+        pass
+
+    def _entries(self) -> Generator[Tuple[object, object], None, None]:
+        """惰性地遍历所有键值对"""
+        pass
+
+class MapView(ABC, Generic[T]):
+    """
+    映射视图的基类（类似 dict_keys 等）；
+    不复制映射中的数据，只在迭代时惰性地遍历，因此总能反映映射的最新状态；
+    迭代过程中映射被结构性修改时抛出 RuntimeError
+    """
+    def __init__(self, mapping: Viewable) -> None:
+        """构造方法
+
+        Args:
+            mapping (Viewable): 映射
+        """
+        self._mapping: Viewable = mapping
+
+    @abstractmethod
+    def _pick(self, entry: Tuple[object, object]) -> T:
+        """从键值对中取出视图的元素
+
+        Args:
+            entry (Tuple[object, object]): 键值对
+
+        Returns:
+            T: 视图的元素
+        """
+        pass
+
+    def __len__(self) -> int:
+        """查看视图中的元素数量
+
+        Returns:
+            int: 元素数量
+        """
+        return len(self._mapping)
+
+    def __repr__(self) -> str:
+        """以列表的形式展示视图中的元素
+
+        Returns:
+            str: 视图的字符串表示
+        """
+        return f"{type(self).__name__}({list(self)})"
+
+    class Itr(Iterator):
+        """该类配套的迭代器"""
+        def __init__(self, outer: "MapView[T]") -> None:
+            """构造方法
+
+            Args:
+                outer (MapView[T]): 指向外部类的引用
+            """
+            self.outer: MapView[T] = outer # type: ignore
+            self.modcount: int = outer._mapping._modcount # 创建迭代器时映射的修改次数
+            self.entries: Generator[Tuple[object, object], None, None] = outer._mapping._entries()
+
+        @override
+        def __next__(self) -> T: # type: ignore
+            """实现 Iterator 接口声明的 __next__ 方法
+
+            Raises:
+                RuntimeError: 迭代过程中映射被修改
+                StopIteration: 停止迭代
+
+            Returns:
+                T: 
+            """
+            if self.outer._mapping._modcount != self.modcount: # 必须在推进遍历之前检查，否则可能读到重新排布到一半的数据
+                raise RuntimeError("映射在迭代过程中被修改")
+            return self.outer._pick(entry=next(self.entries))
+
+    def __iter__(self) -> Itr:
+        """使自身可迭代
+
+        Returns:
+            Itr: 类内部实现的迭代器
+        """
+        return self.Itr(outer=self)
+
+class KeysView(MapView[T]):
+    """键视图"""
+    @override
+    def _pick(self, entry: Tuple[object, object]) -> T:
+        """取出键
+
+        Args:
+            entry (Tuple[object, object]): 键值对
+
+        Returns:
+            T: 键
+        """
+        return entry[0] # type: ignore
+
+    def __contains__(self, key: object) -> bool:
+        """视图中是否存在指定键（直接查询映射，无需遍历）
+
+        Args:
+            key (object): 键
+
+        Returns:
+            bool: 键是否存在
+        """
+        return key in self._mapping
+
+class ValuesView(MapView[T]):
+    """值视图"""
+    @override
+    def _pick(self, entry: Tuple[object, object]) -> T:
+        """取出值
+
+        Args:
+            entry (Tuple[object, object]): 键值对
+
+        Returns:
+            T: 值
+        """
+        return entry[1] # type: ignore
+
+    def __contains__(self, val: object) -> bool:
+        """视图中是否存在指定值（需要遍历）
+
+        Args:
+            val (object): 值
+
+        Returns:
+            bool: 值是否存在
+        """
+        item: T
+        for item in self:
+            if item == val:
+                return True
+        return False
+
+class ItemsView(MapView[T]):
+    """键值对视图"""
+    @override
+    def _pick(self, entry: Tuple[object, object]) -> T:
+        """取出键值对
+
+        Args:
+            entry (Tuple[object, object]): 键值对
+
+        Returns:
+            T: 键值对
+        """
+        return entry # type: ignore
+
+    def __contains__(self, item: object) -> bool:
+        """视图中是否存在指定键值对（按键查询映射后比较值，无需遍历）；
+        映射提供 peek 时改用 peek，避免缓存等映射的 get 改变使用顺序、命中统计或回收过期的键
+
+        Args:
+            item (object): (键, 值)
+
+        Returns:
+            bool: 键值对是否存在
+        """
+        if (not isinstance(item, tuple)) or (len(item) != 2):
+            return False
+        lookup: Callable[..., object] = getattr(self._mapping, "peek", self._mapping.get) # 成员判断不能修改映射
+        try:
+            return lookup(key=item[0]) == item[1]
+        except KeyError:
+            return False
+
+
+
+def _stable_bytes(obj: object) -> bytes:
+    """将对象编码为与进程无关的字节串，相等的对象编码相同（例如 1、1.0 和 True）
+
+    Args:
+        obj (object): 对象，支持 bytes、str、整数、浮点数、None 以及由它们组成的元组
+
+    Raises:
+        TypeError: 不支持的类型
+
+    Returns:
+        bytes: 编码后的字节串，首字节标记类型
+    """
+    if isinstance(obj, (bytes, bytearray, memoryview)):
+        return b"b" + bytes(obj)
+    if isinstance(obj, str):
+        return b"s" + obj.encode(encoding="utf-8", errors="surrogatepass")
+    if isinstance(obj, float) and obj.is_integer(): # 与相等的整数保持一致
+        obj = int(obj)
+    if isinstance(obj, int):
+        return b"i" + str(object=int(obj)).encode() # bool 同样按整数编码
+    if isinstance(obj, float):
+        return b"f" + repr(obj).encode()
+    if obj is None:
+        return b"n"
+    if isinstance(obj, tuple):
+        parts: bytes = b"".join(len(part).to_bytes(length=4, byteorder="big") + part for part in map(_stable_bytes, obj)) # 带上长度前缀，避免拼接产生歧义
+        return b"t" + parts
+    raise TypeError(f"无法稳定地哈希{type(obj).__name__}类型的对象")
+
+def stable_hash(obj: object) -> Tuple[int, int]:
+    """与进程无关的 128 位哈希（内置的 hash 对字符串加了随机盐，不同进程中结果不同，不能用于需要序列化或跨进程合并的结构）
+
+    Args:
+        obj (object): 对象，支持的类型见 _stable_bytes
+
+    Returns:
+        Tuple[int, int]: 两个相互独立的 64 位无符号哈希值
+    """
+    digest: bytes = blake2b(_stable_bytes(obj=obj), digest_size=16).digest()
+    return int.from_bytes(digest[:8], byteorder="little"), int.from_bytes(digest[8:], byteorder="little")
+
+
+
+def local_hash(obj: object) -> Tuple[int, int]:
+    """进程内的 128 位哈希，由内置的 hash 混合得到，支持任意可哈希对象，但字符串等对象的结果在不同进程中不同，不能用于序列化或跨进程合并
+
+    Args:
+        obj (object): 可哈希对象
+
+    Returns:
+        Tuple[int, int]: 两个 64 位无符号哈希值
+    """
+    mask: int = (1 << 64) - 1
+    hash_code: int = hash(obj) & mask
+    result: List[int] = []
+    x: int
+    for x in (hash_code, hash_code ^ 0x9E3779B97F4A7C15): # splitmix64 的混合函数，两个不同的输入得到两个相互独立的哈希值
+        x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & mask
+        x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & mask
+        result.append(x ^ (x >> 31))
+    return result[0], result[1]
\ No newline at end of file